@@ -0,0 +1,92 @@
+"""Compares the size and the write and read times of bytecode against the generic textual
+form, for the same module as ``parser_throughput.py``, and times a lazy read of the
+bytecode that only decodes one function.
+
+Run from the repository root with ``python benchmarks/bytecode_throughput.py``.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from parser_throughput import build_module  # noqa: E402
+
+from mlir.context import MLIRContext  # noqa: E402
+from mlir.ir.bytecode import read_bytecode_file, write_bytecode_file  # noqa: E402
+from mlir.ir.parser import parse_source_file  # noqa: E402
+from mlir.ir.printer import print_operation  # noqa: E402
+
+
+def best_time(function, repeat: int) -> float:
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--functions", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    module = build_module(args.functions, args.operations)
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "module.mlir")
+        bytecode_path = os.path.join(directory, "module.mlirbc")
+
+        def write_text():
+            with open(text_path, "w") as file:
+                print_operation(module, file)
+
+        rows = [
+            (
+                "text",
+                best_time(write_text, args.repeat),
+                best_time(
+                    lambda: parse_source_file(text_path, MLIRContext(), False),
+                    args.repeat,
+                ),
+                os.path.getsize(text_path),
+            ),
+            (
+                "bytecode",
+                best_time(
+                    lambda: write_bytecode_file(module, bytecode_path), args.repeat
+                ),
+                best_time(
+                    lambda: read_bytecode_file(bytecode_path, MLIRContext(), False),
+                    args.repeat,
+                ),
+                os.path.getsize(bytecode_path),
+            ),
+        ]
+
+        def read_lazily():
+            # Read the module, but only decode the body of its first function.
+            module = read_bytecode_file(
+                bytecode_path, MLIRContext(), False, lazy_loading=True
+            )
+            module.regions[0].front.front.body.load_body()
+
+        lazy_seconds = best_time(read_lazily, args.repeat)
+
+    operations = args.functions * (args.operations + 4)
+    print(f"{operations} operations, best of {args.repeat}")
+    print(f"{'format':<10}{'size (MB)':>12}{'write (s)':>12}{'read (s)':>12}")
+    for name, write_seconds, read_seconds, size in rows:
+        print(
+            f"{name:<10}{size / 1e6:>12.2f}{write_seconds:>12.3f}{read_seconds:>12.3f}"
+        )
+    print(f"lazy read touching one function: {lazy_seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
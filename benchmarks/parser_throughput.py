@@ -0,0 +1,84 @@
+"""Measures the throughput of the textual IR parser, in MB/s of generic-form input.
+
+Run from the repository root with ``python benchmarks/parser_throughput.py``.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mlir.context import MLIRContext  # noqa: E402
+from mlir.dialects.arith import AddIOp, ConstantOp, MulIOp  # noqa: E402
+from mlir.dialects.cf import BranchOp, CondBranchOp  # noqa: E402
+from mlir.dialects.func import FuncOp, ReturnOp  # noqa: E402
+from mlir.ir.attributes import IntegerAttribute  # noqa: E402
+from mlir.ir.blocks import Block  # noqa: E402
+from mlir.ir.module import ModuleOperation  # noqa: E402
+from mlir.ir.parser import parse_source_file  # noqa: E402
+from mlir.ir.printer import print_operation  # noqa: E402
+from mlir.ir.types import IntegerType  # noqa: E402
+from mlir.utils.validator import deferred_validation  # noqa: E402
+
+
+def build_module(functions: int, operations: int) -> ModuleOperation:
+    """A module of functions, each a loop around a chain of arithmetic."""
+    i32, i1 = IntegerType(32), IntegerType(1)
+    module = ModuleOperation.build()
+    body = Block()
+    module.regions[0].push_end(body)
+    with deferred_validation():
+        for _ in range(functions):
+            function = FuncOp.build([i32, i1])
+            x, c = function.arguments
+            loop, exit_ = Block([i32]), Block()
+            one = ConstantOp.build(IntegerAttribute(type=i32, value=1))
+            function.entry_block.push_end(one)
+            function.entry_block.push_end(BranchOp.build(loop, [x]))
+            value = loop.get_argument(0)
+            for index in range(operations):
+                op_class = AddIOp if index % 2 else MulIOp
+                op = op_class.build(value, one.results[0])
+                loop.push_end(op)
+                value = op.results[0]
+            loop.push_end(CondBranchOp.build(c, loop, [value], exit_, []))
+            exit_.push_end(ReturnOp.build([]))
+            function.body.push_end(loop)
+            function.body.push_end(exit_)
+            body.push_end(function)
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--functions", type=int, default=200)
+    parser.add_argument("--operations", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    module = build_module(args.functions, args.operations)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "module.mlir")
+        start = time.perf_counter()
+        with open(path, "w") as file:
+            print_operation(module, file)
+        print_seconds = time.perf_counter() - start
+        megabytes = os.path.getsize(path) / 1e6
+
+        parse_seconds = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parse_source_file(path, MLIRContext(), verify_after_parse=False)
+            parse_seconds.append(time.perf_counter() - start)
+
+    operations = args.functions * (args.operations + 4)
+    print(f"input: {megabytes:.2f} MB, {operations} operations")
+    print(f"print: {megabytes / print_seconds:.2f} MB/s")
+    print(f"parse: {megabytes / min(parse_seconds):.2f} MB/s (best of {args.repeat})")
+
+
+if __name__ == "__main__":
+    main()
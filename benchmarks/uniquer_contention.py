@@ -0,0 +1,114 @@
+"""Measures the throughput of ``TypeBase.get`` and ``AttributeBase.get`` when several
+threads unique types and attributes in the same context at once.
+
+Most calls look up a type or attribute that already exists, and the rest create new ones.
+Each configuration is run with the storages split into one shard and into the default
+number of shards, and for comparison with the former unsynchronized check-then-add,
+which counts how often a benign race made it raise.
+
+Run from the repository root with ``python benchmarks/uniquer_contention.py``.
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mlir.context import MLIRContext  # noqa: E402
+from mlir.ir.attributes import AttributeStorage, IntegerAttribute  # noqa: E402
+from mlir.ir.types import IntegerType, TypeStorage  # noqa: E402
+
+
+class UnsynchronizedContext(MLIRContext):
+    """The uniquing as it was before the storages were made thread-safe: a lookup,
+    followed by an add that raises if another thread got there first."""
+
+    def get_or_create_type(self, key, create):
+        value = self.get_type(key)
+        if value is None:
+            value = create()
+            self.add_type(key, value)
+        return value
+
+    def get_or_create_attribute(self, key, create):
+        value = self.get_attribute(key)
+        if value is None:
+            value = create()
+            self.add_attribute(key, value)
+        return value
+
+
+def worker(context, thread, calls, new_every, barrier, errors):
+    barrier.wait()
+    for index in range(calls):
+        if index % new_every:
+            value = index % 64
+            bitwidth = 32
+        else:
+            # A value no thread has used yet, next to one that every thread races for.
+            value = 1000 + thread * calls + index
+            bitwidth = 64 + index
+        try:
+            type = IntegerType.get(context, bitwidth)
+            IntegerAttribute.get(context, type, value)
+        except ValueError:
+            errors.append(index)
+
+
+def run(context, threads, calls, new_every) -> tuple[float, int]:
+    barrier = threading.Barrier(threads + 1)
+    errors = []
+    pool = [
+        threading.Thread(
+            target=worker, args=(context, thread, calls, new_every, barrier, errors)
+        )
+        for thread in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return 2 * threads * calls / seconds, len(errors)
+
+
+def make_context(kind: str) -> MLIRContext:
+    if kind == "unsynchronized":
+        context = UnsynchronizedContext()
+        context.types = TypeStorage()
+        context.attributes = AttributeStorage()
+        return context
+    context = MLIRContext()
+    if kind == "1 shard":
+        context.types = TypeStorage(number_of_shards=1)
+        context.attributes = AttributeStorage(number_of_shards=1)
+    return context
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--new-every", type=int, default=10)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    kinds = ["sharded", "1 shard", "unsynchronized"]
+    print(f"{'threads':>8}" + "".join(f"{kind + ' (calls/s)':>28}" for kind in kinds))
+    for threads in args.threads:
+        row = f"{threads:>8}"
+        for kind in kinds:
+            rate, errors = run(make_context(kind), threads, args.calls, args.new_every)
+            cell = f"{rate:,.0f}"
+            if errors:
+                cell += f" ({errors} errors)"
+            row += f"{cell:>28}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
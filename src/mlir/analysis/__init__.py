@@ -0,0 +1,4 @@
+from .dominance import DominanceInfo, DominanceTree
+from .liveness import Liveness, LivenessBlockInfo
+
+__all__ = ["DominanceInfo", "DominanceTree", "Liveness", "LivenessBlockInfo"]
@@ -0,0 +1,30 @@
+from .constant_propagation import (
+    ConstantLattice,
+    ConstantValue,
+    SparseConstantPropagation,
+)
+from .dead_code import DeadCodeAnalysis
+from .framework import (
+    AnalysisState,
+    CFGEdge,
+    DataFlowAnalysis,
+    DataFlowSolver,
+    Executable,
+    ProgramPoint,
+)
+from .sparse import Lattice, SparseForwardDataFlowAnalysis
+
+__all__ = [
+    "AnalysisState",
+    "CFGEdge",
+    "ConstantLattice",
+    "ConstantValue",
+    "DataFlowAnalysis",
+    "DataFlowSolver",
+    "DeadCodeAnalysis",
+    "Executable",
+    "Lattice",
+    "ProgramPoint",
+    "SparseConstantPropagation",
+    "SparseForwardDataFlowAnalysis",
+]
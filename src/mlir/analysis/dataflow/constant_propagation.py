@@ -0,0 +1,112 @@
+from mlir.ir.attributes import AttributeBase
+from mlir.ir.operations import Operation
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.value import Value
+
+from .sparse import Lattice, SparseForwardDataFlowAnalysis
+
+
+class ConstantValue:
+    """The constant a value is known to hold, or unknown if ``constant`` is None.
+
+    In MLIR this is ``ConstantValue``. It also records the operation class that produced
+    the constant, which is what can materialize it again. Two constant values are equal
+    if their constants have the same storage key, so that ``0.0`` and ``-0.0`` differ.
+
+    :param constant: The constant attribute, or None if the value is not a known
+        constant.
+    :param operation_class: The class of the operation that produced the constant.
+    """
+
+    __slots__ = ("constant", "operation_class")
+
+    def __init__(
+        self,
+        constant: AttributeBase | None = None,
+        operation_class: type[Operation] | None = None,
+    ):
+        self.constant = constant
+        self.operation_class = operation_class
+
+    @classmethod
+    def unknown(cls) -> "ConstantValue":
+        return cls()
+
+    @property
+    def is_unknown(self) -> bool:
+        return self.constant is None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConstantValue):
+            return False
+        if self.constant is None or other.constant is None:
+            return self.constant is other.constant
+        return self.constant.get_storage_key() == other.constant.get_storage_key()
+
+    def __repr__(self):
+        return "ConstantValue(<unknown>)" if self.is_unknown else f"{self.constant}"
+
+
+class ConstantLattice(Lattice):
+    """A lattice element holding a :class:`ConstantValue`. Joining two different
+    constants gives an unknown value."""
+
+    @classmethod
+    def join_values(cls, lhs: ConstantValue, rhs: ConstantValue) -> ConstantValue:
+        return lhs if lhs == rhs else ConstantValue.unknown()
+
+
+class SparseConstantPropagation(SparseForwardDataFlowAnalysis):
+    """Propagates constants forward by folding operations whose operands are constant.
+
+    In MLIR this is ``SparseConstantPropagation``. Constant-like operations produce their
+    ``value`` attribute, and other operations are folded with the constants of their
+    operands, see :meth:`~mlir.ir.operations.Operation.fold`. Operations that fold in
+    place have their operands restored, since the analysis must not change the IR.
+
+    When it is loaded into the same solver, :class:`DeadCodeAnalysis` reads these
+    lattices to only mark the successors a branch can take as live.
+    """
+
+    lattice_class = ConstantLattice
+
+    def visit_operation(
+        self,
+        operation: Operation,
+        operands: list[ConstantLattice],
+        results: list[ConstantLattice],
+    ):
+        if isinstance(operation, ConstantLike):
+            self.join(
+                results[0],
+                ConstantValue(operation.attributes["value"], type(operation)),
+            )
+            return
+        if any(operand.is_uninitialized for operand in operands):
+            return
+        if operation.regions:
+            self._set_all_to_entry_states(results)
+            return
+
+        original = [operand.value for operand in operation.operands]
+        folded = operation.fold([operand.value.constant for operand in operands])
+        if folded == []:
+            for operand, value in zip(operation.operands, original):
+                if operand.value is not value:
+                    operand.set(value)
+        if not folded:
+            self._set_all_to_entry_states(results)
+            return
+
+        for result, value in zip(results, folded):
+            if isinstance(value, Value):
+                self.join(result, self.get_lattice_element_for(operation, value).value)
+            else:
+                self.join(result, ConstantValue(value, type(operation)))
+
+    def set_to_entry_state(self, lattice: ConstantLattice):
+        self.join(lattice, ConstantValue.unknown())
+
+    def _set_all_to_entry_states(self, lattices: list[ConstantLattice]):
+        for lattice in lattices:
+            self.set_to_entry_state(lattice)
@@ -0,0 +1,77 @@
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.traits.branch import BranchOpInterface
+
+from .constant_propagation import ConstantLattice, SparseConstantPropagation
+from .framework import (
+    CFGEdge,
+    DataFlowAnalysis,
+    DataFlowSolver,
+    Executable,
+    ProgramPoint,
+)
+
+
+class DeadCodeAnalysis(DataFlowAnalysis):
+    """Finds the blocks and CFG edges that may be executed.
+
+    In MLIR this is ``DeadCodeAnalysis``. The entry blocks of the analysed operation are
+    live. The terminator of a live block makes the edges to its successors live, along
+    with the successor blocks, and any operation in a live block makes the entry blocks of
+    its regions live. Sparse analyses consult the resulting :class:`Executable` states to
+    skip code that is never reached, so this analysis must be loaded alongside them.
+
+    If a :class:`SparseConstantPropagation` is loaded into the same solver, branches are
+    only taken once the constants of their operands are known, and only to the successor
+    they select, see :meth:`BranchOpInterface.get_successor_for_operands`.
+    """
+
+    def __init__(self, solver: DataFlowSolver):
+        super().__init__(solver)
+        self._use_constants = False
+
+    def initialize(self, top: Operation):
+        self._use_constants = any(
+            isinstance(analysis, SparseConstantPropagation)
+            for analysis in self.solver.analyses
+        )
+        for region in top.regions:
+            if region.front is not None:
+                self._mark_live(region.front)
+
+    def initialize_operation(self, operation: Operation):
+        if operation.regions or operation.block_operands:
+            self.visit(operation)
+
+    def visit(self, point: ProgramPoint):
+        if not isinstance(point, Operation) or point.parent is None:
+            return
+        block = point.parent
+        if not self.get_or_create_for(point, block, Executable).live:
+            return
+
+        for region in point.regions:
+            if region.front is not None:
+                self._mark_live(region.front)
+        for successor in self.get_live_successors(point):
+            edge = self.get_or_create(CFGEdge(block, successor), Executable)
+            self.propagate_if_changed(edge, edge.set_to_live())
+            self._mark_live(successor)
+
+    def get_live_successors(self, operation: Operation) -> list[Block]:
+        """Returns the successors of a terminator in a live block that may be branched
+        to."""
+        if not self._use_constants or not isinstance(operation, BranchOpInterface):
+            return list(operation.successors)
+        constants = []
+        for operand in operation.operands:
+            lattice = self.get_or_create_for(operation, operand.value, ConstantLattice)
+            if lattice.is_uninitialized:
+                return []
+            constants.append(lattice.value.constant)
+        successor = operation.get_successor_for_operands(constants)
+        return list(operation.successors) if successor is None else [successor]
+
+    def _mark_live(self, block: Block):
+        state = self.get_or_create(block, Executable)
+        self.propagate_if_changed(state, state.set_to_live())
@@ -0,0 +1,185 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import NamedTuple, TypeVar, Union
+
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.value import Value
+
+
+class CFGEdge(NamedTuple):
+    """A control flow edge between two blocks of the same region."""
+
+    source: Block
+    target: Block
+
+
+ProgramPoint = Union[Operation, Block, CFGEdge]
+"""A point in the program that an analysis can be asked to visit."""
+
+Anchor = Union[Value, Operation, Block, CFGEdge]
+"""What an analysis state is attached to."""
+
+
+class AnalysisState:
+    """A piece of information computed by an analysis, attached to an anchor.
+
+    In MLIR this is ``AnalysisState``. States are created and owned by a
+    :class:`DataFlowSolver`, which keeps one state of each class per anchor. Analyses
+    that read a state register themselves as dependents, and are revisited at the point
+    they registered whenever the state changes.
+
+    :param anchor: The value, operation, block or edge the state is attached to.
+    """
+
+    def __init__(self, anchor: Anchor):
+        self.anchor = anchor
+        self.dependents: dict[tuple[ProgramPoint, DataFlowAnalysis], None] = {}
+
+    def on_update(self, solver: "DataFlowSolver"):
+        """Called when the state has changed, to enqueue the work that depends on it."""
+        for point, analysis in self.dependents:
+            solver.enqueue(point, analysis)
+
+
+class Executable(AnalysisState):
+    """Whether a block or a CFG edge may be executed. Starts dead and can only become
+    live.
+
+    In MLIR this is ``Executable``.
+    """
+
+    def __init__(self, anchor: Block | CFGEdge):
+        super().__init__(anchor)
+        self.live = False
+
+    def set_to_live(self) -> bool:
+        """Marks the anchor as live, and returns True if it was dead."""
+        if self.live:
+            return False
+        self.live = True
+        return True
+
+    def __repr__(self):
+        return f"Executable({'live' if self.live else 'dead'})"
+
+
+StateT = TypeVar("StateT", bound=AnalysisState)
+
+
+class DataFlowAnalysis(ABC):
+    """Base class for analyses run by a :class:`DataFlowSolver`.
+
+    The solver walks the IR once and offers every block and operation to each loaded
+    analysis through :meth:`initialize_block` and :meth:`initialize_operation`, so that
+    several analyses share one traversal. After that, analyses are only asked to
+    :meth:`visit` the program points that depend on a state that changed.
+
+    :param solver: The solver that owns the analysis.
+    """
+
+    def __init__(self, solver: "DataFlowSolver"):
+        self.solver = solver
+
+    def initialize(self, top: Operation):
+        """Called once before the walk, with the operation being analysed."""
+        pass
+
+    def initialize_block(self, block: Block):
+        """Called for every block nested in the analysed operation, in pre-order."""
+        pass
+
+    def initialize_operation(self, operation: Operation):
+        """Called for every operation nested in the analysed operation, in pre-order."""
+        pass
+
+    @abstractmethod
+    def visit(self, point: ProgramPoint):
+        """Recomputes the states derived at a program point, after a state it depends on
+        changed."""
+        pass
+
+    def get_or_create(self, anchor: Anchor, state_class: type[StateT]) -> StateT:
+        """Returns the state of a class attached to an anchor, creating it if needed."""
+        return self.solver.get_or_create_state(anchor, state_class)
+
+    def get_or_create_for(
+        self, dependent: ProgramPoint, anchor: Anchor, state_class: type[StateT]
+    ) -> StateT:
+        """Returns a state like :meth:`get_or_create`, and records that this analysis must
+        revisit ``dependent`` whenever the state changes."""
+        state = self.solver.get_or_create_state(anchor, state_class)
+        state.dependents[(dependent, self)] = None
+        return state
+
+    def propagate_if_changed(self, state: AnalysisState, changed: bool):
+        """Notifies the dependents of a state if it changed."""
+        if changed:
+            state.on_update(self.solver)
+
+
+class DataFlowSolver:
+    """Runs a set of dataflow analyses together until they reach a fixpoint.
+
+    In MLIR this is ``DataFlowSolver``. Analyses are loaded with :meth:`load`, and
+    :meth:`initialize_and_run` walks the IR once to initialize all of them, then drains a
+    worklist of (program point, analysis) pairs. Work is only enqueued when a state
+    changes: along use-def edges, for lattices attached to values, and along CFG edges,
+    for states attached to blocks and edges. A pair that is already queued is not queued
+    again.
+    """
+
+    def __init__(self):
+        self.analyses: list[DataFlowAnalysis] = []
+        self._states: dict[tuple[Anchor, type[AnalysisState]], AnalysisState] = {}
+        self._worklist: deque[tuple[ProgramPoint, DataFlowAnalysis]] = deque()
+        self._queued: set[tuple[ProgramPoint, DataFlowAnalysis]] = set()
+
+    def load(self, analysis_class: type[DataFlowAnalysis], *args, **kwargs):
+        """Creates an analysis owned by this solver and returns it."""
+        analysis = analysis_class(self, *args, **kwargs)
+        self.analyses.append(analysis)
+        return analysis
+
+    def initialize_and_run(self, top: Operation):
+        """Initializes every loaded analysis on an operation and the IR nested in it, and
+        runs them to a fixpoint."""
+        for analysis in self.analyses:
+            analysis.initialize(top)
+        regions = list(reversed(top.regions))
+        while regions:
+            region = regions.pop()
+            for block in region:
+                for analysis in self.analyses:
+                    analysis.initialize_block(block)
+                for operation in block:
+                    for analysis in self.analyses:
+                        analysis.initialize_operation(operation)
+                    regions.extend(reversed(operation.regions))
+
+        while self._worklist:
+            item = self._worklist.popleft()
+            self._queued.discard(item)
+            point, analysis = item
+            analysis.visit(point)
+
+    def enqueue(self, point: ProgramPoint, analysis: DataFlowAnalysis):
+        """Schedules an analysis to visit a program point."""
+        item = (point, analysis)
+        if item not in self._queued:
+            self._queued.add(item)
+            self._worklist.append(item)
+
+    def get_or_create_state(self, anchor: Anchor, state_class: type[StateT]) -> StateT:
+        """Returns the state of a class attached to an anchor, creating it if needed."""
+        key = (anchor, state_class)
+        state = self._states.get(key)
+        if state is None:
+            state = state_class(anchor)
+            self._states[key] = state
+        return state
+
+    def lookup_state(self, anchor: Anchor, state_class: type[StateT]) -> StateT | None:
+        """Returns the state of a class attached to an anchor, or None if no analysis
+        created it."""
+        return self._states.get((anchor, state_class))
@@ -0,0 +1,166 @@
+from abc import abstractmethod
+from typing import Any
+
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.traits.branch import BranchOpInterface
+from mlir.ir.value import Value
+
+from .framework import (
+    AnalysisState,
+    CFGEdge,
+    DataFlowAnalysis,
+    DataFlowSolver,
+    Executable,
+    ProgramPoint,
+)
+
+
+class Lattice(AnalysisState):
+    """A lattice element attached to a value.
+
+    In MLIR this is ``Lattice``. The element starts uninitialized, represented by
+    ``None``, and only moves up the lattice through :meth:`join`. Subclasses define the
+    lattice by implementing :meth:`join_values`.
+
+    Analyses that subscribe to a lattice are revisited at every user of its value when it
+    changes, which is how sparse analyses propagate along use-def edges.
+
+    :param anchor: The value the lattice element describes.
+    """
+
+    def __init__(self, anchor: Value):
+        super().__init__(anchor)
+        self.value: Any = None
+        self.use_def_subscribers: dict[DataFlowAnalysis, None] = {}
+
+    @classmethod
+    @abstractmethod
+    def join_values(cls, lhs: Any, rhs: Any) -> Any:
+        """Returns the least upper bound of two initialized lattice values."""
+        pass
+
+    @property
+    def is_uninitialized(self) -> bool:
+        return self.value is None
+
+    def join(self, value: Any) -> bool:
+        """Joins a lattice value into this element, and returns True if it changed."""
+        if value is None:
+            return False
+        joined = value if self.value is None else self.join_values(self.value, value)
+        if joined == self.value:
+            return False
+        self.value = joined
+        return True
+
+    def use_def_subscribe(self, analysis: DataFlowAnalysis):
+        """Makes an analysis revisit the users of the value whenever the element
+        changes."""
+        self.use_def_subscribers[analysis] = None
+
+    def on_update(self, solver: DataFlowSolver):
+        super().on_update(solver)
+        for analysis in self.use_def_subscribers:
+            for use in self.anchor.uses:
+                solver.enqueue(use.owner, analysis)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.value!r})"
+
+
+class SparseForwardDataFlowAnalysis(DataFlowAnalysis):
+    """Base class for analyses that propagate a lattice forward from the operands of
+    operations to their results.
+
+    In MLIR this is ``SparseForwardDataFlowAnalysis``. Subclasses set
+    :attr:`lattice_class`, and implement :meth:`visit_operation` to join the result
+    lattices from the operand lattices, and :meth:`set_to_entry_state` for values the
+    analysis knows nothing about, like the arguments of entry blocks. The analysis handles
+    control flow: the arguments of other blocks are joined from the operands forwarded by
+    each live predecessor through :class:`~mlir.ir.traits.branch.BranchOpInterface`.
+
+    Operations and blocks are only visited once the :class:`Executable` state of their
+    block is live, so a :class:`~mlir.analysis.dataflow.DeadCodeAnalysis` must be loaded
+    into the same solver.
+    """
+
+    lattice_class: type[Lattice]
+
+    @abstractmethod
+    def visit_operation(
+        self, operation: Operation, operands: list[Lattice], results: list[Lattice]
+    ):
+        """Joins the lattices of an operation's results from the lattices of its
+        operands."""
+        pass
+
+    @abstractmethod
+    def set_to_entry_state(self, lattice: Lattice):
+        """Joins the pessimistic state into a lattice whose value cannot be inferred."""
+        pass
+
+    def get_lattice_element(self, value: Value) -> Lattice:
+        return self.get_or_create(value, self.lattice_class)
+
+    def get_lattice_element_for(self, point: ProgramPoint, value: Value) -> Lattice:
+        return self.get_or_create_for(point, value, self.lattice_class)
+
+    def join(self, lattice: Lattice, value: Any):
+        """Joins a value into a lattice and propagates the change."""
+        self.propagate_if_changed(lattice, lattice.join(value))
+
+    def initialize_block(self, block: Block):
+        self._visit_block(block)
+
+    def initialize_operation(self, operation: Operation):
+        for operand in operation.operands:
+            self.get_lattice_element(operand.value).use_def_subscribe(self)
+        self._visit_operation(operation)
+
+    def visit(self, point: ProgramPoint):
+        if isinstance(point, Operation):
+            self._visit_operation(point)
+        elif isinstance(point, Block):
+            self._visit_block(point)
+
+    def _visit_operation(self, operation: Operation):
+        if not operation.results or operation.parent is None:
+            return
+        if not self.get_or_create_for(operation, operation.parent, Executable).live:
+            return
+        operands = [
+            self.get_lattice_element(operand.value) for operand in operation.operands
+        ]
+        results = [self.get_lattice_element(result) for result in operation.results]
+        self.visit_operation(operation, operands, results)
+
+    def _visit_block(self, block: Block):
+        if not block._arguments:
+            return
+        if not self.get_or_create_for(block, block, Executable).live:
+            return
+
+        arguments = [
+            self.get_lattice_element(argument) for argument in block._arguments
+        ]
+        if block.owner is None or block.owner.front is block:
+            for lattice in arguments:
+                self.set_to_entry_state(lattice)
+            return
+
+        for use in block.uses:
+            predecessor = use.owner
+            if predecessor.parent is None:
+                continue
+            edge = CFGEdge(predecessor.parent, block)
+            if not self.get_or_create_for(block, edge, Executable).live:
+                continue
+            if not isinstance(predecessor, BranchOpInterface):
+                for lattice in arguments:
+                    self.set_to_entry_state(lattice)
+                return
+            forwarded = predecessor.get_successor_operands(use.index)
+            for lattice, operand in zip(arguments, forwarded):
+                source = self.get_lattice_element_for(block, operand.value)
+                self.join(lattice, source.value)
@@ -0,0 +1,252 @@
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
+
+
+class DominanceTree:
+    """The dominator tree of the blocks of a region.
+
+    In MLIR this is ``DominatorTreeBase``. Immediate dominators are computed with the
+    iterative algorithm of Cooper, Harvey and Kennedy over a reverse post-order numbering
+    of the blocks reachable from the entry block. The tree is then numbered with a DFS,
+    so that a block dominates another exactly when its DFS interval contains the other's,
+    which answers dominance queries in O(1).
+
+    Blocks that are unreachable from the entry block are not in the tree. Following MLIR,
+    every block dominates an unreachable block, and an unreachable block dominates only
+    itself and other unreachable blocks.
+
+    :param region: The region whose blocks are numbered.
+    """
+
+    __slots__ = ("region", "version", "_order", "_idom", "_intervals")
+
+    def __init__(self, region: Region):
+        self.region = region
+        self.version = region.cfg_version
+        self._order: list[Block] = _reverse_post_order(region.front)
+        self._idom: dict[Block, Block | None] = self._compute_idoms()
+        self._intervals: dict[Block, tuple[int, int]] = self._number_tree()
+
+    @property
+    def is_valid(self) -> bool:
+        """Returns False if the CFG of the region changed since the tree was built."""
+        return self.version == self.region.cfg_version
+
+    @property
+    def blocks(self) -> list[Block]:
+        """Returns the reachable blocks of the region in reverse post-order."""
+        return list(self._order)
+
+    def is_reachable(self, block: Block) -> bool:
+        """Returns True if the block is reachable from the entry block."""
+        return block in self._intervals
+
+    def get_immediate_dominator(self, block: Block) -> Block | None:
+        """Returns the immediate dominator of a block, or None for the entry block and
+        unreachable blocks."""
+        return self._idom.get(block)
+
+    def dominates(self, a: Block, b: Block) -> bool:
+        """Returns True if block ``a`` dominates block ``b``, which must both be in the
+        region."""
+        b_interval = self._intervals.get(b)
+        if b_interval is None:
+            return True
+        a_interval = self._intervals.get(a)
+        if a_interval is None:
+            return False
+        return a_interval[0] <= b_interval[0] and b_interval[1] <= a_interval[1]
+
+    def _compute_idoms(self) -> dict[Block, Block | None]:
+        order = self._order
+        if not order:
+            return {}
+        number = {block: index for index, block in enumerate(order)}
+        predecessors: list[list[int]] = [[] for _ in order]
+        for index, block in enumerate(order):
+            for successor in block.successors:
+                successor_number = number.get(successor)
+                if successor_number is not None:
+                    predecessors[successor_number].append(index)
+
+        idom: list[int] = [-1] * len(order)
+        idom[0] = 0
+        changed = True
+        while changed:
+            changed = False
+            for index in range(1, len(order)):
+                new_idom = -1
+                for predecessor in predecessors[index]:
+                    if idom[predecessor] == -1:
+                        continue
+                    if new_idom == -1:
+                        new_idom = predecessor
+                        continue
+                    # Intersect the paths to the entry block of both candidates.
+                    finger = predecessor
+                    while finger != new_idom:
+                        while finger > new_idom:
+                            finger = idom[finger]
+                        while new_idom > finger:
+                            new_idom = idom[new_idom]
+                if idom[index] != new_idom:
+                    idom[index] = new_idom
+                    changed = True
+
+        result: dict[Block, Block | None] = {order[0]: None}
+        for index in range(1, len(order)):
+            result[order[index]] = order[idom[index]]
+        return result
+
+    def _number_tree(self) -> dict[Block, tuple[int, int]]:
+        if not self._order:
+            return {}
+        children: dict[Block, list[Block]] = {block: [] for block in self._order}
+        for block in self._order[1:]:
+            children[self._idom[block]].append(block)
+
+        intervals: dict[Block, tuple[int, int]] = {}
+        entered: dict[Block, int] = {}
+        counter = 0
+        stack: list[tuple[Block, bool]] = [(self._order[0], False)]
+        while stack:
+            block, visited = stack.pop()
+            if visited:
+                intervals[block] = (entered[block], counter)
+                counter += 1
+                continue
+            entered[block] = counter
+            counter += 1
+            stack.append((block, True))
+            stack.extend((child, False) for child in reversed(children[block]))
+        return intervals
+
+
+def _reverse_post_order(entry: Block | None) -> list[Block]:
+    """Returns the blocks reachable from the entry block in reverse post-order."""
+    if entry is None:
+        return []
+    post_order = []
+    visited = {entry}
+    stack = [(entry, iter(entry.successors))]
+    while stack:
+        block, successors = stack[-1]
+        for successor in successors:
+            if successor not in visited:
+                visited.add(successor)
+                stack.append((successor, iter(successor.successors)))
+                break
+        else:
+            stack.pop()
+            post_order.append(block)
+    post_order.reverse()
+    return post_order
+
+
+class DominanceInfo:
+    """Answers dominance queries between operations and blocks.
+
+    In MLIR this is ``DominanceInfo``. A :class:`DominanceTree` is built lazily for each
+    region that a query involves and cached. Each cached tree remembers the
+    :attr:`Region.cfg_version` it was built at, and is rebuilt on the next query once the
+    CFG of its region has been mutated.
+
+    Queries between operations or blocks in different regions are answered in the
+    closest region that contains both: an operation dominates everything nested in the
+    regions of operations that it dominates, and its own regions. Within a block,
+    operations are ordered with :meth:`Operation.is_before_in_block`, which is amortized
+    O(1).
+    """
+
+    def __init__(self):
+        self._trees: dict[Region, DominanceTree] = {}
+
+    def get_tree(self, region: Region) -> DominanceTree:
+        """Returns the dominance tree of a region, building it if it is not cached or the
+        cached tree is stale."""
+        tree = self._trees.get(region)
+        if tree is None or not tree.is_valid:
+            tree = DominanceTree(region)
+            self._trees[region] = tree
+        return tree
+
+    def invalidate(self, region: Region | None = None):
+        """Drops the cached tree of a region, or of every region if None."""
+        if region is None:
+            self._trees.clear()
+        else:
+            self._trees.pop(region, None)
+
+    def dominates(self, a: Operation | Block, b: Operation | Block) -> bool:
+        """Returns True if ``a`` dominates ``b``. Every operation and block dominates
+        itself."""
+        return a is b or self.properly_dominates(a, b)
+
+    def properly_dominates(self, a: Operation | Block, b: Operation | Block) -> bool:
+        """Returns True if ``a`` dominates ``b`` and is not ``b``.
+
+        An operation dominates the operations after it in its block, and everything
+        nested in it. A block dominates the operations in it and the blocks it dominates
+        in the CFG, including the operations and blocks nested in them.
+        """
+        if a is b:
+            return False
+        if isinstance(a, Block):
+            region = a.owner
+            if region is None:
+                return False
+            b_block = _ancestor_block(b if isinstance(b, Block) else b.parent, region)
+            if b_block is None:
+                return False
+            return b_block is a or self._block_dominates(region, a, b_block)
+
+        a_block = a.parent
+        if a_block is None or a_block.owner is None:
+            return False
+        region = a_block.owner
+        b_block = b if isinstance(b, Block) else b.parent
+        b_op = None if isinstance(b, Block) else b
+        # Find the ancestors of b in the region of a.
+        while b_block is not None and b_block.owner is not region:
+            if b_block.owner is None:
+                return False
+            b_op = b_block.owner.parent
+            if b_op is None:
+                return False
+            b_block = b_op.parent
+        if b_block is None:
+            return False
+        if b_block is not a_block:
+            return self._block_dominates(region, a_block, b_block)
+        if b_op is None:
+            # b is the block of a, which a does not dominate.
+            return False
+        return b_op is a or a.is_before_in_block(b_op)
+
+    def is_reachable(self, block: Block) -> bool:
+        """Returns True if the block is reachable from the entry block of its region."""
+        if block.owner is None:
+            return False
+        return self.get_tree(block.owner).is_reachable(block)
+
+    def get_immediate_dominator(self, block: Block) -> Block | None:
+        """Returns the immediate dominator of a block in its region, or None."""
+        if block.owner is None:
+            return None
+        return self.get_tree(block.owner).get_immediate_dominator(block)
+
+    def _block_dominates(self, region: Region, a: Block, b: Block) -> bool:
+        if region.size == 1:
+            return a is b
+        return self.get_tree(region).dominates(a, b)
+
+
+def _ancestor_block(block: Block | None, region: Region) -> Block | None:
+    """Returns the block in the region that contains the block, or None if the block is
+    not nested in the region."""
+    while block is not None and block.owner is not region:
+        if block.owner is None or block.owner.parent is None:
+            return None
+        block = block.owner.parent.parent
+    return block
@@ -0,0 +1,205 @@
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
+from mlir.ir.value import Value
+
+
+class _RegionNumbering:
+    """Dense numbering of the values that are defined or used in the blocks of a region,
+    so that sets of them can be stored as integer bitsets."""
+
+    __slots__ = ("values", "numbers")
+
+    def __init__(self):
+        self.values: list[Value] = []
+        self.numbers: dict[Value, int] = {}
+
+    def bit(self, value: Value) -> int:
+        """Returns the bit of a value, numbering it if it is new."""
+        number = self.numbers.get(value)
+        if number is None:
+            number = len(self.values)
+            self.numbers[value] = number
+            self.values.append(value)
+        return 1 << number
+
+    def decode(self, bits: int) -> list[Value]:
+        """Returns the values in a bitset, in numbering order."""
+        values = []
+        while bits:
+            low = bits & -bits
+            values.append(self.values[low.bit_length() - 1])
+            bits ^= low
+        return values
+
+
+class LivenessBlockInfo:
+    """The liveness of values at the boundaries of a single block.
+
+    The live-in and live-out sets are integer bitsets over the dense numbering of the
+    block's region.
+    """
+
+    __slots__ = ("block", "_numbering", "_defs", "_uses", "_in", "_out")
+
+    def __init__(self, block: Block, numbering: _RegionNumbering):
+        self.block = block
+        self._numbering = numbering
+        self._defs = 0
+        self._uses = 0
+        self._in = 0
+        self._out = 0
+
+    @property
+    def live_in(self) -> list[Value]:
+        """Returns the values that are live on entry to the block."""
+        return self._numbering.decode(self._in)
+
+    @property
+    def live_out(self) -> list[Value]:
+        """Returns the values that are live on exit from the block."""
+        return self._numbering.decode(self._out)
+
+    def is_live_in(self, value: Value) -> bool:
+        number = self._numbering.numbers.get(value)
+        return number is not None and (self._in >> number) & 1 == 1
+
+    def is_live_out(self, value: Value) -> bool:
+        number = self._numbering.numbers.get(value)
+        return number is not None and (self._out >> number) & 1 == 1
+
+    def get_end_operation(self, value: Value, start: Operation) -> Operation:
+        """Returns the last operation in the block that uses the value, directly or from
+        a nested region, or ``start`` if no use comes after it. A value that is live-out
+        of the block lives until its terminator, which is not reflected here."""
+        end = start
+        use = value._first_use
+        while use is not None:
+            user = _ancestor_in_block(use.owner, self.block)
+            if user is not None and end.is_before_in_block(user):
+                end = user
+            use = use._next_use
+        return end
+
+
+class Liveness:
+    """Computes which values are live at the boundaries of each block nested in an
+    operation.
+
+    In MLIR this is ``Liveness``. Each region is analysed separately: the block
+    arguments and operation results defined in it, and the values from outside that it
+    uses, are numbered densely, and the live-in and live-out sets of its blocks are
+    integer bitsets. A use in a nested region counts as a use by the operation holding
+    the region. The sets are solved once, with a backward worklist fixpoint that revisits
+    a block's predecessors through its use-list, and every query afterwards reads them.
+
+    :param operation: The operation whose nested blocks are analysed.
+    """
+
+    def __init__(self, operation: Operation):
+        self.operation = operation
+        self._blocks: dict[Block, LivenessBlockInfo] = {}
+        regions = list(operation.regions)
+        while regions:
+            region = regions.pop()
+            self._solve(region)
+            for block in region:
+                for op in block:
+                    regions.extend(op.regions)
+
+    def get_block_info(self, block: Block) -> LivenessBlockInfo | None:
+        """Returns the liveness of a block, or None if it was not analysed."""
+        return self._blocks.get(block)
+
+    def get_live_in(self, block: Block) -> list[Value]:
+        return self._blocks[block].live_in
+
+    def get_live_out(self, block: Block) -> list[Value]:
+        return self._blocks[block].live_out
+
+    def is_dead_after(self, value: Value, operation: Operation) -> bool:
+        """Returns True if the value is not used after the operation: it is not live-out
+        of the operation's block, and no later operation in the block uses it."""
+        info = self._blocks[operation.parent]
+        if info.is_live_out(value):
+            return False
+        return info.get_end_operation(value, operation) is operation
+
+    def _solve(self, region: Region):
+        numbering = _RegionNumbering()
+        infos = []
+        for block in region:
+            info = LivenessBlockInfo(block, numbering)
+            self._blocks[block] = info
+            infos.append(info)
+            defs = 0
+            for argument in block._arguments:
+                defs |= numbering.bit(argument)
+            uses = 0
+            for op in block:
+                for value in _used_values(op):
+                    bit = numbering.bit(value)
+                    if not defs & bit:
+                        uses |= bit
+                for result in op.results:
+                    defs |= numbering.bit(result)
+            info._defs = defs
+            info._uses = uses
+            info._in = uses
+
+        # Visit the blocks back to front, so that most successors are solved first.
+        worklist = infos
+        pending = set(worklist)
+        while worklist:
+            info = worklist.pop()
+            pending.discard(info)
+            live_out = 0
+            for successor in info.block.successors:
+                successor_info = self._blocks.get(successor)
+                if successor_info is not None:
+                    live_out |= successor_info._in
+            info._out = live_out
+            live_in = info._uses | (live_out & ~info._defs)
+            if live_in == info._in:
+                continue
+            info._in = live_in
+            for predecessor in info.block.predecessors:
+                predecessor_info = self._blocks.get(predecessor)
+                if predecessor_info is not None and predecessor_info not in pending:
+                    pending.add(predecessor_info)
+                    worklist.append(predecessor_info)
+
+
+def _used_values(op: Operation) -> list[Value]:
+    """Returns the values used by an operation and by every operation nested in it that
+    are defined outside of it."""
+    values = [operand.value for operand in op.operands if operand.value is not None]
+    if not op.regions:
+        return values
+    defined = set()
+    nested = []
+    regions = list(op.regions)
+    while regions:
+        region = regions.pop()
+        for block in region:
+            defined.update(block._arguments)
+            for nested_op in block:
+                defined.update(nested_op.results)
+                nested.extend(
+                    operand.value
+                    for operand in nested_op.operands
+                    if operand.value is not None
+                )
+                regions.extend(nested_op.regions)
+    values.extend(value for value in nested if value not in defined)
+    return values
+
+
+def _ancestor_in_block(op: Operation, block: Block) -> Operation | None:
+    """Returns the operation in the block that is or contains the given operation."""
+    while op.parent is not block:
+        parent = op.parent
+        if parent is None or parent.owner is None or parent.owner.parent is None:
+            return None
+        op = parent.owner.parent
+    return op
@@ -1,7 +1,23 @@
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Callable
+
 from mlir.ir.attributes import AttributeBase, AttributeStorage
 from mlir.ir.types import TypeBase, TypeStorage
 
 
+class ParallelBackend(Enum):
+    """The kind of worker pool used when multithreading is enabled on a context."""
+
+    THREAD = "thread"
+    """A pool of threads, which share the IR directly."""
+
+    PROCESS = "process"
+    """A pool of processes. Work is pickled and sent to the workers, which avoids the GIL
+    for pure-Python work at the cost of copying the IR."""
+
+
 class MLIRContext:
     """Represents the compilation context for MLIR.
 
@@ -12,12 +28,71 @@ class MLIRContext:
     * Types used: Declares one instance of each type to allow for effecient memory usage,
       but effecient lowering etc.
     * Attributes used: Same as types, but for attributes.
+    * Multithreading: Owns the worker pool used to process independent operations (those
+      isolated from above) in parallel. This is disabled by default.
+
+    Types and attributes can be created from several threads at once: both storages are
+    sharded with a lock per shard, and looking up an existing entry takes no lock.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        enable_multithreading: bool = False,
+        max_workers: int | None = None,
+        backend: ParallelBackend = ParallelBackend.THREAD,
+    ):
         """Instantiate a new MLIRContext."""
         self.types: TypeStorage = TypeStorage()
         self.attributes: AttributeStorage = AttributeStorage()
+        self._multithreading = enable_multithreading
+        self._max_workers = max_workers
+        self._backend = backend
+        self._executor: Executor | None = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def is_multithreading_enabled(self) -> bool:
+        """Returns True if work should be distributed over the worker pool."""
+        return self._multithreading
+
+    @property
+    def backend(self) -> ParallelBackend:
+        """Returns the kind of worker pool used for parallel work."""
+        return self._backend
+
+    def enable_multithreading(
+        self,
+        enable: bool = True,
+        max_workers: int | None = None,
+        backend: ParallelBackend = ParallelBackend.THREAD,
+    ):
+        """Enables or disables parallel work, and configures the worker pool. Any existing
+        pool is shut down, and a new one is created when next needed."""
+        self.shutdown()
+        self._multithreading = enable
+        self._max_workers = max_workers
+        self._backend = backend
+
+    @property
+    def executor(self) -> Executor | None:
+        """Returns the worker pool, creating it on first use, or None if multithreading is
+        disabled."""
+        if not self._multithreading:
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                if self._backend == ParallelBackend.PROCESS:
+                    self._executor = ProcessPoolExecutor(self._max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(self._max_workers)
+            return self._executor
+
+    def shutdown(self):
+        """Shuts down the worker pool, if one has been created."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
     def get_type(self, key: tuple) -> TypeBase | None:
         """Return a type from the context by a key, which is a tuple of its type and
@@ -27,15 +102,16 @@ class MLIRContext:
     def add_type(self, key: tuple, value: TypeBase):
         """Add a type to the context. If the type already exists, this will raise an
         error."""
-        if key in self.types:
-            if self.types[key] == value:
-                raise ValueError(f"Type {value} already exists in the context.")
-            else:
-                raise ValueError(
-                    f"The {key} already exists in the context with a different value."
-                )
         self.types.add(key, value)
 
+    def get_or_create_type(
+        self, key: tuple, create: Callable[[], TypeBase]
+    ) -> TypeBase:
+        """Return the type stored for a key, calling ``create`` to make it if there is
+        none. Unlike a lookup followed by :meth:`add_type`, this never raises when
+        another thread creates the same type at the same time."""
+        return self.types.get_or_create(key, create)
+
     def get_attribute(self, key: tuple) -> AttributeBase | None:
         """Return an attribute from the context by a key, which is a tuple of its type and
         parameters that define the type. If the attribute does not exist, return None."""
@@ -45,3 +121,10 @@ class MLIRContext:
         """Add an attribute to the context. If the attribute already exists, this will raise
         an error."""
         self.attributes.add(key, value)
+
+    def get_or_create_attribute(
+        self, key: tuple, create: Callable[[], AttributeBase]
+    ) -> AttributeBase:
+        """Return the attribute stored for a key, calling ``create`` to make it if there
+        is none. See :meth:`get_or_create_type`."""
+        return self.attributes.get_or_create(key, create)
@@ -0,0 +1,169 @@
+from abc import abstractmethod
+
+from mlir.ir.attributes import AttributeBase, IntegerAttribute
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.traits.effects import Pure
+from mlir.ir.traits.operands import TwoOperands, ZeroOperands
+from mlir.ir.traits.regions import ZeroRegions
+from mlir.ir.traits.results import OneResult
+from mlir.ir.types import IntegerType, SignednessSemantics, TypeBase
+from mlir.ir.value import Value
+
+
+class ConstantOp(Operation, ConstantLike, Pure, ZeroOperands, OneResult, ZeroRegions):
+    """An operation that produces the constant held in its ``value`` attribute."""
+
+    __slots__ = ()
+
+    operation_name = "arith.constant"
+
+    def create_results(self, attributes, **kwargs) -> list[OpResult]:
+        return [OpResult(attributes["value"].attribute_type, self, 0)]
+
+    @property
+    def value(self) -> AttributeBase:
+        """Returns the constant produced by the operation."""
+        return self.attributes["value"]
+
+    @classmethod
+    def build(cls, value: AttributeBase) -> "ConstantOp":
+        return cls(operands=[], attributes={"value": value})
+
+
+class IntegerBinaryOp(Operation, Pure, TwoOperands, OneResult, ZeroRegions):
+    """Base class for binary operations on integers, whose result has the type of the
+    operands. Integer arithmetic wraps around on overflow, as in MLIR.
+
+    Subclasses implement :meth:`compute`, and :meth:`fold` on top of
+    :meth:`fold_constants`, and set ``commutative`` if their operands can be swapped.
+    """
+
+    __slots__ = ()
+
+    commutative = False
+    """If True, folding moves a constant left-hand operand to the right-hand side, so
+    that the other folds only have to check the right-hand side."""
+
+    def create_results(self, operands, **kwargs) -> list[OpResult]:
+        return [OpResult(operands[0].type, self, 0)]
+
+    @property
+    def lhs(self) -> Value:
+        return self.operands[0].value
+
+    @property
+    def rhs(self) -> Value:
+        return self.operands[1].value
+
+    @classmethod
+    def build(cls, lhs: Value, rhs: Value) -> "IntegerBinaryOp":
+        return cls(operands=[lhs, rhs], attributes={})
+
+    @classmethod
+    def materialize_constant(
+        cls, value: AttributeBase, type: TypeBase
+    ) -> Operation | None:
+        if isinstance(value, IntegerAttribute) and value.attribute_type == type:
+            return ConstantOp.build(value)
+        return None
+
+    @abstractmethod
+    def compute(self, lhs: int, rhs: int) -> int:
+        """Computes the result for constant operands, before wrapping."""
+        pass
+
+    def fold_constants(
+        self, operand_constants: list[AttributeBase | None]
+    ) -> "list[Value | AttributeBase] | None":
+        """Folds the operation if both operands are constant, or canonicalizes the order
+        of the operands of a commutative operation. Returns None if neither applies."""
+        lhs, rhs = operand_constants
+        if lhs is not None and rhs is not None:
+            type = self.results[0].type
+            value = _wrap(self.compute(lhs.value, rhs.value), type)
+            return [IntegerAttribute(type=type, value=value)]
+        if self.commutative and lhs is not None:
+            lhs_value, rhs_value = self.lhs, self.rhs
+            self.operands[0].set(rhs_value)
+            self.operands[1].set(lhs_value)
+            return []
+        return None
+
+
+def _wrap(value: int, type: IntegerType) -> int:
+    """Wraps an integer into the range of the type, using the two's complement
+    representation for signed and signless integers."""
+    modulus = 1 << type.bitwidth
+    value %= modulus
+    if type.signedness != SignednessSemantics.UNSIGNED and value >= modulus >> 1:
+        value -= modulus
+    return value
+
+
+def _is_constant(attribute: AttributeBase | None, value: int) -> bool:
+    return attribute is not None and attribute.value == value
+
+
+class AddIOp(IntegerBinaryOp):
+    """Integer addition."""
+
+    __slots__ = ()
+
+    operation_name = "arith.addi"
+
+    commutative = True
+
+    def compute(self, lhs: int, rhs: int) -> int:
+        return lhs + rhs
+
+    def fold(self, operand_constants):
+        folded = self.fold_constants(operand_constants)
+        if folded is None and _is_constant(operand_constants[1], 0):
+            return [self.lhs]
+        return folded
+
+
+class SubIOp(IntegerBinaryOp):
+    """Integer subtraction."""
+
+    __slots__ = ()
+
+    operation_name = "arith.subi"
+
+    def compute(self, lhs: int, rhs: int) -> int:
+        return lhs - rhs
+
+    def fold(self, operand_constants):
+        folded = self.fold_constants(operand_constants)
+        if folded is not None:
+            return folded
+        if _is_constant(operand_constants[1], 0):
+            return [self.lhs]
+        if self.lhs is self.rhs:
+            type = self.results[0].type
+            return [IntegerAttribute(type=type, value=0)]
+        return None
+
+
+class MulIOp(IntegerBinaryOp):
+    """Integer multiplication."""
+
+    __slots__ = ()
+
+    operation_name = "arith.muli"
+
+    commutative = True
+
+    def compute(self, lhs: int, rhs: int) -> int:
+        return lhs * rhs
+
+    def fold(self, operand_constants):
+        folded = self.fold_constants(operand_constants)
+        if folded is not None:
+            return folded
+        if _is_constant(operand_constants[1], 1):
+            return [self.lhs]
+        if _is_constant(operand_constants[1], 0):
+            return [operand_constants[1]]
+        return None
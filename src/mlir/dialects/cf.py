@@ -0,0 +1,149 @@
+from typing import Iterable
+
+from mlir.ir.attributes import AttributeBase, IndexAttribute, IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation, OpOperand, OpResult
+from mlir.ir.traits.branch import BranchOpInterface
+from mlir.ir.traits.operands import VariadicOperands
+from mlir.ir.traits.regions import ZeroRegions
+from mlir.ir.traits.results import ZeroResults
+from mlir.ir.traits.terminator import Terminator
+from mlir.ir.types import IndexType
+from mlir.ir.value import Value
+from mlir.rewrite import PatternRewriter, RewritePattern, get_constant_value
+
+
+class BranchOp(
+    Operation,
+    Terminator,
+    BranchOpInterface,
+    VariadicOperands,
+    ZeroResults,
+    ZeroRegions,
+):
+    """An unconditional branch to a single successor, forwarding all of its operands to
+    the arguments of the successor."""
+
+    __slots__ = ()
+
+    operation_name = "cf.br"
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+    @property
+    def dest(self) -> Block:
+        return self.successors[0]
+
+    def get_successor_operands(self, index: int) -> tuple[OpOperand, ...]:
+        return self.operands
+
+    def erase_successor_operands(self, index: int, positions: Iterable[int]):
+        self.erase_operands(positions)
+
+    def get_successor_for_operands(
+        self, operand_constants: list[AttributeBase | None]
+    ) -> Block:
+        return self.dest
+
+    @classmethod
+    def build(cls, dest: Block, operands: list[Value] = []) -> "BranchOp":
+        return cls(operands=operands, attributes={}, successors=[dest])
+
+
+class CondBranchOp(
+    Operation,
+    Terminator,
+    BranchOpInterface,
+    VariadicOperands,
+    ZeroResults,
+    ZeroRegions,
+):
+    """A conditional branch on its first operand. The remaining operands are forwarded to
+    the true successor and then the false successor, split by the
+    ``true_operand_count`` attribute."""
+
+    __slots__ = ()
+
+    operation_name = "cf.cond_br"
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+    @property
+    def condition(self) -> Value:
+        return self.operands[0].value
+
+    @property
+    def true_dest(self) -> Block:
+        return self.successors[0]
+
+    @property
+    def false_dest(self) -> Block:
+        return self.successors[1]
+
+    def get_successor_operands(self, index: int) -> tuple[OpOperand, ...]:
+        split = 1 + self.attributes["true_operand_count"].value
+        return self.operands[1:split] if index == 0 else self.operands[split:]
+
+    def erase_successor_operands(self, index: int, positions: Iterable[int]):
+        positions = set(positions)
+        offset = 1 if index == 0 else 1 + self.attributes["true_operand_count"].value
+        self.erase_operands(offset + position for position in positions)
+        if index == 0:
+            self.attributes["true_operand_count"] = _index_attribute(
+                self.attributes["true_operand_count"].value - len(positions)
+            )
+
+    def get_successor_for_operands(
+        self, operand_constants: list[AttributeBase | None]
+    ) -> Block | None:
+        condition = operand_constants[0]
+        if not isinstance(condition, IntegerAttribute):
+            return None
+        return self.true_dest if condition.value else self.false_dest
+
+    @classmethod
+    def get_canonicalization_patterns(cls) -> list[RewritePattern]:
+        return [SimplifyConstCondBranch()]
+
+    @classmethod
+    def build(
+        cls,
+        condition: Value,
+        true_dest: Block,
+        true_operands: list[Value],
+        false_dest: Block,
+        false_operands: list[Value],
+    ) -> "CondBranchOp":
+        return cls(
+            operands=[condition, *true_operands, *false_operands],
+            attributes={"true_operand_count": _index_attribute(len(true_operands))},
+            successors=[true_dest, false_dest],
+        )
+
+
+class SimplifyConstCondBranch(RewritePattern):
+    """Replaces a conditional branch on a constant with an unconditional branch to the
+    successor it takes."""
+
+    root = CondBranchOp
+
+    def match_and_rewrite(
+        self, operation: CondBranchOp, rewriter: PatternRewriter
+    ) -> bool:
+        condition = get_constant_value(operation.condition)
+        if not isinstance(condition, IntegerAttribute):
+            return False
+        index = 0 if condition.value else 1
+        operands = operation.get_successor_operands(index)
+        branch = BranchOp.build(
+            operation.successors[index], [operand.value for operand in operands]
+        )
+        rewriter.insert_before(operation, branch)
+        rewriter.erase_op(operation)
+        return True
+
+
+def _index_attribute(value: int) -> IndexAttribute:
+    return IndexAttribute(type=IndexType(), value=value)
@@ -0,0 +1,66 @@
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.regions import Region
+from mlir.ir.traits.operands import VariadicOperands, ZeroOperands
+from mlir.ir.traits.regions import IsolatedFromAbove, OneRegion, ZeroRegions
+from mlir.ir.traits.results import ZeroResults
+from mlir.ir.traits.terminator import Terminator
+from mlir.ir.types import TypeBase
+from mlir.ir.value import BlockArgument, Value
+
+
+class FuncOp(Operation, IsolatedFromAbove, ZeroOperands, ZeroResults, OneRegion):
+    """An operation that represents a function. The body is a single region, and the
+    arguments of the function are the arguments of its entry block.
+
+    Functions are isolated from above, which makes them the unit that passes and the
+    verifier can process independently.
+    """
+
+    __slots__ = ()
+
+    operation_name = "func.func"
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+    @property
+    def body(self) -> Region:
+        """Returns the region containing the body of the function."""
+        return self.regions[0]
+
+    @property
+    def entry_block(self) -> Block | None:
+        """Returns the entry block of the function, or None if it has no body."""
+        return self.body.front
+
+    @property
+    def arguments(self) -> list[BlockArgument]:
+        """Returns the arguments of the function."""
+        entry_block = self.entry_block
+        if entry_block is None:
+            return []
+        return list(entry_block._arguments)
+
+    @classmethod
+    def build(cls, argument_types: list[TypeBase] = []) -> "FuncOp":
+        """Builds a function with an empty entry block taking the given argument types."""
+        return cls(
+            operands=[], attributes={}, regions=[Region([Block(argument_types)])]
+        )
+
+
+class ReturnOp(Operation, Terminator, VariadicOperands, ZeroResults, ZeroRegions):
+    """An operation that returns from a function, with the returned values as its
+    operands."""
+
+    __slots__ = ()
+
+    operation_name = "func.return"
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+    @classmethod
+    def build(cls, values: list[Value] = []) -> "ReturnOp":
+        return cls(operands=values, attributes={})
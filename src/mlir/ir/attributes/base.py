@@ -1,11 +1,13 @@
+import struct
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from mlir.ir.types import TypeBase
+from mlir.utils.storage_uniquer import StorageUniquer
 
 if TYPE_CHECKING:
-    pass
+    from mlir.context import MLIRContext
 
 
 class AttributeBase(BaseModel):
@@ -19,6 +21,19 @@ class AttributeBase(BaseModel):
     value: Any
     """The value of the attribute: subclasses should use stricter type checking."""
 
+    @classmethod
+    def get(cls, context: "MLIRContext", type: TypeBase, value: Any) -> "AttributeBase":
+        """Get an attribute from the context, or create it if it does not exist. This is
+        safe to call from several threads."""
+        return context.get_or_create_attribute(
+            (cls.__name__, type, _storage_value(value)),
+            lambda: cls(type=type, value=value),
+        )
+
+    def get_storage_key(self) -> tuple:
+        """Returns the key the attribute is uniqued under in :class:`AttributeStorage`."""
+        return (type(self).__name__, self.attribute_type, _storage_value(self.value))
+
     @model_validator(mode="before")
     def validate_type(cls, values):
         """Ensure that the type is an instance of TypeBase."""
@@ -30,36 +45,39 @@ class AttributeBase(BaseModel):
         return f"{self.value} : {self.attribute_type}"
 
 
-class AttributeStorage:
+def _storage_value(value: Any) -> Any:
+    """Returns the value as it appears in a storage key. Floats are keyed by their bits,
+    since ``-0.0 == 0.0`` and NaN is not equal to itself."""
+    if isinstance(value, float):
+        return struct.pack("<d", value)
+    return value
+
+
+class AttributeStorage(StorageUniquer[tuple, AttributeBase]):
     """A storage for attributes for deduplication.
 
     In MLIR, types and attr storage are much more elegant than this; the storage contains
     the definitions, and the attrs are pointers to within. They also allocate a storage for
     each type, which is not done here.
-    """
 
-    def __init__(self):
-        self._attributes = {}
+    Attributes are keyed by a tuple of their class name, type and value, where floats are
+    keyed by their bits, and the storage is safe to use from several threads, see
+    :class:`~mlir.utils.storage_uniquer.StorageUniquer`.
+    """
 
     def get(self, key: tuple) -> AttributeBase | None:
         """Return an attribute from the context by a key, which is a tuple of its type and
         parameters that define the type. If the attribute does not exist, return None."""
-        return self._attributes.get(key, None)
+        return self.lookup(key)
 
     def add(self, key: tuple, value: AttributeBase):
         """Add an attribute to the context. If the attribute already exists, this will raise
         an error."""
-        if key in self._attributes:
-            if self._attributes[key] == value:
+        stored = self.get_or_create(key, lambda: value)
+        if stored is not value:
+            if stored == value:
                 raise ValueError(f"Attribute {value} already exists in the context.")
             else:
                 raise ValueError(
                     f"The {key} already exists in the context with a different value."
                 )
-        self._attributes[key] = value
-
-    def __contains__(self, key: tuple) -> bool:
-        return key in self._attributes
-
-    def __getitem__(self, key: tuple) -> AttributeBase:
-        return self._attributes[key]
@@ -1,21 +1,60 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from mlir.ir.operations import Operation
+from mlir.ir.listeners import (
+    notify_operation_inserted,
+    notify_operation_removed,
+    notify_operations_modified,
+)
+from mlir.ir.operations import (
+    INVALID_ORDER_INDEX,
+    ORDER_STRIDE,
+    BlockOperand,
+    Operation,
+)
 from mlir.ir.traits.terminator import Terminator
 from mlir.ir.types import TypeBase
-from mlir.ir.value import BlockArgument
+from mlir.ir.value import BlockArgument, IRObjectWithUseList
+from mlir.utils.pickling import get_slot_state, set_slot_state
 
 if TYPE_CHECKING:
     from mlir.ir.regions import Region
 
 
-class Block:
+_LINK_SLOTS = (
+    "_front",
+    "_back",
+    "_number_of_operations",
+    "_order_valid",
+    "_prev",
+    "_next",
+    "_first_use",
+)
+
+
+class Block(IRObjectWithUseList):
     """A block contains a sequence of operations, and a list of block arguments that are
     available to those operations.
 
-    TODO: implement double-linked list for blocks in a region?
+    Operations are stored as an intrusive doubly-linked list threaded through
+    :class:`Operation`, so the block only holds the front, the back and a count. Index
+    based accessors are kept for compatibility, but walk the list. Blocks are linked to
+    their siblings in the owning region in the same way.
+
+    The successor references to a block, :class:`~mlir.ir.operations.BlockOperand`, form
+    its use-list, so its predecessors are found in O(degree).
     """
 
+    __slots__ = (
+        "_arguments",
+        "_front",
+        "_back",
+        "_number_of_operations",
+        "_order_valid",
+        "owner",
+        "_prev",
+        "_next",
+    )
+
     def __init__(
         self,
         arguments: list[TypeBase] = [],
@@ -23,14 +62,42 @@ class Block:
         owner: "Region | None" = None,
     ):
         self._arguments = []
-        self._operations = []
+        self._first_use: BlockOperand | None = None
+        self._front: Operation | None = None
+        self._back: Operation | None = None
+        self._number_of_operations = 0
+        self._order_valid = False
         self.owner = owner
+        self._prev: "Block | None" = None
+        self._next: "Block | None" = None
 
         for argument in arguments:
             self.add_argument(argument)
         for operation in operations:
             self.push_end(operation)
 
+    def __getstate__(self):
+        state = get_slot_state(self, exclude=_LINK_SLOTS)
+        # The operations of a block in a region are relinked by the region, so that the
+        # blocks themselves are all restored before any successor refers to them.
+        operations = self.operations if self.owner is None else None
+        return state, operations
+
+    def __setstate__(self, state):
+        state, operations = state
+        set_slot_state(self, state)
+        # The owning region may already have relinked this block and its operations.
+        if not hasattr(self, "_number_of_operations"):
+            self._relink([])
+        if not hasattr(self, "_prev"):
+            self._prev = None
+            self._next = None
+        # The use-list is rebuilt by each BlockOperand, which may have come first.
+        if not hasattr(self, "_first_use"):
+            self._first_use = None
+        if operations is not None:
+            self._relink(operations)
+
     @property
     def number_of_arguments(self) -> int:
         """Returns the number of arguments in the block."""
@@ -39,29 +106,33 @@ class Block:
     @property
     def number_of_operations(self) -> int:
         """Returns the number of operations in the block."""
-        return len(self._operations)
+        return self._number_of_operations
 
     @property
     def front(self) -> Operation | None:
         """Returns the first operation in the block, or None if the block is empty."""
-        if self.number_of_operations == 0:
-            return None
-        return self._operations[0]
+        return self._front
 
     @property
     def back(self) -> Operation | None:
         """Returns the last operation in the block, or None if the block is empty."""
-        if self.number_of_operations == 0:
-            return None
-        return self._operations[-1]
+        return self._back
+
+    @property
+    def prev_node(self) -> "Block | None":
+        """Returns the previous block in the owning region, or None."""
+        return self._prev
+
+    @property
+    def next_node(self) -> "Block | None":
+        """Returns the next block in the owning region, or None."""
+        return self._next
 
     @property
     def terminator(self) -> Terminator | None:
         """Returns the terminator operation of the block, or None if the block is empty or
         does not have a terminator."""
-        if self.number_of_operations == 0:
-            return None
-        last_op = self._operations[-1]
+        last_op = self._back
         if isinstance(last_op, Terminator):
             return last_op
         return None
@@ -73,7 +144,62 @@ class Block:
         terminator = self.terminator
         if terminator is None:
             return []
-        return terminator.successors
+        return list(terminator.successors)
+
+    @property
+    def uses(self) -> list[BlockOperand]:
+        """Returns a snapshot of the successor references to this block, most recent
+        first."""
+        return super().uses
+
+    @property
+    def predecessors(self) -> list["Block"]:
+        """Returns the blocks whose terminators refer to this block, one entry per
+        reference, so a block that branches here twice is listed twice."""
+        predecessors = []
+        use = self._first_use
+        while use is not None:
+            if use.owner.parent is not None:
+                predecessors.append(use.owner.parent)
+            use = use._next_use
+        return predecessors
+
+    @property
+    def has_single_predecessor(self) -> bool:
+        """Returns True if exactly one successor reference refers to this block."""
+        return self.has_one_use
+
+    @property
+    def single_predecessor(self) -> "Block | None":
+        """Returns the predecessor of this block if it has exactly one, or None."""
+        if not self.has_one_use:
+            return None
+        return self._first_use.owner.parent
+
+    def replace_all_uses_with(self, block: "Block"):
+        """Redirects every successor reference to this block to another block, in a single
+        pass over the use-list. Listeners are notified once with all of the modified
+        operations."""
+        if block is self or self._first_use is None:
+            return
+        users = []
+        use = self._first_use
+        while True:
+            use.block = block
+            users.append(use.owner)
+            if use.owner.parent is not None:
+                use.owner.parent._cfg_changed()
+            if use._next_use is None:
+                break
+            use = use._next_use
+
+        # Splice the whole list onto the front of the other use-list.
+        use._next_use = block._first_use
+        if block._first_use is not None:
+            block._first_use._prev_use = use
+        block._first_use = self._first_use
+        self._first_use = None
+        notify_operations_modified(users)
 
     @property
     def is_empty(self) -> bool:
@@ -121,59 +247,261 @@ class Block:
         for i in range(index, self.number_of_arguments):
             self._arguments[i].index = i
 
+    def remove_arguments(self, indices: Iterable[int]):
+        """Removes the block arguments at the given indices in one pass, renumbering the
+        remaining arguments once. The arguments must not have any uses."""
+        indices = set(indices)
+        for index in sorted(indices):
+            if not self._arguments[index].use_empty:
+                raise ValueError(f"Cannot remove argument {index}: it still has uses.")
+        arguments = []
+        for argument in self._arguments:
+            if argument.index in indices:
+                argument.owner = None
+                argument.index = None
+            else:
+                argument.index = len(arguments)
+                arguments.append(argument)
+        self._arguments = arguments
+
     def get_operation(self, index: int) -> Operation:
-        """Returns the operation at the specified index."""
-        return self._operations[index]
+        """Returns the operation at the specified index.
+
+        This is a compatibility layer over the linked list, so it walks from the nearest
+        end of the block and is O(n). Prefer iterating the block or using
+        :attr:`Operation.next_node` and :attr:`Operation.prev_node`.
+        """
+        size = self._number_of_operations
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(f"Operation index {index} is out of range.")
+
+        if index < size // 2:
+            operation = self._front
+            for _ in range(index):
+                operation = operation._next
+        else:
+            operation = self._back
+            for _ in range(size - 1 - index):
+                operation = operation._prev
+        return operation
 
     def push_end(self, operation: Operation):
         """Adds an operation to the block, setting the operation's parent to this block."""
-        return self.insert_operation(self.number_of_operations, operation)
+        return self.insert_after(self._back, operation)
 
     def push_front(self, operation: Operation):
         """Adds an operation to the front of the block, setting the operation's parent to
         this block."""
-        return self.insert_operation(0, operation)
+        return self.insert_before(self._front, operation)
 
     def insert_operation(self, index: int, operation: Operation):
-        """Inserts an operation at the specified index, updating the indices of subsequent
-        operations."""
-        if operation.parent is not None and operation.parent != self:
-            raise ValueError(
-                f"Operation {operation} already has a parent {operation.parent}, cannot "
-                f"reassign to {self}."
-            )
-        operation.parent = self
-        self._operations.insert(index, operation)
+        """Inserts an operation at the specified index, following the semantics of
+        ``list.insert``. Finding the index is O(n); see :meth:`insert_before` and
+        :meth:`insert_after` for O(1) insertion relative to another operation."""
+        size = self._number_of_operations
+        if index < 0:
+            index = max(index + size, 0)
+        if index >= size:
+            return self.push_end(operation)
+        return self.insert_before(self.get_operation(index), operation)
+
+    def insert_before(self, anchor: Operation | None, operation: Operation):
+        """Inserts an operation directly before the anchor operation. If the anchor is
+        None, the operation is inserted at the end of the block."""
+        if anchor is None:
+            return self._link(operation, self._back, None)
+        self._check_owns(anchor, "insert before")
+        return self._link(operation, anchor._prev, anchor)
+
+    def insert_after(self, anchor: Operation | None, operation: Operation):
+        """Inserts an operation directly after the anchor operation. If the anchor is None,
+        the operation is inserted at the front of the block."""
+        if anchor is None:
+            return self._link(operation, None, self._front)
+        self._check_owns(anchor, "insert after")
+        return self._link(operation, anchor, anchor._next)
 
     def remove_operation(self, operation: Operation | int):
         """Removes an operation from the block."""
         if isinstance(operation, int):
             operation = self.get_operation(operation)
-        if operation.parent != self:
-            raise ValueError(
-                f"Operation {operation} does not belong to this block {self}, cannot "
-                f"remove."
-            )
-        operation.parent = None
-        self._operations.remove(operation)
+        self._check_owns(operation, "remove")
+        self._unlink(operation)
 
     def clear(self):
-        """Removes all operations from the block."""
-        for op in self._operations:
-            op.parent = None
-        self._operations.clear()
+        """Removes all operations from the block. This is a bulk operation, so listeners
+        are not notified of each removal."""
+        operation = self._front
+        while operation is not None:
+            next_operation = operation._next
+            operation.parent = None
+            operation._prev = None
+            operation._next = None
+            operation._order_index = INVALID_ORDER_INDEX
+            operation = next_operation
+        self._front = None
+        self._back = None
+        self._number_of_operations = 0
+        self._cfg_changed()
 
     def splice(self, operation: Operation | int, target_block: "Block", index: int):
         """Moves an operation from this block to the target block at the specified index."""
         if isinstance(operation, int):
             operation = self.get_operation(operation)
-        if operation.parent != self:
+        self._check_owns(operation, "splice")
+        self._unlink(operation)
+        target_block.insert_operation(index, operation)
+
+    @property
+    def operations(self) -> list[Operation]:
+        """Returns a snapshot of the operations in the block as a list."""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Operation]:
+        """Iterates over the operations in the block from front to back.
+
+        The next operation is read before the current one is yielded, so the current
+        operation may be removed or moved during iteration.
+        """
+        operation = self._front
+        while operation is not None:
+            next_operation = operation._next
+            yield operation
+            operation = next_operation
+
+    def __reversed__(self) -> Iterator[Operation]:
+        """Iterates over the operations in the block from back to front, with the same
+        guarantees as :meth:`__iter__`."""
+        operation = self._back
+        while operation is not None:
+            prev_operation = operation._prev
+            yield operation
+            operation = prev_operation
+
+    def _check_owns(self, operation: Operation, action: str):
+        """Raises if the operation is not in this block."""
+        if operation.parent is not self:
             raise ValueError(
                 f"Operation {operation} does not belong to this block {self}, cannot "
-                f"splice."
+                f"{action}."
             )
-        self.remove_operation(operation)
-        target_block.insert_operation(index, operation)
+
+    def _link(
+        self,
+        operation: Operation,
+        prev_operation: Operation | None,
+        next_operation: Operation | None,
+    ):
+        """Links an operation between two neighbouring operations in this block."""
+        if operation.parent is not None and operation.parent is not self:
+            raise ValueError(
+                f"Operation {operation} already has a parent {operation.parent}, cannot "
+                f"reassign to {self}."
+            )
+        if (
+            operation._prev is not None
+            or operation._next is not None
+            or self._front is operation
+        ):
+            raise ValueError(f"Operation {operation} is already in block {self}.")
+
+        operation.parent = self
+        operation._prev = prev_operation
+        operation._next = next_operation
+        if prev_operation is None:
+            self._front = operation
+        else:
+            prev_operation._next = operation
+        if next_operation is None:
+            self._back = operation
+        else:
+            next_operation._prev = operation
+        self._number_of_operations += 1
+
+        if self._order_valid:
+            self._assign_order(operation, prev_operation, next_operation)
+        if operation.block_operands:
+            self._cfg_changed()
+        notify_operation_inserted(operation)
+
+    def _unlink(self, operation: Operation):
+        """Unlinks an operation from this block, leaving its neighbours connected."""
+        prev_operation = operation._prev
+        next_operation = operation._next
+        if prev_operation is None:
+            self._front = next_operation
+        else:
+            prev_operation._next = next_operation
+        if next_operation is None:
+            self._back = prev_operation
+        else:
+            next_operation._prev = prev_operation
+        operation.parent = None
+        operation._prev = None
+        operation._next = None
+        operation._order_index = INVALID_ORDER_INDEX
+        self._number_of_operations -= 1
+        if operation.block_operands:
+            self._cfg_changed()
+        notify_operation_removed(operation)
+
+    def _cfg_changed(self):
+        """Records that the successors of this block may have changed, see
+        :attr:`Region.cfg_version`."""
+        if self.owner is not None:
+            self.owner._cfg_version += 1
+
+    def _relink(self, operations: list[Operation]):
+        """Rebuilds the operation list of the block from a list of operations whose
+        parent is already this block."""
+        prev_operation = None
+        for operation in operations:
+            operation._prev = prev_operation
+            if prev_operation is not None:
+                prev_operation._next = operation
+            prev_operation = operation
+        if prev_operation is not None:
+            prev_operation._next = None
+        self._front = operations[0] if operations else None
+        self._back = prev_operation
+        self._number_of_operations = len(operations)
+        self._order_valid = False
+
+    def _assign_order(
+        self,
+        operation: Operation,
+        prev_operation: Operation | None,
+        next_operation: Operation | None,
+    ):
+        """Gives a newly inserted operation an order index between its neighbours. If there
+        is no gap left, the order of the block is invalidated instead, to be recomputed on
+        the next query."""
+        lower = 0 if prev_operation is None else prev_operation._order_index
+        if next_operation is None:
+            operation._order_index = lower + ORDER_STRIDE
+        elif next_operation._order_index - lower > 1:
+            operation._order_index = (lower + next_operation._order_index) // 2
+        else:
+            self._order_valid = False
+
+    def _recompute_order(self):
+        """Renumbers every operation in the block, leaving a gap of ORDER_STRIDE between
+        neighbours."""
+        index = 0
+        operation = self._front
+        while operation is not None:
+            index += ORDER_STRIDE
+            operation._order_index = index
+            operation = operation._next
+        self._order_valid = True
 
     def __repr__(self):
-        return f"Block(arguments={self._arguments}, operations={self._operations}, owner={self.owner})"
+        # Deliberately shallow: the operations and owner would repr the whole IR around
+        # the block. Use mlir.ir.printer to see its contents.
+        types = ", ".join(str(argument.type) for argument in self._arguments)
+        return (
+            f"Block(arguments=[{types}], "
+            f"number_of_operations={self._number_of_operations})"
+        )
@@ -0,0 +1,785 @@
+import inspect
+import mmap
+import struct
+import threading
+from enum import Enum, IntEnum
+from functools import cache
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from mlir.context import MLIRContext
+from mlir.ir.attributes import AttributeBase
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, lookup_operation
+from mlir.ir.regions import LazyBody, Region
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.types import TypeBase
+from mlir.ir.value import BlockArgument, Value
+from mlir.ir.verifier import verify
+from mlir.utils.validator import deferred_validation
+
+MAGIC = b"MLIRpy"
+"""The bytes every bytecode file starts with."""
+
+VERSION = 1
+"""The version of the format written by :class:`BytecodeWriter`. Readers reject other
+versions."""
+
+
+class Section(IntEnum):
+    """The sections of a bytecode file, which are written in this order. Every section
+    but the last starts with its length in bytes."""
+
+    STRING = 0
+    """The strings used by the other sections, e.g. operation and attribute names."""
+
+    TYPE = 1
+    """The types used in the module, each written once as its storage key."""
+
+    ATTRIBUTE = 2
+    """The attributes used in the module, each written once as its storage key."""
+
+    IR = 3
+    """The operation records, which run to the end of the file."""
+
+
+class _Tag(IntEnum):
+    """The kind of a parameter of a type, or the value of an attribute."""
+
+    INTEGER = 0
+    FLOAT = 1
+    STRING = 2
+
+
+class BytecodeError(ValueError):
+    """Raised for malformed bytecode, with the offset it was found at."""
+
+    def __init__(self, message: str, offset: int):
+        self.offset = offset
+        super().__init__(f"At offset {offset}: {message}")
+
+
+_FLOAT = struct.Struct("<d")
+_FLUSH_SIZE = 1 << 16
+"""The number of buffered bytes of operation records at which the writer flushes them to
+the stream."""
+
+
+def _write_varint(buffer: bytearray, value: int):
+    """Appends an unsigned integer in LEB128, seven bits per byte."""
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Maps signed integers to unsigned ones so that small magnitudes stay small."""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+class BytecodeWriter:
+    """Writes a module in a compact binary form.
+
+    In MLIR this is the ``BytecodeWriter``. Strings, types and attributes are written once
+    each, in tables at the start of the file, and operations refer to them by index. Types
+    are written as their storage keys, see :meth:`~mlir.ir.types.TypeBase.get_storage_key`,
+    and attributes as their class name, type and value, so that the reader can unique them
+    in its context once per module. Each operation record is a sequence of varints: its
+    name, operands, successors, attributes, regions and number of results.
+
+    Values are numbered in the order the reader defines them: the arguments of all blocks
+    of a region, then the operations of each block, where the values within the regions
+    of an operation come before its results. Numbering restarts inside operations that are
+    isolated from above, and their regions are prefixed with their length in bytes so that
+    a reader can skip over them. An operand refers to a value by number, and a value that
+    is used before it is defined is written with its type.
+
+    The module is walked once to build the tables, which are written first, and then again
+    to write the operation records, which are flushed to the stream as they are produced.
+
+    :param stream: The binary stream to write to.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self._strings: dict[str, int] = {}
+        self._types: dict[TypeBase, int] = {}
+        self._attributes: dict[tuple, int] = {}
+        self._attribute_list: list[AttributeBase] = []
+        self._value_ids: dict[Value, int] = {}
+        self._next_ids: list[int] = []
+        self._block_ids: list[dict[Block, int]] = []
+        self._stream_buffer = bytearray()
+        self._buffer = self._stream_buffer
+
+    def write(self, module: ModuleOperation):
+        """Writes the module to the stream."""
+        self._next_ids.append(0)
+        self._collect_operation(module)
+
+        self.stream.write(MAGIC)
+        header = bytearray()
+        _write_varint(header, VERSION)
+        self.stream.write(header)
+        self._write_section(Section.STRING, self._encode_strings())
+        self._write_section(Section.TYPE, self._encode_types())
+        self._write_section(Section.ATTRIBUTE, self._encode_attributes())
+
+        self._buffer.append(Section.IR)
+        self._next_ids = [0]
+        self._write_operation(module)
+        self.stream.write(self._buffer)
+        self._buffer.clear()
+
+    def _write_section(self, section: Section, payload: bytearray):
+        header = bytearray([section])
+        _write_varint(header, len(payload))
+        self.stream.write(header)
+        self.stream.write(payload)
+
+    def _collect_operation(self, operation: Operation):
+        self._string(operation.get_operation_name())
+        for operand in operation.operands:
+            value = operand.value
+            if value is None:
+                raise ValueError(
+                    f"Operand {operand.index} of '{operation.get_operation_name()}' "
+                    f"has no value."
+                )
+            if value not in self._value_ids:
+                # Used before it is defined, so the type is written with the use.
+                self._type(value.type)
+        for name, attribute in operation.attributes.items():
+            self._string(name)
+            self._attribute(attribute)
+        if operation.regions:
+            isolated = isinstance(operation, IsolatedFromAbove)
+            if isolated:
+                self._next_ids.append(0)
+            for region in operation.regions:
+                self._collect_region(region)
+            if isolated:
+                self._next_ids.pop()
+        for result in operation.results:
+            self._number(result)
+
+    def _collect_region(self, region: Region):
+        for block in region:
+            for argument in block._arguments:
+                self._type(argument.type)
+                self._number(argument)
+        for block in region:
+            for operation in block:
+                self._collect_operation(operation)
+
+    def _number(self, value: Value):
+        self._value_ids[value] = self._next_ids[-1]
+        self._next_ids[-1] += 1
+
+    def _string(self, string: str) -> int:
+        index = self._strings.get(string)
+        if index is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+    def _type(self, type: TypeBase) -> int:
+        index = self._types.get(type)
+        if index is None:
+            name, *parameters = type.get_storage_key()
+            self._string(name)
+            for parameter in parameters:
+                self._collect_value(parameter)
+            index = self._types[type] = len(self._types)
+        return index
+
+    def _attribute(self, attribute: AttributeBase) -> int:
+        # Attributes that compare equal, such as 0.0 and -0.0, can have different keys.
+        key = attribute.get_storage_key()
+        index = self._attributes.get(key)
+        if index is None:
+            self._string(key[0])
+            self._type(attribute.attribute_type)
+            self._collect_value(attribute.value)
+            index = self._attributes[key] = len(self._attributes)
+            self._attribute_list.append(attribute)
+        return index
+
+    def _collect_value(self, value: Any):
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, str):
+            self._string(value)
+        elif not isinstance(value, (int, float)):
+            raise ValueError(f"Can't write {value!r} to bytecode.")
+
+    def _encode_strings(self) -> bytearray:
+        payload = bytearray()
+        _write_varint(payload, len(self._strings))
+        for string in self._strings:
+            encoded = string.encode()
+            _write_varint(payload, len(encoded))
+            payload += encoded
+        return payload
+
+    def _encode_types(self) -> bytearray:
+        payload = bytearray()
+        _write_varint(payload, len(self._types))
+        for type in self._types:
+            name, *parameters = type.get_storage_key()
+            _write_varint(payload, self._strings[name])
+            _write_varint(payload, len(parameters))
+            for parameter in parameters:
+                self._encode_value(payload, parameter)
+        return payload
+
+    def _encode_attributes(self) -> bytearray:
+        payload = bytearray()
+        _write_varint(payload, len(self._attribute_list))
+        for attribute in self._attribute_list:
+            _write_varint(payload, self._strings[type(attribute).__name__])
+            _write_varint(payload, self._types[attribute.attribute_type])
+            self._encode_value(payload, attribute.value)
+        return payload
+
+    def _encode_value(self, payload: bytearray, value: Any):
+        if isinstance(value, Enum):
+            value = value.value
+        if isinstance(value, str):
+            payload.append(_Tag.STRING)
+            _write_varint(payload, self._strings[value])
+        elif isinstance(value, int):
+            payload.append(_Tag.INTEGER)
+            _write_varint(payload, _zigzag(value))
+        else:
+            payload.append(_Tag.FLOAT)
+            payload += _FLOAT.pack(value)
+
+    def _write_operation(self, operation: Operation):
+        buffer = self._buffer
+        _write_varint(buffer, self._strings[operation.get_operation_name()])
+
+        _write_varint(buffer, len(operation.operands))
+        defined = self._next_ids[-1]
+        for operand in operation.operands:
+            value = operand.value
+            index = self._value_ids.get(value)
+            if index is None:
+                raise ValueError(
+                    f"Operand {operand.index} of '{operation.get_operation_name()}' "
+                    f"is not defined within the module."
+                )
+            if index < defined:
+                _write_varint(buffer, index << 1)
+            else:
+                _write_varint(buffer, index << 1 | 1)
+                _write_varint(buffer, self._types[value.type])
+
+        _write_varint(buffer, len(operation.block_operands))
+        block_ids = self._block_ids[-1] if operation.block_operands else {}
+        for block_operand in operation.block_operands:
+            _write_varint(buffer, block_ids[block_operand.block])
+
+        _write_varint(buffer, len(operation.attributes))
+        for name, attribute in operation.attributes.items():
+            _write_varint(buffer, self._strings[name])
+            _write_varint(buffer, self._attributes[attribute.get_storage_key()])
+
+        _write_varint(buffer, len(operation.regions))
+        if operation.regions:
+            if isinstance(operation, IsolatedFromAbove):
+                self._buffer = bytearray()
+                self._next_ids.append(0)
+                for region in operation.regions:
+                    self._write_region(region)
+                self._next_ids.pop()
+                body, self._buffer = self._buffer, buffer
+                _write_varint(buffer, len(body))
+                buffer += body
+            else:
+                for region in operation.regions:
+                    self._write_region(region)
+
+        _write_varint(buffer, len(operation.results))
+        self._next_ids[-1] += len(operation.results)
+
+    def _write_region(self, region: Region):
+        buffer = self._buffer
+        _write_varint(buffer, region.size)
+        block_ids = {}
+        for block in region:
+            block_ids[block] = len(block_ids)
+            _write_varint(buffer, len(block._arguments))
+            for argument in block._arguments:
+                _write_varint(buffer, self._types[argument.type])
+            self._next_ids[-1] += len(block._arguments)
+
+        self._block_ids.append(block_ids)
+        for block in region:
+            _write_varint(self._buffer, block.number_of_operations)
+            for operation in block:
+                self._write_operation(operation)
+                if (
+                    self._buffer is self._stream_buffer
+                    and len(self._buffer) >= _FLUSH_SIZE
+                ):
+                    # The records of isolated regions are held back until their length
+                    # is known, so only those outside them are flushed.
+                    self.stream.write(self._buffer)
+                    self._buffer.clear()
+        self._block_ids.pop()
+
+
+@cache
+def _parameter_annotations(cls: type[TypeBase]) -> tuple:
+    """Returns the annotation of each positional parameter of a type's constructor, which
+    is used to turn the values of enum parameters back into members."""
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    return tuple(parameter.annotation for parameter in parameters)
+
+
+def _subclasses_by_name(cls: type) -> dict[str, type]:
+    classes = {}
+    pending = [cls]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            classes.setdefault(subclass.__name__, subclass)
+            pending.append(subclass)
+    return classes
+
+
+class _Scope:
+    """The values defined so far within a region that is isolated from above, and the
+    placeholders for values that were used before they were defined."""
+
+    __slots__ = ("values", "forward_references")
+
+    def __init__(self):
+        self.values: list[Value] = []
+        self.forward_references: dict[int, BlockArgument] = {}
+
+
+class _LazyRegions(LazyBody):
+    """The regions of an operation that is isolated from above, kept as the range of the
+    buffer they are encoded in until one of them is accessed.
+
+    Threads that access the regions while they are being loaded wait for the load to
+    finish. The lock is reentrant, as filling in the regions accesses them again from the
+    loading thread."""
+
+    __slots__ = ("reader", "start", "end", "regions", "loaded", "_loading", "_lock")
+
+    def __init__(self, reader: "BytecodeReader", start: int, end: int):
+        self.reader = reader
+        self.start = start
+        self.end = end
+        self.regions: list[Region] = []
+        self.loaded = False
+        self._loading = False
+        self._lock = threading.RLock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    def load(self):
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded or self._loading:
+                return
+            self._loading = True
+            try:
+                self.reader._load_regions(self)
+            except BaseException:
+                # Leave the regions empty rather than with part of their body, so that
+                # the next access tries the load again.
+                for region in self.regions:
+                    region.clear()
+                raise
+            finally:
+                self._loading = False
+            self.loaded = True
+            if self.reader.verify_loaded_bodies:
+                verify(self.regions[0].parent, self.reader.context)
+
+    def drop(self):
+        if self.loaded:
+            for region in self.regions:
+                region.clear()
+            self.loaded = False
+
+
+class BytecodeReader:
+    """Reads a module written by :class:`BytecodeWriter`.
+
+    In MLIR this is the ``BytecodeReader``. The type and attribute tables are read first,
+    and each entry is uniqued in the context through ``get``, so that operations share
+    the same instances without looking them up again. Operations are looked up by name in
+    the registry, see :func:`~mlir.ir.operations.lookup_operation`. A value that is used
+    before it is defined gets a placeholder, which is replaced once the definition is
+    read.
+
+    With lazy loading, the regions of operations that are isolated from above, such as
+    function bodies, are not decoded when the module is read. They are created empty with
+    a :class:`~mlir.ir.regions.LazyBody` that refers to their range of the buffer, and are
+    decoded the first time they are accessed, so the buffer must stay alive until then.
+
+    :param buffer: The bytes to read.
+    :param context: The context types and attributes are uniqued in.
+    :param lazy_loading: If True, the bodies of isolated operations are decoded on first
+        access rather than up front.
+    :param verify_loaded_bodies: If True, each lazy body is verified once it is decoded.
+    """
+
+    def __init__(
+        self,
+        buffer: bytes | mmap.mmap,
+        context: MLIRContext,
+        lazy_loading: bool = False,
+        verify_loaded_bodies: bool = False,
+    ):
+        self.buffer = buffer
+        self.context = context
+        self.lazy_loading = lazy_loading
+        self.verify_loaded_bodies = verify_loaded_bodies
+        self.position = 0
+        self._strings: list[str] = []
+        self._types: list[TypeBase] = []
+        self._attributes: list[AttributeBase] = []
+        self._scopes: list[_Scope] = []
+        self._blocks: list[list[Block]] = []
+
+    def read_module(self) -> ModuleOperation:
+        """Reads the whole buffer, and returns the module it holds."""
+        try:
+            return self._read_module()
+        except IndexError:
+            raise self._error("Unexpected end of bytecode.") from None
+
+    def _read_module(self) -> ModuleOperation:
+        if self.buffer[: len(MAGIC)] != MAGIC:
+            raise self._error("Not a bytecode file.")
+        self.position = len(MAGIC)
+        version = self._read_varint()
+        if version != VERSION:
+            raise self._error(f"Unsupported bytecode version {version}.")
+
+        self._strings = self._read_section(Section.STRING, self._read_string)
+        type_classes = _subclasses_by_name(TypeBase)
+        self._types = self._read_section(
+            Section.TYPE, lambda: self._read_type(type_classes)
+        )
+        attribute_classes = _subclasses_by_name(AttributeBase)
+        self._attributes = self._read_section(
+            Section.ATTRIBUTE, lambda: self._read_attribute(attribute_classes)
+        )
+
+        self._expect_section(Section.IR)
+        self._scopes.append(_Scope())
+        module = self._read_operation()
+        self._check_forward_references()
+        if self.position != len(self.buffer):
+            raise self._error("Unexpected data after the module.")
+        if not isinstance(module, ModuleOperation):
+            raise self._error(
+                f"Expected a module, found '{module.get_operation_name()}'."
+            )
+        return module
+
+    def _expect_section(self, section: Section):
+        found = self.buffer[self.position]
+        if found != section:
+            raise self._error(f"Expected the {section.name.lower()} section.")
+        self.position += 1
+
+    def _read_section(self, section: Section, read_entry) -> list:
+        self._expect_section(section)
+        end = self._read_varint()
+        end += self.position
+        entries = [read_entry() for _ in range(self._read_varint())]
+        if self.position != end:
+            raise self._error(f"Malformed {section.name.lower()} section.")
+        return entries
+
+    def _read_string(self) -> str:
+        length = self._read_varint()
+        start = self.position
+        self.position += length
+        if self.position > len(self.buffer):
+            raise IndexError
+        return self.buffer[start : self.position].decode()
+
+    def _read_type(self, classes: dict[str, type]) -> TypeBase:
+        start = self.position
+        name = self._strings[self._read_varint()]
+        type_class = classes.get(name)
+        if type_class is None:
+            raise self._error(f"Unknown type '{name}'.", start)
+        annotations = _parameter_annotations(type_class)
+        parameters = []
+        for index in range(self._read_varint()):
+            parameter = self._read_value()
+            annotation = annotations[index] if index < len(annotations) else None
+            if isinstance(annotation, type) and issubclass(annotation, Enum):
+                parameter = annotation(parameter)
+            parameters.append(parameter)
+        try:
+            return type_class.get(self.context, *parameters)
+        except (TypeError, ValueError) as error:
+            raise self._error(f"Failed to build type '{name}': {error!r}", start)
+
+    def _read_attribute(self, classes: dict[str, type]) -> AttributeBase:
+        start = self.position
+        name = self._strings[self._read_varint()]
+        attribute_class = classes.get(name)
+        if attribute_class is None:
+            raise self._error(f"Unknown attribute '{name}'.", start)
+        type = self._types[self._read_varint()]
+        value = self._read_value()
+        try:
+            return attribute_class.get(self.context, type, value)
+        except (TypeError, ValueError) as error:
+            raise self._error(f"Failed to build attribute '{name}': {error!r}", start)
+
+    def _read_value(self) -> Any:
+        tag = self.buffer[self.position]
+        self.position += 1
+        if tag == _Tag.INTEGER:
+            value = self._read_varint()
+            return (value >> 1) ^ -(value & 1)
+        if tag == _Tag.FLOAT:
+            start = self.position
+            self.position += _FLOAT.size
+            return _FLOAT.unpack(self.buffer[start : self.position])[0]
+        if tag == _Tag.STRING:
+            return self._strings[self._read_varint()]
+        raise self._error(f"Unknown value tag {tag}.", self.position - 1)
+
+    def _read_operation(self) -> Operation:
+        start = self.position
+        name = self._strings[self._read_varint()]
+        operation_class = lookup_operation(name)
+        if operation_class is None:
+            raise self._error(f"Unknown operation '{name}'.", start)
+
+        operands = [self._read_operand() for _ in range(self._read_varint())]
+        number_of_successors = self._read_varint()
+        if number_of_successors and not self._blocks:
+            raise self._error("Successors are only allowed within a region.", start)
+        successors = [
+            self._blocks[-1][self._read_varint()] for _ in range(number_of_successors)
+        ]
+        attributes = {}
+        for _ in range(self._read_varint()):
+            name_index = self._read_varint()
+            attributes[self._strings[name_index]] = self._attributes[
+                self._read_varint()
+            ]
+
+        regions = []
+        number_of_regions = self._read_varint()
+        if number_of_regions:
+            if issubclass(operation_class, IsolatedFromAbove) and self.lazy_loading:
+                end = self._read_varint()
+                end += self.position
+                lazy_body = _LazyRegions(self, self.position, end)
+                regions = [
+                    Region(lazy_body=lazy_body) for _ in range(number_of_regions)
+                ]
+                lazy_body.regions = regions
+                self.position = end
+            elif issubclass(operation_class, IsolatedFromAbove):
+                end = self._read_varint()
+                end += self.position
+                self._scopes.append(_Scope())
+                regions = [self._read_region() for _ in range(number_of_regions)]
+                self._check_forward_references()
+                self._scopes.pop()
+                if self.position != end:
+                    raise self._error(f"Malformed regions of '{name}'.", start)
+            else:
+                regions = [self._read_region() for _ in range(number_of_regions)]
+        number_of_results = self._read_varint()
+
+        try:
+            operation = operation_class(
+                operands=operands,
+                attributes=attributes,
+                regions=regions,
+                successors=successors,
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise self._error(f"Failed to build '{name}': {error!r}", start)
+        for region in regions:
+            region.parent = operation
+        if len(operation.results) != number_of_results:
+            raise self._error(
+                f"'{name}' produces {len(operation.results)} results, but "
+                f"{number_of_results} were written.",
+                start,
+            )
+        for result in operation.results:
+            self._define_value(result)
+        return operation
+
+    def _load_regions(self, lazy_body: _LazyRegions):
+        """Decodes the regions of a lazy body. The body is read by a new reader that
+        shares the tables of this one, so that bodies can be loaded from several threads
+        at once without sharing a position in the buffer."""
+        reader = BytecodeReader(
+            self.buffer, self.context, self.lazy_loading, self.verify_loaded_bodies
+        )
+        reader._strings = self._strings
+        reader._types = self._types
+        reader._attributes = self._attributes
+        reader.position = lazy_body.start
+        reader._scopes.append(_Scope())
+        try:
+            with deferred_validation():
+                for region in lazy_body.regions:
+                    reader._read_region(region)
+            reader._check_forward_references()
+            if reader.position != lazy_body.end:
+                raise reader._error("Malformed lazily loaded regions.", lazy_body.start)
+        except IndexError:
+            raise reader._error("Unexpected end of bytecode.") from None
+
+    def _read_region(self, region: Region | None = None) -> Region:
+        blocks = []
+        for _ in range(self._read_varint()):
+            types = self._types
+            block = Block(
+                [types[self._read_varint()] for _ in range(self._read_varint())]
+            )
+            blocks.append(block)
+        for block in blocks:
+            for argument in block._arguments:
+                self._define_value(argument)
+
+        if region is None:
+            region = Region()
+        for block in blocks:
+            region.push_end(block)
+        self._blocks.append(blocks)
+        for block in blocks:
+            for _ in range(self._read_varint()):
+                block.push_end(self._read_operation())
+        self._blocks.pop()
+        return region
+
+    def _read_operand(self) -> Value:
+        position = self.position
+        encoded = self._read_varint()
+        index = encoded >> 1
+        scope = self._scopes[-1]
+        if not encoded & 1:
+            if index >= len(scope.values):
+                raise self._error(f"Use of an undefined value {index}.", position)
+            return scope.values[index]
+        type = self._types[self._read_varint()]
+        if index < len(scope.values):
+            return scope.values[index]
+        placeholder = scope.forward_references.get(index)
+        if placeholder is None:
+            placeholder = scope.forward_references[index] = BlockArgument(
+                type, None, None
+            )
+        return placeholder
+
+    def _define_value(self, value: Value):
+        scope = self._scopes[-1]
+        placeholder = scope.forward_references.pop(len(scope.values), None)
+        scope.values.append(value)
+        if placeholder is not None:
+            if placeholder.type != value.type:
+                raise self._error(
+                    f"Value {len(scope.values) - 1} is defined with type "
+                    f"{value.type}, but was used with type {placeholder.type}."
+                )
+            placeholder.replace_all_uses_with(value)
+
+    def _check_forward_references(self):
+        forward_references = self._scopes[-1].forward_references
+        if forward_references:
+            index = next(iter(forward_references))
+            raise self._error(f"Use of an undefined value {index}.")
+
+    def _read_varint(self) -> int:
+        buffer = self.buffer
+        position = self.position
+        byte = buffer[position]
+        position += 1
+        result = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = buffer[position]
+            position += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        self.position = position
+        return result
+
+    def _error(self, message: str, offset: int | None = None) -> BytecodeError:
+        return BytecodeError(message, self.position if offset is None else offset)
+
+
+def write_bytecode(module: ModuleOperation, stream: BinaryIO):
+    """Writes a module as bytecode to a binary stream. See :class:`BytecodeWriter`."""
+    BytecodeWriter(stream).write(module)
+
+
+def write_bytecode_file(module: ModuleOperation, path: str | Path):
+    """Writes a module as bytecode to a file."""
+    with open(path, "wb") as file:
+        write_bytecode(module, file)
+
+
+def read_bytecode(
+    data: bytes,
+    context: MLIRContext,
+    verify_after_parse: bool = True,
+    lazy_loading: bool = False,
+) -> ModuleOperation:
+    """Reads a module from bytecode. See :func:`read_bytecode_file`."""
+    return _read(data, context, verify_after_parse, lazy_loading)
+
+
+def read_bytecode_file(
+    path: str | Path,
+    context: MLIRContext,
+    verify_after_parse: bool = True,
+    lazy_loading: bool = False,
+) -> ModuleOperation:
+    """Reads a module from a bytecode file, which is memory-mapped rather than read into
+    memory.
+
+    Operations are built with validation deferred, and the whole module is verified once
+    at the end, unless ``verify_after_parse`` is False. With ``lazy_loading``, the bodies
+    of operations that are isolated from above are left encoded in the mapped file until
+    they are first accessed, and are verified then instead. The file stays mapped for as
+    long as any of them can still be loaded.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return _read(b"", context, verify_after_parse, lazy_loading)
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if lazy_loading:
+        return _read(buffer, context, verify_after_parse, lazy_loading)
+    with buffer:
+        return _read(buffer, context, verify_after_parse, lazy_loading)
+
+
+def _read(
+    buffer: bytes | mmap.mmap,
+    context: MLIRContext,
+    verify_after_parse: bool,
+    lazy_loading: bool,
+) -> ModuleOperation:
+    reader = BytecodeReader(buffer, context, lazy_loading, verify_after_parse)
+    with deferred_validation():
+        module = reader.read_module()
+    if verify_after_parse:
+        verify(module, context)
+    return module
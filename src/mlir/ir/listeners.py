@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from mlir.ir.operations import Operation
+
+
+class IRListener:
+    """Base class for objects that want to be notified when the IR is mutated.
+
+    In MLIR this is ``RewriterBase::Listener``, attached to a builder. Here the active
+    listener is held in a context variable, so mutations made through the IR classes
+    themselves are reported too. Notifications are batched where possible: a bulk update
+    reports every affected operation in a single call.
+    """
+
+    def notify_operation_inserted(self, operation: "Operation"):
+        """Called after an operation has been inserted into a block."""
+        pass
+
+    def notify_operation_removed(self, operation: "Operation"):
+        """Called after an operation has been removed from a block, either to be erased or
+        to be moved elsewhere."""
+        pass
+
+    def notify_operations_modified(self, operations: list["Operation"]):
+        """Called after the operands of the given operations have been changed in place."""
+        pass
+
+
+_active_listener: ContextVar[IRListener | None] = ContextVar(
+    "mlir_active_listener", default=None
+)
+
+
+def get_listener() -> IRListener | None:
+    """Returns the listener that is currently receiving notifications, if any."""
+    return _active_listener.get()
+
+
+@contextmanager
+def listen(listener: IRListener | None) -> Iterator[IRListener | None]:
+    """Installs a listener for the duration of the context, restoring the previous one on
+    exit."""
+    token = _active_listener.set(listener)
+    try:
+        yield listener
+    finally:
+        _active_listener.reset(token)
+
+
+def notify_operation_inserted(operation: "Operation"):
+    """Notifies the active listener, if any, that an operation was inserted."""
+    listener = _active_listener.get()
+    if listener is not None:
+        listener.notify_operation_inserted(operation)
+
+
+def notify_operation_removed(operation: "Operation"):
+    """Notifies the active listener, if any, that an operation was removed."""
+    listener = _active_listener.get()
+    if listener is not None:
+        listener.notify_operation_removed(operation)
+
+
+def notify_operations_modified(operations: list["Operation"]):
+    """Notifies the active listener, if any, that the given operations were modified.
+    Each operation is reported once, in order of first appearance."""
+    if not operations:
+        return
+    listener = _active_listener.get()
+    if listener is not None:
+        operations = [op for op in dict.fromkeys(operations) if op is not None]
+        if operations:
+            listener.notify_operations_modified(operations)
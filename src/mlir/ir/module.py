@@ -13,6 +13,10 @@ class ModuleOperation(Operation, ZeroOperands, ZeroResults, OneRegion):
     produce any results.
     """
 
+    __slots__ = ()
+
+    operation_name = "builtin.module"
+
     def create_results(self, **kwargs) -> list[OpResult]:
         return []
 
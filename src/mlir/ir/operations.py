@@ -1,35 +1,164 @@
 from abc import ABC, ABCMeta, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar, Iterable, Sequence
 
 from pydantic import NonNegativeInt
 
 from mlir.ir.attributes import AttributeBase
+from mlir.ir.listeners import notify_operations_modified
 from mlir.ir.value import OpResult, Value
+from mlir.utils.pickling import get_slot_state, set_slot_state
 from mlir.utils.validator import ValidatorMeta, validator
 
 if TYPE_CHECKING:
     from mlir.ir.blocks import Block
     from mlir.ir.regions import Region
+    from mlir.ir.types import TypeBase
+    from mlir.rewrite import RewritePattern
 
 
 class OpOperand:
     """Represents an operand of an operation in MLIR.
 
     Linked to the operation that owns it and the value it represents, allowing us to
-    easily traverse the IR. Model validators are used to ensure that the use is recorded
-    in the value.
+    easily traverse the IR. Each operand is also a node in the use-list of its value, so
+    it carries links to the previous and next use of the same value.
     """
 
+    __slots__ = ("owner", "value", "index", "_prev_use", "_next_use")
+
     def __init__(self, owner: "Operation", value: Value, index: NonNegativeInt):
         self.owner: Operation = owner
-        self.value: Value = value
+        self.value: Value | None = value
         self.index: NonNegativeInt = index
-        if self not in self.value.uses:
+        self._prev_use: OpOperand | None = None
+        self._next_use: OpOperand | None = None
+        if value is not None:
+            value.add_use(self)
+
+    def __getstate__(self):
+        return get_slot_state(self, exclude=("_prev_use", "_next_use"))
+
+    def __setstate__(self, state):
+        set_slot_state(self, state)
+        self._prev_use = None
+        self._next_use = None
+        # The value may not have been restored yet, in which case it keeps the uses that
+        # are linked here.
+        if self.value is not None:
+            if not hasattr(self.value, "_first_use"):
+                self.value._first_use = None
             self.value.add_use(self)
 
+    def set(self, value: Value | None):
+        """Changes the value used by this operand, relinking it from the use-list of the
+        old value into the use-list of the new value in place."""
+        if value is self.value:
+            return
+        if self.value is not None:
+            self.value.remove_use(self)
+        self.value = value
+        if value is not None:
+            value.add_use(self)
+        notify_operations_modified([self.owner])
+
+    def drop(self):
+        """Drops the use of the current value, leaving the operand empty."""
+        self.set(None)
+
+    @property
+    def next_use(self) -> "OpOperand | None":
+        """Returns the next use of the same value, or None if this is the last use."""
+        return self._next_use
+
+
+class BlockOperand:
+    """Represents a successor of an operation: a reference to a block that control may
+    flow to.
+
+    Like :class:`OpOperand`, each block operand is a node in the use-list of the block it
+    refers to, so the predecessors of a block can be found from its uses without scanning
+    the region.
+    """
+
+    __slots__ = ("owner", "block", "index", "_prev_use", "_next_use")
+
+    def __init__(self, owner: "Operation", block: "Block", index: NonNegativeInt):
+        self.owner: Operation = owner
+        self.block: Block | None = block
+        self.index: NonNegativeInt = index
+        self._prev_use: BlockOperand | None = None
+        self._next_use: BlockOperand | None = None
+        if block is not None:
+            block.add_use(self)
+
+    def __getstate__(self):
+        return get_slot_state(self, exclude=("_prev_use", "_next_use"))
+
+    def __setstate__(self, state):
+        set_slot_state(self, state)
+        self._prev_use = None
+        self._next_use = None
+        # As for OpOperand, the block may not have been restored yet.
+        if self.block is not None:
+            if not hasattr(self.block, "_first_use"):
+                self.block._first_use = None
+            self.block.add_use(self)
+
+    def set(self, block: "Block | None"):
+        """Changes the block referred to, relinking this operand from the use-list of the
+        old block into the use-list of the new block."""
+        if block is self.block:
+            return
+        if self.block is not None:
+            self.block.remove_use(self)
+        self.block = block
+        if block is not None:
+            block.add_use(self)
+        if self.owner.parent is not None:
+            self.owner.parent._cfg_changed()
+        notify_operations_modified([self.owner])
+
+    def drop(self):
+        """Drops the reference to the current block, leaving the operand empty."""
+        self.set(None)
+
+    @property
+    def next_use(self) -> "BlockOperand | None":
+        """Returns the next use of the same block, or None if this is the last use."""
+        return self._next_use
+
+
+INVALID_ORDER_INDEX = -1
+"""Order index of an operation that is not in a block, or whose block order is stale."""
+
+ORDER_STRIDE = 1 << 16
+"""Gap left between the order indices of neighbouring operations when a block is
+renumbered, so that later insertions can usually take an index in between."""
+
+
+_registered_operations: dict[str, type["Operation"]] = {}
+
 
 class OperationMeta(ValidatorMeta, ABCMeta):
-    pass
+    """Metaclass for operations, which registers every operation class that declares an
+    ``operation_name`` so it can be looked up by name, e.g. from a textual pipeline."""
+
+    def __new__(cls, name, bases, namespace):
+        new_cls = super().__new__(cls, name, bases, namespace)
+        if namespace.get("operation_name") is not None:
+            _registered_operations[namespace["operation_name"]] = new_cls
+        return new_cls
+
+
+def registered_operations() -> list[type["Operation"]]:
+    """Returns every registered operation class, in the order they were registered."""
+    return list(_registered_operations.values())
+
+
+def lookup_operation(name: str) -> type["Operation"] | None:
+    """Returns the operation class registered under a name, or None. Operations are
+    registered when their defining module is imported."""
+    return _registered_operations.get(name)
 
 
 class Operation(ABC, metaclass=OperationMeta):
@@ -37,24 +166,212 @@ class Operation(ABC, metaclass=OperationMeta):
 
     Contains the data that makes up an operations.
 
-    TODO: implement as double-linked list?
+    Operations within a block form an intrusive doubly-linked list: each operation holds
+    a pointer to its previous and next sibling, which the parent block maintains. This
+    mirrors MLIR's ``llvm::ilist`` and makes insertion and removal O(1).
+
+    The core fields are stored in ``__slots__`` so that operations don't carry a
+    per-instance ``__dict__``, and the operands, results and regions, which are fixed at
+    construction, are stored in tuples. Subclasses should declare ``__slots__ = ()`` to
+    keep the compact layout.
     """
 
+    __slots__ = (
+        "operands",
+        "attributes",
+        "regions",
+        "parent",
+        "results",
+        "block_operands",
+        "_prev",
+        "_next",
+        "_order_index",
+    )
+
+    operation_name: ClassVar[str | None] = None
+    """The name of the operation in the form ``dialect.operation``. Classes that set this
+    are registered, see :func:`lookup_operation`."""
+
     def __init__(
         self,
         operands: list[Value],
         attributes: dict[str, AttributeBase],
         regions: list["Region"] | None = None,
         parent: "Block | None" = None,
+        successors: list["Block"] | None = None,
     ):
-        self.operands: list[OpOperand] = [
-            OpOperand(self, operand, idx) for idx, operand in enumerate(operands)
-        ]
+        self.operands: tuple[OpOperand, ...] = tuple(
+            [OpOperand(self, operand, idx) for idx, operand in enumerate(operands)]
+        )
         self.attributes: dict[str, AttributeBase] = attributes
-        self.regions: list["Region"] = regions or []
+        self.regions: tuple["Region", ...] = tuple(regions) if regions else ()
         self.parent: "Block | None" = parent
+        self.block_operands: tuple[BlockOperand, ...] = tuple(
+            [
+                BlockOperand(self, block, idx)
+                for idx, block in enumerate(successors or [])
+            ]
+        )
+        self._prev: "Operation | None" = None
+        self._next: "Operation | None" = None
+        self._order_index: int = INVALID_ORDER_INDEX
         # TODO: think about what this should be...
-        self.results = self.create_results(operands=operands, attributes=attributes)
+        self.results: tuple[OpResult, ...] = tuple(
+            self.create_results(operands=operands, attributes=attributes)
+        )
+
+    @classmethod
+    def get_operation_name(cls) -> str:
+        """Returns the name of the operation, falling back to the class name for
+        operations that don't declare one."""
+        return cls.operation_name or cls.__name__
+
+    def __getstate__(self):
+        # Siblings are relinked by the owning region, see Region.__getstate__.
+        return get_slot_state(self, exclude=("_prev", "_next", "_order_index"))
+
+    def __setstate__(self, state):
+        set_slot_state(self, state)
+        self._order_index = INVALID_ORDER_INDEX
+        # The owning region may already have relinked this operation.
+        if not hasattr(self, "_prev"):
+            self._prev = None
+            self._next = None
+
+    @property
+    def successors(self) -> tuple["Block", ...]:
+        """Returns the successor blocks of the operation, in order."""
+        return tuple(block_operand.block for block_operand in self.block_operands)
+
+    def set_successor(self, index: int, block: "Block"):
+        """Replaces the successor at the given index, keeping the predecessors of both the
+        old and new block up to date."""
+        self.block_operands[index].set(block)
+
+    @property
+    def prev_node(self) -> "Operation | None":
+        """Returns the previous operation in the parent block, or None if this is the
+        first operation or the operation is not in a block."""
+        return self._prev
+
+    @property
+    def next_node(self) -> "Operation | None":
+        """Returns the next operation in the parent block, or None if this is the last
+        operation or the operation is not in a block."""
+        return self._next
+
+    def is_before_in_block(self, other: "Operation") -> bool:
+        """Returns True if this operation comes before the other operation, which must be
+        in the same block.
+
+        Each operation caches an order index within its block. Indices are assigned
+        lazily, with gaps, the first time the block is queried; insertions then take an
+        index between their neighbours, and the block is only renumbered once a gap has run
+        out. This makes the query O(1) amortised instead of a walk of the block.
+        """
+        block = self.parent
+        if block is None or other.parent is not block:
+            raise ValueError(
+                f"Operations {self} and {other} are not in the same block, cannot compare "
+                f"their order."
+            )
+        if not block._order_valid:
+            block._recompute_order()
+        return self._order_index < other._order_index
+
+    def drop_all_references(self):
+        """Drops the uses held by the operands and successors of this operation and of
+        every operation nested within it, so that the values and blocks they used no
+        longer see them as users."""
+        operations = [self]
+        while operations:
+            operation = operations.pop()
+            for operand in operation.operands:
+                if operand.value is not None:
+                    operand.value.remove_use(operand)
+                    operand.value = None
+            for block_operand in operation.block_operands:
+                if block_operand.block is not None:
+                    block_operand.block.remove_use(block_operand)
+                    block_operand.block = None
+            for region in operation.regions:
+                for block in region:
+                    operations.extend(block)
+
+    def erase_operands(self, indices: Iterable[int]):
+        """Removes the operands at the given indices in one pass, dropping their uses and
+        renumbering the remaining operands."""
+        indices = set(indices)
+        if not indices:
+            return
+        operands = []
+        for operand in self.operands:
+            if operand.index in indices:
+                if operand.value is not None:
+                    operand.value.remove_use(operand)
+                    operand.value = None
+            else:
+                operand.index = len(operands)
+                operands.append(operand)
+        self.operands = tuple(operands)
+        notify_operations_modified([self])
+
+    def erase(self):
+        """Removes the operation from its block, if any, and drops all of its references.
+        The results of the operation must not have any uses."""
+        for result in self.results:
+            if not result.use_empty:
+                raise ValueError(
+                    f"Cannot erase {self.get_operation_name()}: result {result.index} "
+                    f"still has uses."
+                )
+        if self.parent is not None:
+            self.parent.remove_operation(self)
+        self.drop_all_references()
+
+    def replace_all_uses_with(self, values: "Operation | Sequence[Value]"):
+        """Replaces all uses of the results of this operation with the given values, or
+        with the results of another operation. Listeners are notified once for the whole
+        replacement."""
+        if isinstance(values, Operation):
+            values = values.results
+        if len(values) != len(self.results):
+            raise ValueError(
+                f"Cannot replace {len(self.results)} results with {len(values)} values."
+            )
+        users = []
+        for result, value in zip(self.results, values):
+            users.extend(result._take_uses(value, None))
+        notify_operations_modified(users)
+
+    def fold(
+        self, operand_constants: list[AttributeBase | None]
+    ) -> "list[Value | AttributeBase] | None":
+        """Attempts to fold the operation, given the constant value of each operand, or
+        None for operands that are not constant.
+
+        Returns None if the operation can't be folded. Otherwise, returns either one
+        replacement per result, each an existing value or a constant attribute, or an
+        empty list if the operation was folded in place, e.g. by changing its operands.
+        Folding must not create or erase operations: constants are materialized by the
+        caller with :meth:`materialize_constant`.
+        """
+        return None
+
+    @classmethod
+    def materialize_constant(
+        cls, value: AttributeBase, type: "TypeBase"
+    ) -> "Operation | None":
+        """Builds an operation producing a constant value of the given type, for a
+        constant returned by :meth:`fold`. In MLIR this is a dialect hook; here it is
+        looked up on the class of the folded operation. Returns None if the constant
+        can't be materialized, in which case the fold is abandoned."""
+        return None
+
+    @classmethod
+    def get_canonicalization_patterns(cls) -> list["RewritePattern"]:
+        """Returns the patterns that canonicalize operations of this class."""
+        return []
 
     @abstractmethod
     def create_results(self, **kwargs) -> list[OpResult]:
@@ -0,0 +1,588 @@
+import mmap
+import re
+from enum import IntEnum
+from pathlib import Path
+from typing import NamedTuple
+
+from mlir.context import MLIRContext
+from mlir.ir.attributes import (
+    AttributeBase,
+    FloatAttribute,
+    IndexAttribute,
+    IntegerAttribute,
+)
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, lookup_operation
+from mlir.ir.regions import Region
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.types import (
+    FloatType,
+    FloatTypeKind,
+    IndexType,
+    IntegerType,
+    SignednessSemantics,
+    TypeBase,
+)
+from mlir.ir.value import BlockArgument, Value
+from mlir.ir.verifier import verify
+from mlir.utils.scoped_hash_table import ScopedHashTable
+from mlir.utils.validator import deferred_validation
+
+
+class TokenKind(IntEnum):
+    EOF = 0
+    PERCENT_IDENTIFIER = 1
+    CARET_IDENTIFIER = 2
+    STRING = 3
+    ARROW = 4
+    FLOAT = 5
+    INTEGER = 6
+    BARE_IDENTIFIER = 7
+    L_PAREN = 8
+    R_PAREN = 9
+    L_SQUARE = 10
+    R_SQUARE = 11
+    L_BRACE = 12
+    R_BRACE = 13
+    COMMA = 14
+    EQUAL = 15
+    COLON = 16
+
+
+class Token(NamedTuple):
+    """A token, as a span of the buffer being lexed."""
+
+    kind: TokenKind
+    start: int
+    end: int
+
+
+class ParseError(ValueError):
+    """Raised for malformed input, with the line and column it was found at."""
+
+    def __init__(self, message: str, line: int, column: int):
+        self.line = line
+        self.column = column
+        super().__init__(f"{line}:{column}: {message}")
+
+
+_SKIP = re.compile(rb"[ \t\r\n]*(?://[^\n]*[ \t\r\n]*)*")
+_TOKEN = re.compile(
+    _SKIP.pattern + rb"(?:"
+    rb"(%(?:[0-9]+|[A-Za-z_$.\-][\w$.\-]*))"
+    rb"|(\^[\w$.\-]+)"
+    rb'|("(?:[^"\\\n]|\\.)*")'
+    rb"|(->)"
+    rb"|(-?(?:[0-9]+\.[0-9]*(?:[eE][-+]?[0-9]+)?|[0-9]+[eE][-+]?[0-9]+"
+    rb"|(?:inf|nan)(?![\w$.])))"
+    rb"|(-?(?:0x[0-9a-fA-F]+|[0-9]+))"
+    rb"|([A-Za-z_][\w$.]*)"
+    rb"|([()\[\]{},=:])"
+    rb")"
+)
+"""Whitespace and comments, followed by one token. The number of the group that matched
+is the value of its :class:`TokenKind`, except that all punctuation shares the last
+group."""
+
+_FUNCTION_TYPE = re.compile(
+    rb"\(([\w. ,]*)\)[ \t]*->[ \t]*(?:\(([\w. ,]*)\)|([A-Za-z_][\w.]*))"
+)
+"""A function type made up of bare type names, e.g. ``(i32, i32) -> i32``."""
+
+_PUNCTUATION_GROUP = 8
+_PUNCTUATION = {
+    ord("("): TokenKind.L_PAREN,
+    ord(")"): TokenKind.R_PAREN,
+    ord("["): TokenKind.L_SQUARE,
+    ord("]"): TokenKind.R_SQUARE,
+    ord("{"): TokenKind.L_BRACE,
+    ord("}"): TokenKind.R_BRACE,
+    ord(","): TokenKind.COMMA,
+    ord("="): TokenKind.EQUAL,
+    ord(":"): TokenKind.COLON,
+}
+_KINDS = tuple(TokenKind)
+_new_token = tuple.__new__
+
+
+class Lexer:
+    """Splits a buffer of MLIR text into tokens.
+
+    The buffer is scanned with a single precompiled pattern that matches whitespace,
+    comments and the next token, and the group that matched gives the kind of the token.
+    Scanning runs in the regular expression engine over the bytes or memory-mapped file
+    directly, without decoding or copying it. Tokens only record their span; the parser
+    decodes the spelling of those it needs.
+
+    :param buffer: The bytes to lex.
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap):
+        self.buffer = buffer
+        self.position = 0
+        self.length = len(buffer)
+        self._matches = _TOKEN.finditer(buffer)
+
+    def lex(self) -> Token:
+        """Returns the next token, or an EOF token at the end of the buffer."""
+        match = next(self._matches, None)
+        # The scan skips characters that don't start a token, so check that the match
+        # picks up where the previous token ended.
+        if match is None or match.start() != self.position:
+            start = _SKIP.match(self.buffer, self.position).end()
+            if start < self.length:
+                character = chr(self.buffer[start])
+                raise self.error(f"Unexpected character {character!r}.", start)
+            self.position = start
+            return _new_token(Token, (TokenKind.EOF, start, start))
+        group = match.lastindex
+        start = match.start(group)
+        self.position = match.end()
+        if group == _PUNCTUATION_GROUP:
+            kind = _PUNCTUATION[self.buffer[start]]
+        else:
+            kind = _KINDS[group]
+        return _new_token(Token, (kind, start, self.position))
+
+    def reset(self, position: int):
+        """Continues lexing from a position in the buffer."""
+        self.position = position
+        self._matches = _TOKEN.finditer(self.buffer, position)
+
+    def spelling(self, token: Token) -> str:
+        """Returns the text of a token."""
+        return self.buffer[token.start : token.end].decode()
+
+    def error(self, message: str, position: int) -> ParseError:
+        """Returns an error for the given position in the buffer."""
+        line_start = self.buffer.rfind(b"\n", 0, position) + 1
+        line = self.buffer[:line_start].count(b"\n") + 1
+        return ParseError(message, line, position - line_start + 1)
+
+
+_INTEGER_TYPE = re.compile(r"([su]?)i([1-9][0-9]*)")
+_SIGNEDNESS = {
+    "": SignednessSemantics.SIGNLESS,
+    "s": SignednessSemantics.SIGNED,
+    "u": SignednessSemantics.UNSIGNED,
+}
+_FLOAT_KINDS = {kind.value: kind for kind in FloatTypeKind}
+
+
+class Parser:
+    """Parses operations in the generic form printed by :class:`~mlir.ir.printer.Printer`.
+
+    In MLIR this is the ``OperationParser``. Operations are looked up by name in the
+    registry, see :func:`~mlir.ir.operations.lookup_operation`, and types and attributes
+    are uniqued in the context through ``get``, with each distinct spelling of a type
+    looked up once. Values can be used before they are defined, e.g. around a loop: a
+    placeholder is created at the first use and replaced once the definition is parsed.
+    Names are scoped to their region, and regions of operations that are isolated from
+    above can't see the names outside them.
+
+    :param lexer: The lexer over the input.
+    :param context: The context types and attributes are uniqued in.
+    """
+
+    def __init__(self, lexer: Lexer, context: MLIRContext):
+        self.lexer = lexer
+        self.context = context
+        self.token = lexer.lex()
+        self._types: dict[str, TypeBase] = {}
+        self._signatures: dict[bytes, tuple[list[TypeBase], list[TypeBase]]] = {}
+        self._values: ScopedHashTable[str, Value] = ScopedHashTable()
+        self._forward_references: list[dict[str, BlockArgument]] = []
+        self._blocks: list[dict[str, Block]] = []
+        self._defined_blocks: list[set[Block]] = []
+
+    def parse_module(self) -> ModuleOperation:
+        """Parses operations up to the end of the input. A single top-level module is
+        returned as is, otherwise the operations are wrapped in a new module."""
+        operations = []
+        with self._values.scope(isolated=True):
+            self._forward_references.append({})
+            while self.token.kind != TokenKind.EOF:
+                operations.append(self.parse_operation())
+            self._check_forward_references()
+        if len(operations) == 1 and isinstance(operations[0], ModuleOperation):
+            return operations[0]
+        module = ModuleOperation.build()
+        block = Block()
+        module.regions[0].push_end(block)
+        for operation in operations:
+            block.push_end(operation)
+        return module
+
+    def parse_operation(self) -> Operation:
+        """Parses an operation in the generic form, with its regions."""
+        result_tokens = []
+        if self.token.kind == TokenKind.PERCENT_IDENTIFIER:
+            result_tokens.append(self._consume())
+            while self._consume_if(TokenKind.COMMA):
+                result_tokens.append(self._expect(TokenKind.PERCENT_IDENTIFIER))
+            self._expect(TokenKind.EQUAL)
+
+        name_token = self._expect(TokenKind.STRING)
+        name = self.lexer.spelling(name_token)[1:-1]
+        operation_class = lookup_operation(name)
+        if operation_class is None:
+            raise self._error(f"Unknown operation '{name}'.", name_token)
+
+        self._expect(TokenKind.L_PAREN)
+        operand_tokens = self._parse_list(TokenKind.R_PAREN, self._parse_value_use)
+
+        successors = []
+        if self._consume_if(TokenKind.L_SQUARE):
+            successors = self._parse_list(TokenKind.R_SQUARE, self._parse_successor)
+
+        regions = []
+        if self.token.kind == TokenKind.L_PAREN:
+            self._consume()
+            isolated = issubclass(operation_class, IsolatedFromAbove)
+            regions.append(self._parse_region(isolated))
+            while self._consume_if(TokenKind.COMMA):
+                regions.append(self._parse_region(isolated))
+            self._expect(TokenKind.R_PAREN)
+
+        attributes = {}
+        if self._consume_if(TokenKind.L_BRACE):
+            self._parse_list(
+                TokenKind.R_BRACE, lambda: self._parse_named_attribute(attributes)
+            )
+
+        self._expect(TokenKind.COLON)
+        type_token = self.token
+        operand_types, result_types = self._parse_function_type()
+        if len(operand_types) != len(operand_tokens):
+            raise self._error(
+                f"'{name}' has {len(operand_tokens)} operands, but its type lists "
+                f"{len(operand_types)}.",
+                type_token,
+            )
+        operands = [
+            self._resolve_value(token, type)
+            for token, type in zip(operand_tokens, operand_types)
+        ]
+
+        try:
+            operation = operation_class(
+                operands=operands,
+                attributes=attributes,
+                regions=regions,
+                successors=successors,
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise self._error(f"Failed to build '{name}': {error!r}", name_token)
+        for region in regions:
+            region.parent = operation
+
+        results = operation.results
+        if (
+            len(result_types) != len(results)
+            or (result_tokens and len(result_tokens) != len(results))
+            or any(
+                result.type is not type and result.type != type
+                for result, type in zip(results, result_types)
+            )
+        ):
+            raise self._error(
+                f"'{name}' produces ({', '.join(str(r.type) for r in results)}), which "
+                f"doesn't match its parsed results.",
+                name_token,
+            )
+        for token, result in zip(result_tokens, results):
+            self._define_value(token, result)
+        return operation
+
+    def _parse_region(self, isolated: bool) -> Region:
+        self._expect(TokenKind.L_BRACE)
+        region = Region()
+        self._blocks.append({})
+        self._defined_blocks.append(set())
+        if isolated:
+            self._forward_references.append({})
+        with self._values.scope(isolated=isolated):
+            if self.token.kind not in (TokenKind.R_BRACE, TokenKind.CARET_IDENTIFIER):
+                block = Block()
+                region.push_end(block)
+                self._parse_block_body(block)
+            while self.token.kind == TokenKind.CARET_IDENTIFIER:
+                region.push_end(self._parse_block())
+            self._expect(TokenKind.R_BRACE)
+            if isolated:
+                self._check_forward_references()
+
+        self._defined_blocks.pop()
+        for name, block in self._blocks.pop().items():
+            if block.owner is None:
+                raise self._error(f"Reference to an undefined block '{name}'.")
+        return region
+
+    def _parse_block(self) -> Block:
+        token = self._consume()
+        name = self.lexer.spelling(token)
+        block = self._get_block(name)
+        if block in self._defined_blocks[-1]:
+            raise self._error(f"Redefinition of block '{name}'.", token)
+        self._defined_blocks[-1].add(block)
+
+        if self._consume_if(TokenKind.L_PAREN):
+            self._parse_list(
+                TokenKind.R_PAREN, lambda: self._parse_block_argument(block)
+            )
+        self._expect(TokenKind.COLON)
+        self._parse_block_body(block)
+        return block
+
+    def _parse_block_argument(self, block: Block):
+        token = self._expect(TokenKind.PERCENT_IDENTIFIER)
+        self._expect(TokenKind.COLON)
+        block.add_argument(self._parse_type())
+        self._define_value(token, block._arguments[-1])
+
+    def _parse_block_body(self, block: Block):
+        while self.token.kind not in (TokenKind.R_BRACE, TokenKind.CARET_IDENTIFIER):
+            if self.token.kind == TokenKind.EOF:
+                raise self._error("Expected '}' to close the region.")
+            block.push_end(self.parse_operation())
+
+    def _parse_value_use(self) -> Token:
+        return self._expect(TokenKind.PERCENT_IDENTIFIER)
+
+    def _parse_successor(self) -> Block:
+        token = self._expect(TokenKind.CARET_IDENTIFIER)
+        if not self._blocks:
+            raise self._error("Successors are only allowed within a region.", token)
+        return self._get_block(self.lexer.spelling(token))
+
+    def _get_block(self, name: str) -> Block:
+        blocks = self._blocks[-1]
+        block = blocks.get(name)
+        if block is None:
+            block = blocks[name] = Block()
+        return block
+
+    def _resolve_value(self, token: Token, type: TypeBase) -> Value:
+        name = self.lexer.spelling(token)
+        value = self._values.lookup(name)
+        if value is None:
+            forward_references = self._forward_references[-1]
+            value = forward_references.get(name)
+            if value is None:
+                value = forward_references[name] = BlockArgument(type, None, None)
+        if value.type is not type and value.type != type:
+            raise self._error(
+                f"'{name}' is used with type {type}, but has type {value.type}.", token
+            )
+        return value
+
+    def _define_value(self, token: Token, value: Value):
+        name = self.lexer.spelling(token)
+        if self._values.lookup(name) is not None:
+            raise self._error(f"Redefinition of value '{name}'.", token)
+        self._values.insert(name, value)
+        placeholder = self._forward_references[-1].pop(name, None)
+        if placeholder is not None:
+            if placeholder.type != value.type:
+                raise self._error(
+                    f"'{name}' is defined with type {value.type}, but was used with "
+                    f"type {placeholder.type}.",
+                    token,
+                )
+            placeholder.replace_all_uses_with(value)
+
+    def _check_forward_references(self):
+        forward_references = self._forward_references.pop()
+        if forward_references:
+            name = next(iter(forward_references))
+            raise self._error(f"Use of an undefined value '{name}'.")
+
+    def _parse_named_attribute(self, attributes: dict[str, AttributeBase]):
+        token = self._consume()
+        if token.kind == TokenKind.STRING:
+            name = self.lexer.spelling(token)[1:-1]
+        elif token.kind == TokenKind.BARE_IDENTIFIER:
+            name = self.lexer.spelling(token)
+        else:
+            raise self._error("Expected an attribute name.", token)
+        if name in attributes:
+            raise self._error(f"Duplicate attribute '{name}'.", token)
+        self._expect(TokenKind.EQUAL)
+        attributes[name] = self.parse_attribute()
+
+    def parse_attribute(self) -> AttributeBase:
+        """Parses a builtin integer, index or float attribute, with an optional type.
+        Untyped integers are ``i64``, untyped floats ``f64``, and ``true`` and ``false``
+        are ``i1``."""
+        token = self._consume()
+        spelling = self.lexer.spelling(token)
+        if token.kind == TokenKind.INTEGER:
+            value = int(spelling, 0)
+            type = self._parse_optional_type(IntegerType.get(self.context, 64))
+        elif token.kind == TokenKind.FLOAT:
+            value = float(spelling)
+            type = self._parse_optional_type(
+                FloatType.get(self.context, FloatTypeKind.F64)
+            )
+        elif spelling in ("true", "false"):
+            value = int(spelling == "true")
+            type = self._parse_optional_type(IntegerType.get(self.context, 1))
+        elif spelling == "__elided__":
+            raise self._error("Elided attributes can't be parsed.", token)
+        else:
+            raise self._error(f"Expected an attribute, found '{spelling}'.", token)
+
+        try:
+            if isinstance(type, IntegerType) and isinstance(value, int):
+                return IntegerAttribute.get(self.context, type, value)
+            if isinstance(type, IndexType) and isinstance(value, int):
+                return IndexAttribute.get(self.context, type, value)
+            if isinstance(type, FloatType):
+                return FloatAttribute.get(self.context, type, float(value))
+        except ValueError as error:
+            raise self._error(str(error), token) from None
+        raise self._error(f"Invalid type {type} for attribute '{spelling}'.", token)
+
+    def _parse_optional_type(self, default: TypeBase) -> TypeBase:
+        if self._consume_if(TokenKind.COLON):
+            return self._parse_type()
+        return default
+
+    def _parse_function_type(self) -> tuple[list[TypeBase], list[TypeBase]]:
+        # Operations of the same kind tend to repeat the same signature, so a signature
+        # made up of plain types is matched in one go and its types are cached by its
+        # spelling. Anything else, including malformed input, takes the token path.
+        match = _FUNCTION_TYPE.match(self.lexer.buffer, self.token.start)
+        if match is not None:
+            signature = self._signatures.get(match.group())
+            if signature is None:
+                signature = self._parse_signature(match)
+            self.lexer.reset(match.end())
+            self.token = self.lexer.lex()
+            return signature
+
+        self._expect(TokenKind.L_PAREN)
+        inputs = self._parse_list(TokenKind.R_PAREN, self._parse_type)
+        self._expect(TokenKind.ARROW)
+        if self._consume_if(TokenKind.L_PAREN):
+            return inputs, self._parse_list(TokenKind.R_PAREN, self._parse_type)
+        return inputs, [self._parse_type()]
+
+    def _parse_signature(
+        self, match: re.Match
+    ) -> tuple[list[TypeBase], list[TypeBase]]:
+        position = match.start()
+        inputs, results, result = match.groups()
+        signature = (
+            self._parse_type_list(inputs, position),
+            self._parse_type_list(results if result is None else result, position),
+        )
+        self._signatures[match.group()] = signature
+        return signature
+
+    def _parse_type_list(self, spellings: bytes, position: int) -> list[TypeBase]:
+        types = []
+        if not spellings.strip():
+            return types
+        for spelling in spellings.split(b","):
+            spelling = spelling.strip().decode()
+            type = self._types.get(spelling)
+            if type is None:
+                token = Token(TokenKind.BARE_IDENTIFIER, position, position)
+                type = self._types[spelling] = self._lookup_type(spelling, token)
+            types.append(type)
+        return types
+
+    def _parse_type(self) -> TypeBase:
+        token = self._expect(TokenKind.BARE_IDENTIFIER)
+        spelling = self.lexer.spelling(token)
+        type = self._types.get(spelling)
+        if type is None:
+            type = self._types[spelling] = self._lookup_type(spelling, token)
+        return type
+
+    def _lookup_type(self, spelling: str, token: Token) -> TypeBase:
+        if spelling == "index":
+            return IndexType.get(self.context)
+        kind = _FLOAT_KINDS.get(spelling)
+        if kind is not None:
+            return FloatType.get(self.context, kind)
+        match = _INTEGER_TYPE.fullmatch(spelling)
+        if match is not None:
+            signedness = _SIGNEDNESS[match.group(1)]
+            return IntegerType.get(self.context, int(match.group(2)), signedness)
+        raise self._error(f"Unknown type '{spelling}'.", token)
+
+    def _parse_list(self, close: TokenKind, parse_element) -> list:
+        """Parses comma-separated elements up to a closing token, which is consumed."""
+        elements = []
+        if self._consume_if(close):
+            return elements
+        elements.append(parse_element())
+        while self._consume_if(TokenKind.COMMA):
+            elements.append(parse_element())
+        self._expect(close)
+        return elements
+
+    def _consume(self) -> Token:
+        token = self.token
+        self.token = self.lexer.lex()
+        return token
+
+    def _consume_if(self, kind: TokenKind) -> bool:
+        if self.token.kind == kind:
+            self.token = self.lexer.lex()
+            return True
+        return False
+
+    def _expect(self, kind: TokenKind) -> Token:
+        token = self.token
+        if token.kind != kind:
+            found = (
+                "end of input"
+                if token.kind == TokenKind.EOF
+                else f"'{self.lexer.spelling(token)}'"
+            )
+            raise self._error(f"Expected {kind.name.lower()}, found {found}.", token)
+        self.token = self.lexer.lex()
+        return token
+
+    def _error(self, message: str, token: Token | None = None) -> ParseError:
+        token = token or self.token
+        return self.lexer.error(message, token.start)
+
+
+def parse_source_string(
+    source: str, context: MLIRContext, verify_after_parse: bool = True
+) -> ModuleOperation:
+    """Parses IR in the generic form from a string. See :func:`parse_source_file`."""
+    return _parse(source.encode(), context, verify_after_parse)
+
+
+def parse_source_file(
+    path: str | Path, context: MLIRContext, verify_after_parse: bool = True
+) -> ModuleOperation:
+    """Parses IR in the generic form from a file, which is memory-mapped rather than read
+    into memory.
+
+    Operations are built with validation deferred, and the whole module is verified once
+    at the end, unless ``verify_after_parse`` is False. If the file holds a single
+    ``builtin.module`` it is returned, otherwise its top-level operations are wrapped in
+    a new module.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return _parse(b"", context, verify_after_parse)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _parse(buffer, context, verify_after_parse)
+
+
+def _parse(
+    buffer: bytes | mmap.mmap, context: MLIRContext, verify_after_parse: bool
+) -> ModuleOperation:
+    with deferred_validation():
+        module = Parser(Lexer(buffer), context).parse_module()
+    if verify_after_parse:
+        verify(module, context)
+    return module
@@ -0,0 +1,180 @@
+import io
+import sys
+from typing import TextIO
+
+from mlir.ir.attributes import AttributeBase
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.value import BlockArgument, Value
+
+ELIDED_ATTRIBUTE = "__elided__"
+"""Printed in place of the value of an attribute that is elided for its size."""
+
+
+class _NameScope:
+    """The names given to values and blocks within one region that is isolated from
+    above. Scopes of nested isolated regions start numbering from zero again."""
+
+    __slots__ = ("values", "blocks", "next_value", "next_argument")
+
+    def __init__(self):
+        self.values: dict[Value, str] = {}
+        self.blocks: dict[Block, str] = {}
+        self.next_value = 0
+        self.next_argument = 0
+
+
+class Printer:
+    """Prints operations in the generic form of the MLIR textual format.
+
+    In MLIR this is ``AsmPrinter``. Values are named ``%N``, and the arguments of entry
+    blocks ``%argN``, in the order they are first printed. Blocks are named ``^bbN`` in
+    the order they appear in their region, which is numbered before it is printed so that
+    branches can refer to blocks further down. The label of an entry block is only
+    printed if it has arguments or is empty, so that an empty block can be told apart from
+    an empty region. Numbering restarts inside operations that are isolated from above.
+    All names are assigned in the same pass that prints the IR, and the output is written
+    to the stream one line at a time.
+
+    :param stream: The text stream to write to.
+    :param elide_attributes_larger_than: If given, attributes whose printed value is
+        longer than this many characters are printed as ``__elided__`` followed by their
+        type.
+    """
+
+    def __init__(self, stream: TextIO, elide_attributes_larger_than: int | None = None):
+        self.stream = stream
+        self.elide_attributes_larger_than = elide_attributes_larger_than
+        self._scopes: list[_NameScope] = [_NameScope()]
+
+    def print_operation(self, operation: Operation, indent: int = 0):
+        """Prints an operation and everything nested in it, followed by a newline."""
+        self._print_operation(operation, indent)
+        self.stream.write("\n")
+
+    def _print_operation(self, operation: Operation, indent: int):
+        parts = [" " * indent]
+        if operation.results:
+            names = ", ".join(self._value_name(result) for result in operation.results)
+            parts.append(f"{names} = ")
+        parts.append(f'"{operation.get_operation_name()}"(')
+        parts.append(", ".join(self._operand_name(o.value) for o in operation.operands))
+        parts.append(")")
+        if operation.block_operands:
+            successors = ", ".join(
+                self._block_name(block_operand.block)
+                for block_operand in operation.block_operands
+            )
+            parts.append(f"[{successors}]")
+
+        if operation.regions:
+            parts.append(" (")
+            self.stream.write("".join(parts))
+            isolated = isinstance(operation, IsolatedFromAbove)
+            if isolated:
+                self._scopes.append(_NameScope())
+            for index, region in enumerate(operation.regions):
+                if index:
+                    self.stream.write(", ")
+                self._print_region(region, indent)
+            if isolated:
+                self._scopes.pop()
+            parts = [")"]
+
+        if operation.attributes:
+            attributes = ", ".join(
+                f"{name} = {self._attribute(attribute)}"
+                for name, attribute in operation.attributes.items()
+            )
+            parts.append(f" {{{attributes}}}")
+        operand_types = ", ".join(
+            "<<NULL TYPE>>" if o.value is None else str(o.value.type)
+            for o in operation.operands
+        )
+        parts.append(f" : ({operand_types}) -> {self._result_types(operation)}")
+        self.stream.write("".join(parts))
+
+    def _print_region(self, region: Region, indent: int):
+        self.stream.write("{\n")
+        scope = self._scopes[-1]
+        for index, block in enumerate(region):
+            scope.blocks[block] = f"^bb{index}"
+        for block in region:
+            if block is not region.front or block._arguments or block.is_empty:
+                self._print_block_header(block, indent)
+            for operation in block:
+                self.print_operation(operation, indent + 2)
+        self.stream.write(" " * indent + "}")
+
+    def _print_block_header(self, block: Block, indent: int):
+        line = " " * indent + self._block_name(block)
+        if block._arguments:
+            arguments = ", ".join(
+                f"{self._value_name(argument)}: {argument.type}"
+                for argument in block._arguments
+            )
+            line += f"({arguments})"
+        self.stream.write(line + ":\n")
+
+    def _value_name(self, value: Value) -> str:
+        scope = self._scopes[-1]
+        name = scope.values.get(value)
+        if name is None:
+            if _is_entry_argument(value):
+                name = f"%arg{scope.next_argument}"
+                scope.next_argument += 1
+            else:
+                name = f"%{scope.next_value}"
+                scope.next_value += 1
+            scope.values[value] = name
+        return name
+
+    def _operand_name(self, value: Value | None) -> str:
+        return "<<NULL VALUE>>" if value is None else self._value_name(value)
+
+    def _block_name(self, block: Block | None) -> str:
+        if block is None:
+            return "<<NULL BLOCK>>"
+        return self._scopes[-1].blocks.get(block, "<<UNKNOWN BLOCK>>")
+
+    def _attribute(self, attribute: AttributeBase) -> str:
+        limit = self.elide_attributes_larger_than
+        if limit is not None and len(str(attribute.value)) > limit:
+            return f"{ELIDED_ATTRIBUTE} : {attribute.attribute_type}"
+        return str(attribute)
+
+    def _result_types(self, operation: Operation) -> str:
+        types = [str(result.type) for result in operation.results]
+        if len(types) == 1:
+            return types[0]
+        return f"({', '.join(types)})"
+
+
+def _is_entry_argument(value: Value) -> bool:
+    if not isinstance(value, BlockArgument) or value.owner is None:
+        return False
+    region = value.owner.owner
+    return region is None or region.front is value.owner
+
+
+def print_operation(
+    operation: Operation,
+    stream: TextIO | None = None,
+    elide_attributes_larger_than: int | None = None,
+):
+    """Prints an operation in the generic form to a stream, by default standard output.
+    See :class:`Printer`."""
+    printer = Printer(stream or sys.stdout, elide_attributes_larger_than)
+    printer.print_operation(operation)
+
+
+def operation_to_string(
+    operation: Operation, elide_attributes_larger_than: int | None = None
+) -> str:
+    """Returns the generic form of an operation as a string. Prefer
+    :func:`print_operation` for large IR."""
+    stream = io.StringIO()
+    print_operation(operation, stream, elide_attributes_larger_than)
+    return stream.getvalue()
@@ -1,20 +1,113 @@
+from abc import ABC, abstractmethod
+from typing import Iterator
+
 from mlir.ir.blocks import Block
 from mlir.ir.operations import Operation
 
 
+class LazyBody(ABC):
+    """The body of one or more regions that is kept in an encoded form, e.g. a range of a
+    bytecode file, until it is first accessed. The regions of an operation share one lazy
+    body, and are loaded and dropped together."""
+
+    @property
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        """Returns True if the body has been decoded into its regions."""
+        pass
+
+    @abstractmethod
+    def load(self):
+        """Decodes the body into its regions, if it is not loaded already."""
+        pass
+
+    @abstractmethod
+    def drop(self):
+        """Discards the decoded blocks of the regions, which are decoded again on the next
+        access."""
+        pass
+
+
 class Region:
-    """Stores a list of blocks."""
+    """Stores a list of blocks.
+
+    Like operations in a block, the blocks of a region form an intrusive doubly-linked
+    list threaded through :class:`Block`. This allows O(1) insertion and removal, and
+    moving a whole range of blocks into another region without unlinking them one by one.
+
+    A region may be given a :class:`LazyBody`, in which case its blocks are only decoded
+    the first time they are accessed, see :meth:`load_body` and :meth:`drop_body`.
+    """
+
+    __slots__ = ("_front", "_back", "_size", "_cfg_version", "parent", "_lazy_body")
 
-    def __init__(self, blocks: list[Block] = [], parent: Operation | None = None):
-        self._blocks = []
+    def __init__(
+        self,
+        blocks: list[Block] = [],
+        parent: Operation | None = None,
+        lazy_body: LazyBody | None = None,
+    ):
+        self._front: Block | None = None
+        self._back: Block | None = None
+        self._size = 0
+        self._cfg_version = 0
         self.parent = parent
+        self._lazy_body = lazy_body
 
         for block in blocks:
             self.push_end(block)
 
+    def __getstate__(self):
+        # Blocks and their operations are stored as lists rather than through their
+        # links, so unpickling does not recurse along the lists.
+        blocks = self.blocks
+        return self.parent, blocks, [block.operations for block in blocks]
+
+    def __setstate__(self, state):
+        parent, blocks, operations = state
+        self.parent = parent
+        self._lazy_body = None
+        self._front = None
+        self._back = None
+        self._size = 0
+        self._cfg_version = 0
+        prev_block = None
+        for block, block_operations in zip(blocks, operations):
+            block._prev = prev_block
+            if prev_block is not None:
+                prev_block._next = block
+            prev_block = block
+            block._relink(block_operations)
+        if prev_block is not None:
+            prev_block._next = None
+        self._front = blocks[0] if blocks else None
+        self._back = prev_block
+        self._size = len(blocks)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns False if the region has a lazy body that has not been decoded yet."""
+        return self._lazy_body is None or self._lazy_body.is_loaded
+
+    def load_body(self):
+        """Decodes the lazy body of the region now, rather than on first access. This has
+        no effect on regions that are already loaded."""
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+
+    def drop_body(self):
+        """Discards the blocks of a region with a lazy body to free their memory. They are
+        decoded again, without any changes made since, the next time they are accessed.
+        The other regions of the same operation are dropped with it."""
+        if self._lazy_body is None:
+            raise ValueError("Only regions with a lazy body can be dropped.")
+        self._lazy_body.drop()
+
     @property
     def size(self) -> int:
-        return len(self._blocks)
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+        return self._size
 
     @property
     def is_empty(self) -> bool:
@@ -22,42 +115,215 @@ class Region:
 
     @property
     def front(self) -> Block | None:
-        if self.is_empty:
-            return None
-        return self._blocks[0]
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+        return self._front
 
     @property
     def end(self) -> Block | None:
-        if self.is_empty:
-            return None
-        return self._blocks[self.size - 1]
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+        return self._back
+
+    @property
+    def cfg_version(self) -> int:
+        """A counter that changes whenever the control flow graph of the region may have
+        changed: when blocks are added or removed, or when an operation with successors
+        is added to or removed from one of its blocks. Analyses such as dominance compare
+        it to detect that their cached results are stale."""
+        return self._cfg_version
 
     @property
     def blocks(self) -> list[Block]:
-        return self._blocks
+        """Returns a snapshot of the blocks in the region as a list."""
+        return list(self)
 
     def push_front(self, block: Block) -> None:
         """Inserts a block to the front of the region."""
-        self.insert(0, block)
+        self.insert_after(None, block)
 
     def push_end(self, block: Block) -> None:
         """Inserts a block to the end of the region."""
-        self.insert(self.size, block)
+        self.insert_before(None, block)
 
     def insert(self, index: int, block: Block) -> None:
-        """Inserts a block at the specified index in the region."""
-        if block.owner is not None:
-            raise ValueError("Block is already owned by a region.")
-        self._blocks.insert(index, block)
-        block.owner = self
+        """Inserts a block at the specified index in the region, following the semantics
+        of ``list.insert``. Finding the index is O(n); see :meth:`insert_before` and
+        :meth:`insert_after` for O(1) insertion relative to another block."""
+        if index < 0:
+            index = max(index + self.size, 0)
+        anchor = self.front
+        for _ in range(index):
+            if anchor is None:
+                break
+            anchor = anchor._next
+        self.insert_before(anchor, block)
+
+    def insert_before(self, anchor: Block | None, block: Block) -> None:
+        """Inserts a block directly before the anchor block. If the anchor is None, the
+        block is inserted at the end of the region."""
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+        if anchor is None:
+            return self._link(block, self._back, None)
+        self._check_owns(anchor)
+        self._link(block, anchor._prev, anchor)
+
+    def insert_after(self, anchor: Block | None, block: Block) -> None:
+        """Inserts a block directly after the anchor block. If the anchor is None, the
+        block is inserted at the front of the region."""
+        if self._lazy_body is not None:
+            self._lazy_body.load()
+        if anchor is None:
+            return self._link(block, None, self._front)
+        self._check_owns(anchor)
+        self._link(block, anchor, anchor._next)
 
     def remove(self, block: Block):
         """Remove a block from the region."""
-        self._blocks.remove(block)
+        self._check_owns(block)
+        self._detach(block, block, 1)
         block.owner = None
 
     def clear(self):
         """Clear all of the blocks from the region."""
-        for block in self._blocks:
+        block = self.front
+        while block is not None:
+            next_block = block._next
             block.owner = None
-        self._blocks = []
+            block._prev = None
+            block._next = None
+            block = next_block
+        self._front = None
+        self._back = None
+        self._size = 0
+        self._cfg_version += 1
+
+    def splice(
+        self,
+        target: "Region",
+        before: Block | None = None,
+        first: Block | None = None,
+        last: Block | None = None,
+    ) -> None:
+        """Moves the blocks from ``first`` to ``last`` (inclusive) out of this region and
+        into the target region, directly before the block ``before``.
+
+        By default the whole region is moved, and blocks are placed at the end of the
+        target. Relinking the range is O(1); the owner of each moved block is updated in a
+        single pass over the range.
+        """
+        target.load_body()
+        if self.front is None:
+            return
+        first = self._front if first is None else first
+        last = self._back if last is None else last
+        self._check_owns(first)
+        self._check_owns(last)
+        if before is not None:
+            target._check_owns(before)
+
+        # Update the owners and count the range in one pass, checking that last is
+        # reachable from first (and that before is not within the range).
+        count = 0
+        block = first
+        while True:
+            if block is None or block is before:
+                self._reset_owners(first, block)
+                raise ValueError(
+                    "Cannot splice: the range of blocks is not contiguous, or the "
+                    "insertion point lies within it."
+                )
+            block.owner = target
+            count += 1
+            if block is last:
+                break
+            block = block._next
+
+        self._detach(first, last, count)
+        prev_block = target._back if before is None else before._prev
+        first._prev = prev_block
+        last._next = before
+        if prev_block is None:
+            target._front = first
+        else:
+            prev_block._next = first
+        if before is None:
+            target._back = last
+        else:
+            before._prev = last
+        target._size += count
+        target._cfg_version += 1
+
+    def take_body(self, other: "Region") -> None:
+        """Replaces the blocks of this region with the blocks of another region, leaving the
+        other region empty."""
+        self.clear()
+        other.splice(self)
+
+    def __iter__(self) -> Iterator[Block]:
+        """Iterates over the blocks in the region from front to back. The current block may
+        be removed or moved during iteration."""
+        block = self.front
+        while block is not None:
+            next_block = block._next
+            yield block
+            block = next_block
+
+    def __reversed__(self) -> Iterator[Block]:
+        """Iterates over the blocks in the region from back to front, with the same
+        guarantees as :meth:`__iter__`."""
+        block = self.end
+        while block is not None:
+            prev_block = block._prev
+            yield block
+            block = prev_block
+
+    def _check_owns(self, block: Block):
+        """Raises if the block is not in this region."""
+        if block.owner is not self:
+            raise ValueError(f"Block {block} does not belong to this region.")
+
+    def _link(self, block: Block, prev_block: Block | None, next_block: Block | None):
+        """Links a block between two neighbouring blocks in this region."""
+        if block.owner is not None:
+            raise ValueError("Block is already owned by a region.")
+        block.owner = self
+        block._prev = prev_block
+        block._next = next_block
+        if prev_block is None:
+            self._front = block
+        else:
+            prev_block._next = block
+        if next_block is None:
+            self._back = block
+        else:
+            next_block._prev = block
+        self._size += 1
+        self._cfg_version += 1
+
+    def _detach(self, first: Block, last: Block, count: int):
+        """Unlinks the contiguous range of blocks from first to last, without touching the
+        owners of the blocks."""
+        prev_block = first._prev
+        next_block = last._next
+        if prev_block is None:
+            self._front = next_block
+        else:
+            prev_block._next = next_block
+        if next_block is None:
+            self._back = prev_block
+        else:
+            next_block._prev = prev_block
+        first._prev = None
+        last._next = None
+        self._size -= count
+        self._cfg_version += 1
+
+    def _reset_owners(self, first: Block, stop: Block | None):
+        """Restores the owner of blocks from first up to (not including) stop after a
+        failed splice."""
+        block = first
+        while block is not None and block is not stop:
+            block.owner = self
+            block = block._next
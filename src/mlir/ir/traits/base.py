@@ -1,4 +1,8 @@
 class OpTrait:
-    """Base class for operation traits."""
+    """Base class for operation traits.
 
-    ...
+    Traits are mixed into operations, so they declare empty ``__slots__`` to avoid adding
+    a ``__dict__`` to the operation.
+    """
+
+    __slots__ = ()
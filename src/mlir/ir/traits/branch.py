@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterable
+
+from .base import OpTrait
+
+if TYPE_CHECKING:
+    from mlir.ir.attributes import AttributeBase
+    from mlir.ir.blocks import Block
+    from mlir.ir.operations import OpOperand
+
+
+class BranchOpInterface(OpTrait, ABC):
+    """Interface for terminators that forward some of their operands to the arguments of
+    their successor blocks.
+
+    In MLIR this is ``BranchOpInterface``. It lets transformations map block arguments
+    back to the values passed in by each predecessor, e.g. to remove unused arguments.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_successor_operands(self, index: int) -> tuple["OpOperand", ...]:
+        """Returns the operands forwarded to the arguments of the successor at the given
+        index, in argument order."""
+        pass
+
+    @abstractmethod
+    def erase_successor_operands(self, index: int, positions: Iterable[int]):
+        """Removes the operands forwarded to the given argument positions of the
+        successor at the given index."""
+        pass
+
+    def get_successor_for_operands(
+        self, operand_constants: list["AttributeBase | None"]
+    ) -> "Block | None":
+        """Returns the successor the branch is known to take, given the constant value of
+        each operand, or None for operands that are not constant. Returns None if the
+        successor can't be determined."""
+        return None
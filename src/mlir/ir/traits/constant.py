@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from mlir.utils.validator import validator
+
+from .base import OpTrait
+
+if TYPE_CHECKING:
+    from mlir.ir.operations import Operation
+
+
+class ConstantLike(OpTrait):
+    """Trait for operations that produce a single constant value, held in their
+    ``value`` attribute.
+
+    Constant-like operations are what folding reads its constant operands from, and what
+    it materializes when a fold produces a constant.
+    """
+
+    __slots__ = ()
+
+    @validator
+    def validate_constant_like(self: "Operation") -> "Operation":
+        if "value" not in self.attributes:
+            raise ValueError(
+                f"{self.__class__.__name__} is constant-like, but has no 'value' "
+                f"attribute."
+            )
+        if len(self.results) != 1:
+            raise ValueError(
+                f"{self.__class__.__name__} is constant-like, but has "
+                f"{len(self.results)} results."
+            )
+        return self
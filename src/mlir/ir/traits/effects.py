@@ -0,0 +1,17 @@
+from .base import OpTrait
+
+
+class NoMemoryEffect(OpTrait):
+    """Trait for operations that don't read or write memory, or have any other side
+    effect. Their results depend only on their operands and attributes, so duplicates can
+    be merged and unused ones erased."""
+
+    __slots__ = ()
+
+
+class Pure(NoMemoryEffect):
+    """Trait for operations that have no side effects and are always safe to execute,
+    e.g. to hoist out of a loop. In MLIR this is ``Pure``, which combines
+    ``NoMemoryEffect`` with ``AlwaysSpeculatable``."""
+
+    __slots__ = ()
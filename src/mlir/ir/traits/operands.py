@@ -16,6 +16,8 @@ def NOperands(n: int):
     class _NOperands(OpTrait):
         """Trait for operations with exactly `n` operands."""
 
+        __slots__ = ()
+
         @validator
         def validate_operands_have_correct_length(self: "Operation") -> "Operation":
             if len(self.operands) != n:
@@ -36,4 +38,4 @@ TwoOperands = NOperands(2)
 class VariadicOperands(OpTrait):
     """Trait for operations with a variadic number of operands."""
 
-    ...
+    __slots__ = ()
@@ -1,12 +1,13 @@
 from functools import lru_cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Container, Iterable
 
 from mlir.utils.validator import validator
 
 from .base import OpTrait
 
 if TYPE_CHECKING:
-    from mlir.ir.operations import Operation
+    from mlir.ir.operations import Operation, OpOperand
+    from mlir.ir.value import Value
 
 
 @lru_cache(maxsize=None)
@@ -16,6 +17,8 @@ def NRegions(n: int):
     class _NRegions(OpTrait):
         """Trait for operations with exactly `n` results."""
 
+        __slots__ = ()
+
         @validator
         def validate_regions_have_correct_length(self: "Operation") -> "Operation":
             if len(self.regions) != n:
@@ -31,3 +34,48 @@ def NRegions(n: int):
 ZeroRegions = NRegions(0)
 OneRegion = NRegions(1)
 TwoRegions = NRegions(2)
+
+
+class IsolatedFromAbove(OpTrait):
+    """Trait for operations whose regions do not use any value defined above them.
+
+    Nothing nested within the operation can refer to values outside of it, so its body
+    can be processed independently of the surrounding IR, and operations with this trait
+    (such as functions) are the unit of parallelism for verification and passes.
+    """
+
+    __slots__ = ()
+
+    @validator
+    def validate_isolated_from_above(self: "Operation") -> "Operation":
+        defined = set()
+        operands = []
+        regions = list(self.regions)
+        while regions:
+            region = regions.pop()
+            if not region.is_loaded:
+                # A lazy body is checked when it is loaded, see Region.load_body.
+                continue
+            for block in region:
+                defined.update(block._arguments)
+                for op in block:
+                    defined.update(op.results)
+                    operands.extend(op.operands)
+                    regions.extend(op.regions)
+        self.check_uses_defined_within(operands, defined)
+        return self
+
+    @classmethod
+    def check_uses_defined_within(
+        cls, operands: Iterable["OpOperand"], defined: Container["Value"]
+    ):
+        """Raises if an operand nested in an operation of this class uses a value that
+        is not among those defined within it. The verifier calls this with the values it
+        collects while walking the body, rather than walking it again."""
+        for operand in operands:
+            if operand.value is not None and operand.value not in defined:
+                raise ValueError(
+                    f"{cls.__name__} is isolated from above, but "
+                    f"{operand.owner.__class__.__name__} uses a value defined outside "
+                    f"of it."
+                )
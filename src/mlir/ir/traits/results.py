@@ -16,6 +16,8 @@ def NResults(n: int):
     class _NResults(OpTrait):
         """Trait for operations with exactly `n` results."""
 
+        __slots__ = ()
+
         @validator
         def validate_results_have_correct_length(self: "Operation") -> "Operation":
             if len(self.results) != n:
@@ -36,4 +38,6 @@ TwoResults = NResults(2)
 class VariadicResults(OpTrait):
     """Trait for operations with a variadic number of results."""
 
+    __slots__ = ()
+
     # You can add additional validators or documentation here if
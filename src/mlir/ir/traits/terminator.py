@@ -4,4 +4,4 @@ from .base import OpTrait
 class Terminator(OpTrait):
     """Indicates that an operation is a terminating operation."""
 
-    ...
+    __slots__ = ()
@@ -1,8 +1,12 @@
+import inspect
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, ConfigDict
 
+from mlir.utils.storage_uniquer import StorageUniquer
+
 if TYPE_CHECKING:
     from mlir.context import MLIRContext
 
@@ -14,18 +18,25 @@ class TypeBase(ABC, BaseModel):
 
     @classmethod
     def get(cls, context: "MLIRContext", *args):
-        """Get a type from the context, or create it if it does not exist."""
-        key = (cls.__name__,) + args
-        value = context.get_type(key)
-        if value is not None:
-            return value
-        value = cls(*args)
-        context.add_type(key, value)
-        return value
+        """Get a type from the context, or create it if it does not exist. Arguments
+        left to their defaults are filled in, so that they are uniqued together with the
+        same type given explicitly. This is safe to call from several threads."""
+        missing = _default_arguments(cls)[len(args) :]
+        if missing and inspect.Parameter.empty not in missing:
+            args = args + missing
+        return context.get_or_create_type((cls.__name__,) + args, lambda: cls(*args))
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+    def get_storage_key(self) -> tuple:
+        """Returns the key the type is uniqued under in :class:`TypeStorage`, the same one
+        ``get`` builds from the class name and its constructor arguments."""
+        parameters = _constructor_parameters(type(self))
+        return (type(self).__name__,) + tuple(
+            getattr(self, parameter.name) for parameter in parameters
+        )
+
     @abstractmethod
     def validate_type(self, value):
         """Raises if the value doesn't match the type."""
@@ -48,36 +59,50 @@ class TypeBase(ABC, BaseModel):
         return f"{self.__class__.__name__}({', '.join(f'{k}={getattr(self, k)}' for k in fields)})"
 
 
-class TypeStorage:
+@cache
+def _constructor_parameters(cls: type[TypeBase]) -> tuple[inspect.Parameter, ...]:
+    """Returns the positional parameters of a type's constructor, which are also the
+    fields that define it."""
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    return tuple(
+        parameter
+        for parameter in parameters
+        if parameter.kind
+        in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    )
+
+
+@cache
+def _default_arguments(cls: type[TypeBase]) -> tuple:
+    """Returns the default value of each positional parameter of a type's constructor,
+    or ``inspect.Parameter.empty`` for those without one."""
+    return tuple(parameter.default for parameter in _constructor_parameters(cls))
+
+
+class TypeStorage(StorageUniquer[tuple, TypeBase]):
     """A storage for types for deduplication.
 
     In MLIR, types and type storage are much more elegant than this; the storage contains
     the definitions, and the types are pointers to within. They also allocate a storage for
     each type, which is not done here.
-    """
 
-    def __init__(self):
-        self._types = {}
+    Types are keyed by a tuple of their class name and parameters, and the storage is safe
+    to use from several threads, see :class:`~mlir.utils.storage_uniquer.StorageUniquer`.
+    """
 
     def get(self, key: tuple) -> TypeBase | None:
         """Return a type from the context by a key, which is a tuple of its type and
         parameters that define the type. If the type does not exist, return None."""
-        return self._types.get(key, None)
+        return self.lookup(key)
 
     def add(self, key: tuple, value: TypeBase):
         """Add a type to the context. If the type already exists, this will raise an
         error."""
-        if key in self._types:
-            if self._types[key] == value:
+        stored = self.get_or_create(key, lambda: value)
+        if stored is not value:
+            if stored == value:
                 raise ValueError(f"Type {value} already exists in the context.")
             else:
                 raise ValueError(
                     f"The {key} already exists in the context with a different value."
                 )
-        self._types[key] = value
-
-    def __contains__(self, key: tuple) -> bool:
-        return key in self._types
-
-    def __getitem__(self, key: tuple) -> TypeBase:
-        return self._types[key]
@@ -24,6 +24,13 @@ class SignednessSemantics(Enum):
     values. The method of implementation is not specified, and left to the target."""
 
 
+_signedness_prefixes = {
+    SignednessSemantics.SIGNLESS: "",
+    SignednessSemantics.SIGNED: "s",
+    SignednessSemantics.UNSIGNED: "u",
+}
+
+
 class IntegerType(TypeBase):
     """Represents an integer type in MLIR."""
 
@@ -80,7 +87,8 @@ class IntegerType(TypeBase):
             )
 
     def __str__(self) -> str:
-        return f"i{self.bitwidth}"
+        prefix = _signedness_prefixes[self.signedness]
+        return f"{prefix}i{self.bitwidth}"
 
     def __hash__(self) -> int:
         return hash((self.__class__, self.bitwidth, self.signedness))
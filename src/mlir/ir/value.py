@@ -1,33 +1,163 @@
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from pydantic import NonNegativeInt
 
+from mlir.ir.listeners import notify_operations_modified
 from mlir.ir.types import TypeBase
+from mlir.utils.pickling import get_slot_state, set_slot_state
 
 if TYPE_CHECKING:
     from mlir.ir.blocks import Block
     from mlir.ir.operations import Operation, OpOperand
 
 
-class Value(ABC):
+class IRObjectWithUseList:
+    """Base class for objects that keep a list of their uses: values, whose uses are
+    :class:`~mlir.ir.operations.OpOperand`, and blocks, whose uses are
+    :class:`~mlir.ir.operations.BlockOperand`.
+
+    Uses are stored as an intrusive doubly-linked list threaded through the operands, with
+    the object holding only the head. Adding and removing a use is O(1), and so are
+    :attr:`use_empty` and :attr:`has_one_use`. In MLIR this is ``IRObjectWithUseList``.
+    """
+
+    __slots__ = ("_first_use",)
+
+    @property
+    def uses(self) -> list:
+        """Returns a snapshot of the uses of this object as a list, most recent first."""
+        uses = []
+        use = self._first_use
+        while use is not None:
+            uses.append(use)
+            use = use._next_use
+        return uses
+
+    @property
+    def use_empty(self) -> bool:
+        """Returns True if the object has no uses."""
+        return self._first_use is None
+
+    @property
+    def has_one_use(self) -> bool:
+        """Returns True if the object has exactly one use."""
+        return self._first_use is not None and self._first_use._next_use is None
+
+    def add_use(self, use):
+        """Adds a use for this object by pushing it to the front of the use-list."""
+        first_use = self._first_use
+        use._prev_use = None
+        use._next_use = first_use
+        if first_use is not None:
+            first_use._prev_use = use
+        self._first_use = use
+
+    def remove_use(self, use):
+        """Removes a use for this object by unlinking it from the use-list."""
+        prev_use = use._prev_use
+        next_use = use._next_use
+        if prev_use is None:
+            if self._first_use is not use:
+                raise ValueError(f"{use} is not a use of this value.")
+            self._first_use = next_use
+        else:
+            prev_use._next_use = next_use
+        if next_use is not None:
+            next_use._prev_use = prev_use
+        use._prev_use = None
+        use._next_use = None
+
+
+class Value(IRObjectWithUseList, ABC):
     """Base class for MLIR values, which are instances of TypeBase.
 
     In MLIR this would be an opaque wrapper around a pointer to the SSA value. Here I just
     model it as a base class and we will pass around references to the objects.
+
+    Uses are stored as an intrusive doubly-linked list threaded through
+    :class:`~mlir.ir.operations.OpOperand`, see :class:`IRObjectWithUseList`.
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, type: TypeBase):
         self.type = type
-        self.uses: list["OpOperand"] = []
-
-    def add_use(self, use: "OpOperand"):
-        """Adds a use for this value."""
-        self.uses.append(use)
-
-    def remove_use(self, use: "OpOperand"):
-        """Removes a use for this value."""
-        self.uses.remove(use)
+        self._first_use: "OpOperand | None" = None
+
+    def __getstate__(self):
+        # The use-list is rebuilt by each OpOperand as it is unpickled.
+        return get_slot_state(self, exclude=("_first_use",))
+
+    def __setstate__(self, state):
+        set_slot_state(self, state)
+        if not hasattr(self, "_first_use"):
+            self._first_use = None
+
+    @property
+    def uses(self) -> list["OpOperand"]:
+        """Returns a snapshot of the uses of this value as a list, most recent first."""
+        return super().uses
+
+    def replace_all_uses_with(self, value: "Value"):
+        """Replaces every use of this value with another value.
+
+        The use-list is walked once to repoint each operand, then spliced onto the front
+        of the other value's use-list as a whole. Listeners are notified once with all of
+        the modified operations.
+        """
+        users = self._take_uses(value, None)
+        notify_operations_modified(users)
+
+    def replace_uses_with_if(
+        self, value: "Value", predicate: Callable[["OpOperand"], bool]
+    ):
+        """Replaces the uses of this value for which the predicate returns True with
+        another value, in a single pass over the use-list. Listeners are notified once
+        with all of the modified operations."""
+        users = self._take_uses(value, predicate)
+        notify_operations_modified(users)
+
+    def _take_uses(
+        self, value: "Value", predicate: Callable[["OpOperand"], bool] | None
+    ) -> list["Operation"]:
+        """Moves uses of this value (all of them, or those matching the predicate) onto
+        the use-list of another value, returning the owners of the moved uses. No
+        notifications are sent."""
+        if value is self:
+            return []
+
+        users = []
+        if predicate is None:
+            first_use = self._first_use
+            if first_use is None:
+                return users
+            use = first_use
+            while True:
+                use.value = value
+                users.append(use.owner)
+                if use._next_use is None:
+                    break
+                use = use._next_use
+
+            # Splice the whole list onto the front of the other use-list.
+            use._next_use = value._first_use
+            if value._first_use is not None:
+                value._first_use._prev_use = use
+            value._first_use = first_use
+            self._first_use = None
+            return users
+
+        use = self._first_use
+        while use is not None:
+            next_use = use._next_use
+            if predicate(use):
+                self.remove_use(use)
+                use.value = value
+                value.add_use(use)
+                users.append(use.owner)
+            use = next_use
+        return users
 
 
 class OpResult(Value):
@@ -40,6 +170,8 @@ class OpResult(Value):
     :param index: The index of the result in the operation's results list.
     """
 
+    __slots__ = ("owner", "index")
+
     def __init__(
         self, type: TypeBase, owner: "Operation | None", index: NonNegativeInt
     ):
@@ -61,6 +193,8 @@ class BlockArgument(Value):
     :param index: The index of the argument in the block's arguments list.
     """
 
+    __slots__ = ("owner", "index")
+
     def __init__(
         self, type: TypeBase, owner: "Block | None", index: NonNegativeInt | None
     ):
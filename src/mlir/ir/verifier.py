@@ -0,0 +1,315 @@
+from concurrent.futures import Future
+from itertools import islice
+
+from mlir.analysis.dominance import DominanceInfo
+from mlir.context import MLIRContext, ParallelBackend
+from mlir.ir.operations import Operation, OpOperand
+from mlir.ir.regions import Region
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.value import BlockArgument, OpResult, Value
+from mlir.utils.pickling import dumps, loads
+from mlir.utils.validator import ValidatorError
+
+Position = tuple[tuple[int, int, int], ...]
+"""The path to an operation from the root of a verification, as a tuple of (region index,
+block index, operation index) triples, one per level of nesting."""
+
+
+class Diagnostic:
+    """A single verification failure.
+
+    :param operation: The operation that failed verification.
+    :param position: The path from the verified root to the operation.
+    :param error: The exception raised by the validator.
+    """
+
+    __slots__ = ("operation", "position", "error")
+
+    def __init__(self, operation: Operation, position: Position, error: Exception):
+        self.operation = operation
+        self.position = position
+        self.error = error
+
+    @property
+    def location(self) -> str:
+        """A readable form of the position of the operation."""
+        if not self.position:
+            return "root"
+        return " -> ".join(
+            f"region #{region}, block #{block}, operation #{operation}"
+            for region, block, operation in self.position
+        )
+
+    def __str__(self) -> str:
+        return f"{type(self.operation).__name__} at {self.location}: {self.error}"
+
+
+class VerificationError(ValidatorError):
+    """Aggregates every verification failure found in a piece of IR."""
+
+    def __init__(self, diagnostics: list[Diagnostic]):
+        self.diagnostics = diagnostics
+        super().__init__([diagnostic.error for diagnostic in diagnostics])
+
+    def __str__(self):
+        messages = "\n".join(f"    {str(d)}" for d in self.diagnostics)
+        return f"Verification failed with the following errors:\n{messages}"
+
+
+def verify(operation: Operation, context: MLIRContext | None = None):
+    """Verifies an operation and everything nested within it, raising a
+    :class:`VerificationError` listing every failure.
+
+    The IR is walked once in pre-order, and each operation is checked against the
+    validators its class collected when it was defined, and for SSA dominance: each
+    operand must be defined by an operation or block that dominates its use, see
+    :class:`~mlir.analysis.DominanceInfo`. This pairs with
+    :func:`~mlir.utils.validator.deferred_validation`, which skips the validators when the
+    IR is built. If a context with multithreading enabled is given, the bodies of nested
+    operations that are isolated from above are verified on its worker pool.
+    """
+    diagnostics = collect_diagnostics(operation, context=context)
+    if diagnostics:
+        raise VerificationError(diagnostics)
+
+
+def collect_diagnostics(
+    operation: Operation,
+    position: Position = (),
+    context: MLIRContext | None = None,
+) -> list[Diagnostic]:
+    """Runs the validators of an operation and everything nested within it, returning
+    the failures in pre-order. Positions are reported relative to the given position of
+    the operation.
+
+    When the context has multithreading enabled, the body of each nested operation that
+    is isolated from above is verified as a separate task, which also checks that the body
+    only uses values defined within it while walking it. Results are merged back in the
+    order they would be found serially, so the output does not depend on scheduling.
+    """
+    executor = context.executor if context is not None else None
+    if executor is None:
+        diagnostics = []
+        _walk([(operation, position)], diagnostics)
+        return diagnostics
+
+    use_processes = context.backend == ParallelBackend.PROCESS
+    chunks: list[list[Diagnostic] | tuple[Operation, Position, Future]] = []
+    current: list[Diagnostic] = []
+    dominance = DominanceInfo()
+    stack = [(operation, position)]
+    while stack:
+        op, op_position = stack.pop()
+        offload = (
+            op is not operation
+            and isinstance(op, IsolatedFromAbove)
+            and op.regions
+            and op.regions[0].is_loaded
+        )
+        _run_validators(op, op_position, current)
+        _check_dominance(op, op_position, current, dominance)
+        if not offload:
+            _check_isolation(op, op_position, current)
+            stack.extend(_nested(op, op_position))
+            continue
+        # The task checks that the body is isolated from above as it walks it.
+        if use_processes:
+            payload = dumps(op.regions, external=[op])
+            future = executor.submit(
+                _verify_pickled_regions, payload, op_position, type(op)
+            )
+        else:
+            future = executor.submit(
+                _verify_regions, op.regions, op_position, type(op), op
+            )
+        chunks.append(current)
+        chunks.append((op, op_position, future))
+        current = []
+    chunks.append(current)
+
+    diagnostics = []
+    for chunk in chunks:
+        if isinstance(chunk, list):
+            diagnostics.extend(chunk)
+            continue
+        op, op_position, future = chunk
+        if use_processes:
+            try:
+                failures = future.result()
+            except Exception:
+                # A body that uses values defined above it drags the IR they belong to
+                # into the copy, which need not survive the trip, so verify it here.
+                diagnostics.extend(
+                    _verify_regions(op.regions, op_position, type(op), op)
+                )
+                continue
+            diagnostics.extend(
+                Diagnostic(
+                    find_operation(op, nested_position[len(op_position) :]),
+                    nested_position,
+                    error,
+                )
+                for nested_position, error in failures
+            )
+        else:
+            diagnostics.extend(future.result())
+    return diagnostics
+
+
+_validate_isolated_from_above = IsolatedFromAbove.validate_isolated_from_above
+
+
+def _run_validators(op: Operation, position: Position, diagnostics: list[Diagnostic]):
+    """Runs the validators of a single operation, recording any failures. The check that
+    an operation is isolated from above is left to :func:`_check_isolation`."""
+    for validator in type(op)._validators:
+        if validator is _validate_isolated_from_above:
+            continue
+        try:
+            validator(op)
+        except Exception as e:
+            diagnostics.append(Diagnostic(op, position, e))
+
+
+def _check_isolation(op: Operation, position: Position, diagnostics: list[Diagnostic]):
+    """Checks that an operation with the :class:`IsolatedFromAbove` trait only uses values
+    defined within it. This runs after the other checks of the operation, in the same
+    order as when a task checks it while verifying the body."""
+    if not isinstance(op, IsolatedFromAbove):
+        return
+    try:
+        _validate_isolated_from_above(op)
+    except Exception as e:
+        diagnostics.append(Diagnostic(op, position, e))
+
+
+def _check_dominance(
+    op: Operation,
+    position: Position,
+    diagnostics: list[Diagnostic],
+    dominance: DominanceInfo,
+):
+    """Checks that the definition of each operand of an operation dominates it. Values
+    whose definition is not attached to the IR are not checked."""
+    for operand in op.operands:
+        value = operand.value
+        if isinstance(value, OpResult):
+            definition = value.owner
+            if definition is None or definition.parent is None:
+                continue
+        elif isinstance(value, BlockArgument):
+            definition = value.owner
+            if definition is None or definition.owner is None:
+                continue
+        else:
+            continue
+        if not dominance.properly_dominates(definition, op):
+            diagnostics.append(
+                Diagnostic(
+                    op,
+                    position,
+                    ValueError(
+                        f"Operand #{operand.index} of {op.get_operation_name()} does "
+                        f"not dominate its use."
+                    ),
+                )
+            )
+
+
+def _nested(
+    op: Operation, position: Position, defined: set[Value] | None = None
+) -> list[tuple[Operation, Position]]:
+    """Returns the operations directly nested in an operation with their positions, in
+    reverse order so that they can be pushed onto a stack for a pre-order walk."""
+    nested = []
+    for region_index, region in enumerate(op.regions):
+        nested.extend(_region_operations(region, region_index, position, defined))
+    nested.reverse()
+    return nested
+
+
+def _region_operations(
+    region: Region,
+    region_index: int,
+    position: Position,
+    defined: set[Value] | None = None,
+) -> list[tuple[Operation, Position]]:
+    """Returns the operations in a region with their positions, in order. Lazy bodies
+    that have not been loaded are skipped, as they are verified when they are loaded.
+    The arguments of the blocks are added to ``defined``, if given."""
+    if not region.is_loaded:
+        return []
+    if defined is not None:
+        for block in region:
+            defined.update(block._arguments)
+    return [
+        (op, position + ((region_index, block_index, op_index),))
+        for block_index, block in enumerate(region)
+        for op_index, op in enumerate(block)
+    ]
+
+
+def _walk(
+    stack: list[tuple[Operation, Position]],
+    diagnostics: list[Diagnostic],
+    defined: set[Value] | None = None,
+    operands: list[OpOperand] | None = None,
+):
+    """Verifies the operations on the stack and everything nested within them in
+    pre-order. If given, the values defined by the operations are added to ``defined``
+    and their operands to ``operands``."""
+    dominance = DominanceInfo()
+    while stack:
+        op, op_position = stack.pop()
+        _run_validators(op, op_position, diagnostics)
+        _check_dominance(op, op_position, diagnostics, dominance)
+        _check_isolation(op, op_position, diagnostics)
+        if defined is not None:
+            defined.update(op.results)
+            operands.extend(op.operands)
+        stack.extend(_nested(op, op_position, defined))
+
+
+def _verify_regions(
+    regions: tuple[Region, ...],
+    position: Position,
+    operation_class: type[IsolatedFromAbove],
+    operation: Operation | None = None,
+) -> list[Diagnostic]:
+    """Verifies everything nested in the regions of an operation at the given position,
+    and that the operation is isolated from above, from the values seen by the same
+    walk."""
+    defined: set[Value] = set()
+    operands: list[OpOperand] = []
+    stack = []
+    for region_index, region in enumerate(regions):
+        stack.extend(_region_operations(region, region_index, position, defined))
+    stack.reverse()
+    diagnostics = []
+    _walk(stack, diagnostics, defined, operands)
+    try:
+        operation_class.check_uses_defined_within(operands, defined)
+    except Exception as e:
+        diagnostics.insert(0, Diagnostic(operation, position, e))
+    return diagnostics
+
+
+def _verify_pickled_regions(
+    payload: bytes, position: Position, operation_class: type[IsolatedFromAbove]
+) -> list[tuple[Position, Exception]]:
+    """Process pool entry point for :func:`_verify_regions`. The operations themselves
+    cannot be sent back, so failures are returned by position."""
+    regions = loads(payload, external=[None])
+    return [
+        (diagnostic.position, diagnostic.error)
+        for diagnostic in _verify_regions(regions, position, operation_class)
+    ]
+
+
+def find_operation(operation: Operation, position: Position) -> Operation:
+    """Finds the operation at a position relative to another operation, e.g. to map a
+    position reported by a worker process back to the IR it was copied from."""
+    for region_index, block_index, op_index in position:
+        block = next(islice(operation.regions[region_index], block_index, None))
+        operation = block.get_operation(op_index)
+    return operation
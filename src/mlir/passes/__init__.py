@@ -0,0 +1,20 @@
+from .pass_manager import (
+    OpPassManager,
+    Pass,
+    PassFailure,
+    PassManager,
+    lookup_pass,
+    register_pass,
+)
+from .pipeline import PipelineParseError, parse_pass_pipeline
+
+__all__ = [
+    "Pass",
+    "OpPassManager",
+    "PassManager",
+    "PassFailure",
+    "register_pass",
+    "lookup_pass",
+    "parse_pass_pipeline",
+    "PipelineParseError",
+]
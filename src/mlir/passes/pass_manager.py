@@ -0,0 +1,552 @@
+import copy
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import Future
+from typing import Any, ClassVar, Iterator
+
+from mlir.context import MLIRContext, ParallelBackend
+from mlir.ir.attributes import AttributeBase
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.types import TypeBase
+from mlir.ir.value import Value
+from mlir.ir.verifier import (
+    Diagnostic,
+    Position,
+    collect_diagnostics,
+    find_operation,
+)
+from mlir.utils.pickling import dumps, loads
+
+_registered_passes: dict[str, type["Pass"]] = {}
+
+
+def register_pass(pass_class: type["Pass"]) -> type["Pass"]:
+    """Decorator registering a pass under its ``argument``, so that it can be used in a
+    textual pipeline."""
+    if pass_class.argument in _registered_passes:
+        raise ValueError(f"A pass is already registered as '{pass_class.argument}'.")
+    _registered_passes[pass_class.argument] = pass_class
+    return pass_class
+
+
+def lookup_pass(argument: str) -> type["Pass"] | None:
+    """Returns the pass class registered under an argument, or None."""
+    return _registered_passes.get(argument)
+
+
+class PassFailure(Exception):
+    """Raised when one or more passes in a pipeline fail. Each failure is reported as a
+    diagnostic with the position of the operation the pass was running on, in IR
+    order."""
+
+    def __init__(self, diagnostics: list[Diagnostic]):
+        self.diagnostics = diagnostics
+        super().__init__(str(self))
+
+    def __str__(self):
+        messages = "\n".join(f"    {str(d)}" for d in self.diagnostics)
+        return f"Pass pipeline failed with the following errors:\n{messages}"
+
+
+class Pass(ABC):
+    """Base class for passes, which transform or analyse a single operation.
+
+    A pass is anchored on the type of operation it runs on (``anchor``), or on any
+    operation if that is None. Passes are scheduled by adding them to an
+    :class:`OpPassManager` with a compatible anchor. Options are passed as keyword
+    arguments to the constructor, and in a textual pipeline as ``argument{key=value}``.
+
+    Passes signal failure by raising, and can count events in ``statistics``. When
+    nested operations are processed in parallel, each task runs on a clone of the pass,
+    so passes should not rely on state shared between operations.
+    """
+
+    argument: ClassVar[str]
+    """The name of the pass in a textual pipeline."""
+
+    anchor: ClassVar[type[Operation] | None] = None
+    """The type of operation the pass runs on, or None if it can run on any operation."""
+
+    def __init__(self, **options: Any):
+        self.options = options
+        self.statistics: Counter[str] = Counter()
+
+    @abstractmethod
+    def run_on_operation(self, operation: Operation, context: MLIRContext):
+        """Runs the pass on an operation. Failures are signalled by raising."""
+        pass
+
+    def clone(self) -> "Pass":
+        """Returns a copy of the pass with empty statistics, to run on another thread or
+        process."""
+        clone = copy.copy(self)
+        clone.statistics = Counter()
+        return clone
+
+    def __str__(self) -> str:
+        if not self.options:
+            return self.argument
+        options = " ".join(
+            f"{key.replace('_', '-')}={_format_option(value)}"
+            for key, value in self.options.items()
+        )
+        return f"{self.argument}{{{options}}}"
+
+
+def _format_option(value: Any) -> str:
+    """Formats an option value as it is written in a textual pipeline."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class OpPassManager:
+    """A pipeline of passes anchored on a type of operation.
+
+    A pipeline holds passes that run on the anchor operation itself, and nested pipelines
+    that run on the operations directly nested in its regions. Nesting the same type of
+    operation twice in a row reuses the previous nested pipeline, and runs of adjacent
+    nested pipelines are executed in a single walk over the nested operations, with each
+    nested operation run through every pipeline of the run anchored on its type, in
+    order. In both cases each nested operation is visited once, rather than once per
+    pass.
+
+    If the context has multithreading enabled, nested operations that are isolated from
+    above are each run through their pipeline as a task on the context's worker pool.
+    Statistics and failures from the tasks are merged back in IR order, so the outcome
+    does not depend on scheduling. With the process backend, each operation is pickled to
+    a worker and the transformed regions are moved back into the original operation.
+
+    :param anchor: The type of operation the pipeline runs on.
+    """
+
+    def __init__(self, anchor: type[Operation]):
+        self.anchor = anchor
+        self.passes: list["Pass | OpPassManager"] = []
+
+    @property
+    def anchor_name(self) -> str:
+        return self.anchor.get_operation_name()
+
+    def add_pass(self, pass_: Pass) -> "OpPassManager":
+        """Adds a pass that runs on the anchor operation, returning self for chaining."""
+        if pass_.anchor is not None and not issubclass(self.anchor, pass_.anchor):
+            raise ValueError(
+                f"Pass '{pass_.argument}' runs on "
+                f"'{pass_.anchor.get_operation_name()}', which cannot be scheduled on "
+                f"'{self.anchor_name}'."
+            )
+        self.passes.append(pass_)
+        return self
+
+    def nest(self, anchor: type[Operation]) -> "OpPassManager":
+        """Returns a pipeline that runs on the operations of the given type directly
+        nested in the anchor operation. If the last entry of this pipeline is already
+        nested on the same type, it is reused."""
+        if self.passes:
+            last = self.passes[-1]
+            if isinstance(last, OpPassManager) and last.anchor is anchor:
+                return last
+        nested = OpPassManager(anchor)
+        self.passes.append(nested)
+        return nested
+
+    def add_nested(self, nested: "OpPassManager") -> "OpPassManager":
+        """Appends an existing nested pipeline, merging it into the last entry of this
+        pipeline if that is nested on the same type."""
+        target = self.nest(nested.anchor)
+        for entry in nested.passes:
+            if isinstance(entry, OpPassManager):
+                target.add_nested(entry)
+            else:
+                target.add_pass(entry)
+        return self
+
+    def clone(self) -> "OpPassManager":
+        """Returns a copy of the pipeline with every pass cloned."""
+        clone = OpPassManager(self.anchor)
+        clone.passes = [entry.clone() for entry in self.passes]
+        return clone
+
+    def all_passes(self) -> list[Pass]:
+        """Returns every pass in the pipeline, including nested pipelines, in order."""
+        passes = []
+        for entry in self.passes:
+            if isinstance(entry, OpPassManager):
+                passes.extend(entry.all_passes())
+            else:
+                passes.append(entry)
+        return passes
+
+    @property
+    def statistics(self) -> dict[str, Counter[str]]:
+        """Returns the statistics of every pass in the pipeline that recorded any, keyed
+        by the position of the pass in the pipeline and its argument."""
+        return {
+            f"{index}:{pass_.argument}": pass_.statistics
+            for index, pass_ in enumerate(self.all_passes())
+            if pass_.statistics
+        }
+
+    def run(
+        self, operation: Operation, context: MLIRContext, verify_each: bool = False
+    ):
+        """Runs the pipeline on an operation of the anchor type, raising a
+        :class:`PassFailure` if any pass fails. With ``verify_each``, the operation each
+        pass ran on is verified after it, and verification failures are reported as
+        failures of the pass."""
+        if not isinstance(operation, self.anchor):
+            raise ValueError(
+                f"Pipeline anchored on '{self.anchor_name}' cannot run on "
+                f"'{operation.get_operation_name()}'."
+            )
+        diagnostics = []
+        self._run(operation, context, (), diagnostics, verify_each)
+        if diagnostics:
+            raise PassFailure(diagnostics)
+
+    def _run(
+        self,
+        operation: Operation,
+        context: MLIRContext,
+        position: Position,
+        diagnostics: list[Diagnostic],
+        verify_each: bool,
+    ):
+        """Runs the pipeline on an operation, recording failures. The rest of the
+        pipeline is skipped for an operation once a pass fails on it or on any operation
+        nested within it."""
+        for group in self._groups():
+            if isinstance(group, Pass):
+                try:
+                    group.run_on_operation(operation, context)
+                except Exception as e:
+                    diagnostics.append(Diagnostic(operation, position, e))
+                    return
+                if verify_each:
+                    # The pool is only used for verification outside of pipeline tasks.
+                    pool = None if _worker_state.active else context
+                    failures = collect_diagnostics(operation, position, pool)
+                    if failures:
+                        diagnostics.extend(failures)
+                        return
+            else:
+                failures = len(diagnostics)
+                self._run_nested(
+                    group, operation, context, position, diagnostics, verify_each
+                )
+                if len(diagnostics) != failures:
+                    return
+
+    def _groups(self) -> Iterator["Pass | list[OpPassManager]"]:
+        """Yields the passes of the pipeline, with runs of adjacent nested pipelines
+        grouped together so they share a walk over the nested operations."""
+        nested: list[OpPassManager] = []
+        for entry in self.passes:
+            if isinstance(entry, OpPassManager):
+                nested.append(entry)
+                continue
+            if nested:
+                yield nested
+                nested = []
+            yield entry
+        if nested:
+            yield nested
+
+    def _run_nested(
+        self,
+        managers: list["OpPassManager"],
+        operation: Operation,
+        context: MLIRContext,
+        position: Position,
+        diagnostics: list[Diagnostic],
+        verify_each: bool,
+    ):
+        """Runs each directly nested operation through every pipeline anchored on its
+        type, in order, in parallel if possible."""
+        work = []
+        for nested_op, nested_position in _nested_with_positions(operation, position):
+            selected = _select(managers, nested_op)
+            if selected:
+                work.append((nested_op, nested_position, selected))
+
+        executor = None if _worker_state.active else context.executor
+        if executor is None or len(work) < 2:
+            for nested_op, nested_position, selected in work:
+                _run_all(
+                    selected,
+                    nested_op,
+                    context,
+                    nested_position,
+                    diagnostics,
+                    verify_each,
+                )
+            return
+
+        tasks: list[tuple[Operation, Position, list[OpPassManager], Future | None]] = []
+        for nested_op, nested_position, selected in work:
+            # Only operations isolated from above can safely run concurrently.
+            future = None
+            if isinstance(nested_op, IsolatedFromAbove):
+                future = _submit(
+                    executor,
+                    context,
+                    selected,
+                    nested_op,
+                    nested_position,
+                    verify_each,
+                )
+            tasks.append((nested_op, nested_position, selected, future))
+
+        for nested_op, nested_position, selected, future in tasks:
+            if future is None:
+                _run_all(
+                    selected,
+                    nested_op,
+                    context,
+                    nested_position,
+                    diagnostics,
+                    verify_each,
+                )
+                continue
+            if context.backend == ParallelBackend.PROCESS:
+                payload, statistics, failures = future.result()
+                values = [operand.value for operand in nested_op.operands]
+                _transplant(nested_op, loads(payload, values), context)
+                failures = [
+                    Diagnostic(
+                        find_operation(nested_op, at[len(nested_position) :]),
+                        at,
+                        error,
+                    )
+                    for at, error in failures
+                ]
+            else:
+                statistics, failures = future.result()
+            passes = [pass_ for manager in selected for pass_ in manager.all_passes()]
+            for pass_, pass_statistics in zip(passes, statistics):
+                pass_.statistics.update(pass_statistics)
+            diagnostics.extend(failures)
+
+    def __str__(self) -> str:
+        return f"{self.anchor_name}({','.join(str(entry) for entry in self.passes)})"
+
+
+def nested_operations(operation: Operation) -> list[Operation]:
+    """Returns the operations directly nested in the regions of an operation, in order."""
+    return [
+        nested_op
+        for region in operation.regions
+        for block in region
+        for nested_op in block
+    ]
+
+
+def _nested_with_positions(
+    operation: Operation, position: Position
+) -> list[tuple[Operation, Position]]:
+    """Returns the operations directly nested in an operation, with their positions."""
+    return [
+        (nested_op, position + ((region_index, block_index, op_index),))
+        for region_index, region in enumerate(operation.regions)
+        for block_index, block in enumerate(region)
+        for op_index, nested_op in enumerate(block)
+    ]
+
+
+def _select(managers: list[OpPassManager], operation: Operation) -> list[OpPassManager]:
+    """Returns the pipelines anchored on the type of the operation, in order."""
+    return [manager for manager in managers if isinstance(operation, manager.anchor)]
+
+
+def _run_all(
+    managers: list[OpPassManager],
+    operation: Operation,
+    context: MLIRContext,
+    position: Position,
+    diagnostics: list[Diagnostic],
+    verify_each: bool,
+):
+    """Runs an operation through several pipelines in order, stopping at the first one
+    that fails."""
+    for manager in managers:
+        failures = len(diagnostics)
+        manager._run(operation, context, position, diagnostics, verify_each)
+        if len(diagnostics) != failures:
+            return
+
+
+class _WorkerState(threading.local):
+    """Marks threads that are running a pipeline task, so that nested pipelines within
+    the task run serially rather than waiting on the same pool."""
+
+    active = False
+
+
+_worker_state = _WorkerState()
+_worker_context: MLIRContext | None = None
+
+
+def _submit(
+    executor,
+    context: MLIRContext,
+    managers: list[OpPassManager],
+    operation: Operation,
+    position: Position,
+    verify_each: bool,
+) -> Future:
+    """Submits a task running clones of the pipelines on an operation."""
+    managers = [manager.clone() for manager in managers]
+    if context.backend == ParallelBackend.PROCESS:
+        external = [operation.parent] if operation.parent is not None else []
+        values = [operand.value for operand in operation.operands]
+        stand_ins = [None] * len(external) + [Value(value.type) for value in values]
+        payload = dumps(operation, external + values)
+        return executor.submit(
+            _run_pickled_task, managers, payload, stand_ins, position, verify_each
+        )
+    return executor.submit(
+        _run_task, managers, operation, context, position, verify_each
+    )
+
+
+def _statistics(managers: list[OpPassManager]) -> list[Counter]:
+    """Returns the statistics of every pass in the pipelines, in order."""
+    return [pass_.statistics for manager in managers for pass_ in manager.all_passes()]
+
+
+def _run_task(
+    managers: list[OpPassManager],
+    operation: Operation,
+    context: MLIRContext,
+    position: Position,
+    verify_each: bool,
+) -> tuple[list[Counter], list[Diagnostic]]:
+    """Thread pool entry point, running pipelines on an operation in place."""
+    _worker_state.active = True
+    try:
+        diagnostics = []
+        _run_all(managers, operation, context, position, diagnostics, verify_each)
+        return _statistics(managers), diagnostics
+    finally:
+        _worker_state.active = False
+
+
+def _run_pickled_task(
+    managers: list[OpPassManager],
+    payload: bytes,
+    stand_ins: list,
+    position: Position,
+    verify_each: bool,
+) -> tuple[bytes, list[Counter], list[tuple[Position, Exception]]]:
+    """Process pool entry point. The operation is unpickled with stand-ins for the parent
+    block and the values it uses from above, transformed, and pickled back with the
+    stand-ins replaced by the original values."""
+    global _worker_context
+    if _worker_context is None:
+        _worker_context = MLIRContext()
+    operation = loads(payload, stand_ins)
+    diagnostics = []
+    _run_all(managers, operation, _worker_context, position, diagnostics, verify_each)
+    values = [value for value in stand_ins if value is not None]
+    return (
+        dumps(operation, values),
+        _statistics(managers),
+        [(diagnostic.position, diagnostic.error) for diagnostic in diagnostics],
+    )
+
+
+def _transplant(operation: Operation, result: Operation, context: MLIRContext):
+    """Moves the body of an operation returned by a worker process into the original
+    operation, and re-uniques its types and attributes against the context."""
+    for region, result_region in zip(operation.regions, result.regions):
+        region.take_body(result_region)
+    operation.attributes = result.attributes
+    for operand in result.operands:
+        operand.drop()
+    _reunique(operation, context)
+
+
+def _reunique(operation: Operation, context: MLIRContext):
+    """Replaces types and attributes in the body of an operation with the instances
+    uniqued in the context, through :meth:`~mlir.ir.types.TypeBase.get` and
+    :meth:`~mlir.ir.attributes.AttributeBase.get`. Copies made by pickling are equal but
+    not identical to the uniqued instances, and those created in the worker are added to
+    the context."""
+    # Pickling preserves sharing, so each copy only needs to be looked up once.
+    types: dict[int, TypeBase] = {}
+    attributes: dict[int, AttributeBase] = {}
+
+    def unique_type(type: TypeBase) -> TypeBase:
+        uniqued = types.get(id(type))
+        if uniqued is None:
+            _, *parameters = type.get_storage_key()
+            uniqued = types[id(type)] = type.get(context, *parameters)
+        return uniqued
+
+    def unique_attributes(op: Operation):
+        for name, attribute in op.attributes.items():
+            uniqued = attributes.get(id(attribute))
+            if uniqued is None:
+                try:
+                    uniqued = attribute.get(
+                        context, unique_type(attribute.attribute_type), attribute.value
+                    )
+                except TypeError:
+                    # attributes with unhashable values cannot be uniqued
+                    uniqued = attribute
+                attributes[id(attribute)] = uniqued
+            op.attributes[name] = uniqued
+
+    unique_attributes(operation)
+    regions = list(operation.regions)
+    while regions:
+        region = regions.pop()
+        for block in region:
+            for argument in block._arguments:
+                argument.type = unique_type(argument.type)
+            for op in block:
+                for result in op.results:
+                    result.type = unique_type(result.type)
+                unique_attributes(op)
+                regions.extend(op.regions)
+
+
+class PassManager(OpPassManager):
+    """The top-level pipeline, which owns the context passes run in.
+
+    :param context: The context passes are run in.
+    :param anchor: The type of operation the pipeline runs on.
+    :param verify_each: Whether to verify the operation each pass ran on after the pass,
+        which is reported as a failure of the pass if it does not verify.
+    """
+
+    def __init__(
+        self,
+        context: MLIRContext,
+        anchor: type[Operation] = ModuleOperation,
+        verify_each: bool = False,
+    ):
+        super().__init__(anchor)
+        self.context = context
+        self.verify_each = verify_each
+
+    @classmethod
+    def parse(
+        cls, context: MLIRContext, pipeline: str, verify_each: bool = False
+    ) -> "PassManager":
+        """Builds a pass manager from a textual pipeline, e.g.
+        ``builtin.module(func.func(cse,canonicalize))``."""
+        from mlir.passes.pipeline import parse_pass_pipeline
+
+        parsed = parse_pass_pipeline(pipeline)
+        manager = cls(context, parsed.anchor, verify_each=verify_each)
+        manager.passes = parsed.passes
+        return manager
+
+    def run(self, operation: Operation):
+        """Runs the pipeline on an operation of the anchor type."""
+        super().run(operation, self.context, self.verify_each)
@@ -0,0 +1,142 @@
+from mlir.ir.operations import lookup_operation
+from mlir.passes.pass_manager import OpPassManager, lookup_pass
+
+
+class PipelineParseError(ValueError):
+    """Raised when a textual pass pipeline is malformed."""
+
+    def __init__(self, message: str, text: str, position: int):
+        self.text = text
+        self.position = position
+        super().__init__(f"{message} at position {position} in '{text}'.")
+
+
+def parse_pass_pipeline(text: str) -> OpPassManager:
+    """Parses a textual pass pipeline into a pipeline.
+
+    The grammar mirrors MLIR's ``--pass-pipeline`` option::
+
+        pipeline := op-name '(' element (',' element)* ')'
+        element  := pipeline | pass-name ('{' option* '}')?
+        option   := key '=' value
+
+    Operation names are looked up among the registered operations, so the module
+    defining each operation must have been imported. Option keys may use dashes, which
+    are converted to underscores; values are parsed as integers or booleans where
+    possible.
+    """
+    parser = _PipelineParser(text)
+    manager = parser.parse_pipeline()
+    parser.skip_whitespace()
+    if parser.position != len(text):
+        parser.error("Unexpected trailing characters")
+    return manager
+
+
+class _PipelineParser:
+    """A small recursive descent parser over a pipeline string."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.position = 0
+
+    def error(self, message: str):
+        raise PipelineParseError(message, self.text, self.position)
+
+    def skip_whitespace(self):
+        while self.position < len(self.text) and self.text[self.position].isspace():
+            self.position += 1
+
+    def peek(self) -> str:
+        self.skip_whitespace()
+        return self.text[self.position] if self.position < len(self.text) else ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            self.error(f"Expected '{char}'")
+        self.position += 1
+
+    def parse_identifier(self) -> str:
+        self.skip_whitespace()
+        start = self.position
+        while self.position < len(self.text) and (
+            self.text[self.position].isalnum() or self.text[self.position] in "_-."
+        ):
+            self.position += 1
+        if start == self.position:
+            self.error("Expected an identifier")
+        return self.text[start : self.position]
+
+    def parse_pipeline(self) -> OpPassManager:
+        start = self.position
+        name = self.parse_identifier()
+        anchor = lookup_operation(name)
+        if anchor is None:
+            self.position = start
+            self.error(f"Unknown operation '{name}'")
+        manager = OpPassManager(anchor)
+        self.expect("(")
+        if self.peek() == ")":
+            self.position += 1
+            return manager
+        while True:
+            self.parse_element(manager)
+            if self.peek() == ",":
+                self.position += 1
+                continue
+            self.expect(")")
+            return manager
+
+    def parse_element(self, manager: OpPassManager):
+        start = self.position
+        name = self.parse_identifier()
+        if self.peek() == "(":
+            self.position = start
+            self.skip_whitespace()
+            manager.add_nested(self.parse_pipeline())
+            return
+
+        pass_class = lookup_pass(name)
+        if pass_class is None:
+            self.position = start
+            self.error(f"Unknown pass '{name}'")
+        options = self.parse_options() if self.peek() == "{" else {}
+        try:
+            manager.add_pass(pass_class(**options))
+        except ValueError as e:
+            self.position = start
+            self.error(str(e).rstrip("."))
+
+    def parse_options(self) -> dict:
+        self.expect("{")
+        options = {}
+        while self.peek() != "}":
+            if not self.peek():
+                self.error("Expected '}'")
+            key = self.parse_identifier().replace("-", "_")
+            self.expect("=")
+            options[key] = _parse_value(self.parse_value())
+        self.position += 1
+        return options
+
+    def parse_value(self) -> str:
+        self.skip_whitespace()
+        start = self.position
+        while (
+            self.position < len(self.text)
+            and not self.text[self.position].isspace()
+            and self.text[self.position] not in "}"
+        ):
+            self.position += 1
+        if start == self.position:
+            self.error("Expected a value")
+        return self.text[start : self.position]
+
+
+def _parse_value(value: str) -> int | bool | str:
+    if value in ("true", "false"):
+        return value == "true"
+    try:
+        return int(value)
+    except ValueError:
+        return value
@@ -0,0 +1,20 @@
+from .folding import OperationFolder, get_constant_value
+from .greedy import (
+    GreedyPatternRewriteDriver,
+    Worklist,
+    apply_patterns_greedily,
+    is_trivially_dead,
+)
+from .patterns import FrozenRewritePatternSet, PatternRewriter, RewritePattern
+
+__all__ = [
+    "RewritePattern",
+    "PatternRewriter",
+    "FrozenRewritePatternSet",
+    "GreedyPatternRewriteDriver",
+    "Worklist",
+    "apply_patterns_greedily",
+    "is_trivially_dead",
+    "OperationFolder",
+    "get_constant_value",
+]
@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING
+
+from mlir.ir.attributes import AttributeBase
+from mlir.ir.listeners import notify_operations_modified
+from mlir.ir.operations import Operation
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.ir.types import TypeBase
+from mlir.ir.value import Value
+
+if TYPE_CHECKING:
+    from mlir.context import MLIRContext
+    from mlir.ir.regions import Region
+
+
+class OperationFolder:
+    """Folds operations and keeps track of the constants they materialize.
+
+    In MLIR this is ``OperationFolder``. Constants are uniqued in the context, and each
+    distinct constant is materialized once per insertion region, at the start of its
+    entry block. The insertion region of an operation is the closest enclosing region
+    whose parent is isolated from above, or the outermost region below the root. Constant
+    operations already in the IR are deduplicated against the same table, so folding a
+    region doesn't fill it with copies of the same constant.
+
+    :param context: The context the constants are uniqued in.
+    :param root: The operation whose regions are being folded. Constants are never
+        hoisted out of it.
+    """
+
+    def __init__(self, context: "MLIRContext", root: Operation | None = None):
+        self.context = context
+        self.root = root
+        self._constants: dict[Region, dict[tuple, Operation]] = {}
+        self._keys: dict[Operation, tuple[Region, tuple]] = {}
+
+    def try_fold(self, operation: Operation) -> bool:
+        """Attempts to fold an operation, replacing and erasing it if it folded to
+        values or constants. Returns True if the IR was changed."""
+        operand_constants = [
+            get_constant_value(operand.value) for operand in operation.operands
+        ]
+        results = operation.fold(operand_constants)
+        if results is None:
+            return False
+        if not results:
+            notify_operations_modified([operation])
+            return True
+        if len(results) != len(operation.results):
+            raise ValueError(
+                f"{operation.get_operation_name()} folded to {len(results)} values, but "
+                f"has {len(operation.results)} results."
+            )
+
+        replacements: list[Value] = []
+        for result, folded in zip(operation.results, results):
+            if isinstance(folded, Value):
+                replacements.append(folded)
+                continue
+            constant = self.get_or_create_constant(operation, folded, result.type)
+            if constant is None:
+                return False
+            replacements.append(constant.results[0])
+        operation.replace_all_uses_with(replacements)
+        operation.erase()
+        return True
+
+    def get_or_create_constant(
+        self,
+        anchor: Operation,
+        value: AttributeBase,
+        type: TypeBase,
+        operation_class: type[Operation] | None = None,
+    ) -> Operation | None:
+        """Returns the constant operation for a value in the insertion region of an
+        operation, materializing it with ``operation_class``, or the operation's class,
+        if there isn't one yet. Returns None if the constant can't be materialized."""
+        region = self._insertion_region(anchor)
+        key = self._key(value, type)
+        constant = self._constants.get(region, {}).get(key)
+        if constant is not None:
+            return constant
+        materializer = anchor if operation_class is None else operation_class
+        value = value.get(self.context, value.attribute_type, value.value)
+        constant = materializer.materialize_constant(value, type)
+        if constant is None:
+            return None
+        region.front.push_front(constant)
+        self._record(constant, region, key)
+        return constant
+
+    def insert_known_constant(self, constant: Operation) -> bool:
+        """Records a constant operation found in the IR. If an equal constant already
+        exists in its insertion region, the operation is replaced with it and erased, and
+        True is returned. Otherwise the constant is hoisted to the start of the region's
+        entry block if needed, so that it dominates every later duplicate."""
+        region = self._insertion_region(constant)
+        key = self._key(constant.attributes["value"], constant.results[0].type)
+        existing = self._constants.get(region, {}).get(key)
+        if existing is constant:
+            return False
+        if existing is not None:
+            constant.replace_all_uses_with(existing)
+            constant.erase()
+            return True
+        if constant.parent is not region.front:
+            constant.parent.remove_operation(constant)
+            region.front.push_front(constant)
+        self._record(constant, region, key)
+        return False
+
+    def notify_operation_removed(self, operation: Operation):
+        """Forgets a constant that is removed from the IR."""
+        entry = self._keys.pop(operation, None)
+        if entry is not None:
+            region, key = entry
+            del self._constants[region][key]
+
+    def _key(self, value: AttributeBase, type: TypeBase) -> tuple:
+        # Attributes compare equal by value, which conflates 0.0 and -0.0, so constants
+        # are keyed by the storage key the attribute is uniqued under.
+        return (value.get_storage_key(), type)
+
+    def _record(self, constant: Operation, region: "Region", key: tuple):
+        self._constants.setdefault(region, {})[key] = constant
+        self._keys[constant] = (region, key)
+
+    def _insertion_region(self, operation: Operation) -> "Region":
+        region = operation.parent.owner
+        while True:
+            parent = region.parent
+            if (
+                parent is None
+                or parent is self.root
+                or isinstance(parent, IsolatedFromAbove)
+                or parent.parent is None
+                or parent.parent.owner is None
+            ):
+                return region
+            region = parent.parent.owner
+
+
+def get_constant_value(value: Value | None) -> AttributeBase | None:
+    """Returns the constant a value is known to hold, if it is produced by a constant-like
+    operation, or None otherwise."""
+    owner = getattr(value, "owner", None)
+    if isinstance(owner, ConstantLike):
+        return owner.attributes["value"]
+    return None
@@ -0,0 +1,218 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Sequence
+
+from mlir.ir.listeners import IRListener, listen
+from mlir.ir.operations import Operation
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.traits.effects import NoMemoryEffect
+
+from .folding import OperationFolder
+from .patterns import FrozenRewritePatternSet, PatternRewriter, RewritePattern
+
+if TYPE_CHECKING:
+    from mlir.context import MLIRContext
+
+
+class Worklist:
+    """A LIFO worklist of operations without duplicates, supporting O(1) removal.
+
+    Removed entries are left as holes in the list and skipped when popped.
+    """
+
+    def __init__(self):
+        self._list: list[Operation | None] = []
+        self._index: dict[Operation, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, operation: Operation) -> bool:
+        return operation in self._index
+
+    def push(self, operation: Operation):
+        """Adds an operation to the worklist, unless it is already there."""
+        if operation not in self._index:
+            self._index[operation] = len(self._list)
+            self._list.append(operation)
+
+    def pop(self) -> Operation | None:
+        """Removes and returns the most recently added operation, or None if empty."""
+        while self._list:
+            operation = self._list.pop()
+            if operation is not None:
+                del self._index[operation]
+                return operation
+        return None
+
+    def remove(self, operation: Operation):
+        """Removes an operation from the worklist, if it is there."""
+        index = self._index.pop(operation, None)
+        if index is not None:
+            self._list[index] = None
+
+
+class GreedyPatternRewriteDriver(IRListener, PatternRewriter):
+    """Applies patterns to the operations nested in a root operation until a fixpoint.
+
+    Every nested operation is added to a worklist once. When a pattern rewrites an
+    operation, only the IR around the change is re-enqueued: the operation itself, its
+    users and the defining operations of its operands. The driver is also the listener
+    while patterns run, so operations inserted, modified (e.g. by replacing uses) or
+    removed by a pattern update the worklist, without re-scanning the IR.
+
+    Before the patterns, trivially dead operations (unused operations without side
+    effects, see :func:`is_trivially_dead`) are erased, and if a context is given,
+    operations are folded with an :class:`OperationFolder`, which also deduplicates the
+    constants in each region.
+
+    The driver counts how often each pattern is attempted and how often it succeeds in
+    ``statistics``, under the keys ``"<pattern>.attempted"`` and ``"<pattern>.succeeded"``,
+    along with the number of operations ``"folded"``, ``"constants-deduplicated"`` and
+    ``"dead-erased"``.
+
+    :param root: The operation whose regions are rewritten.
+    :param patterns: The patterns to apply, frozen into a set if they are not already.
+    :param max_rewrites: The maximum number of rewrites to apply, or None for no limit.
+    :param context: The context constants are uniqued in, or None to disable folding.
+    """
+
+    def __init__(
+        self,
+        root: Operation,
+        patterns: FrozenRewritePatternSet | Sequence[RewritePattern],
+        max_rewrites: int | None = None,
+        context: "MLIRContext | None" = None,
+    ):
+        self.root = root
+        if not isinstance(patterns, FrozenRewritePatternSet):
+            patterns = FrozenRewritePatternSet(patterns)
+        self.patterns = patterns
+        self.max_rewrites = max_rewrites
+        self.folder = OperationFolder(context, root) if context is not None else None
+        self.worklist = Worklist()
+        self.number_of_rewrites = 0
+        self.statistics: Counter[str] = Counter()
+
+    def run(self) -> bool:
+        """Runs the driver, returning True if a fixpoint was reached, or False if the
+        rewrite limit was hit first."""
+        operations = []
+        regions = list(reversed(self.root.regions))
+        while regions:
+            region = regions.pop()
+            for block in region:
+                for operation in block:
+                    operations.append(operation)
+                    regions.extend(reversed(operation.regions))
+        # The worklist is LIFO, so push in reverse to visit operations in order.
+        for operation in reversed(operations):
+            self.worklist.push(operation)
+
+        with listen(self):
+            while (operation := self.worklist.pop()) is not None:
+                if not self._is_attached(operation):
+                    continue
+                if not self.process(operation):
+                    continue
+                self.number_of_rewrites += 1
+                if self._is_attached(operation):
+                    self.worklist.push(operation)
+                    self._push_users(operation)
+                    self._push_operand_definers(operation)
+                if (
+                    self.max_rewrites is not None
+                    and self.number_of_rewrites >= self.max_rewrites
+                ):
+                    return len(self.worklist) == 0
+        return True
+
+    def process(self, operation: Operation) -> bool:
+        """Erases, folds or tries the patterns on an operation, returning True if the IR
+        was changed."""
+        if is_trivially_dead(operation):
+            operation.erase()
+            self.statistics["dead-erased"] += 1
+            return True
+        if self.folder is not None:
+            if isinstance(operation, ConstantLike):
+                if self.folder.insert_known_constant(operation):
+                    self.statistics["constants-deduplicated"] += 1
+                    return True
+            elif self.folder.try_fold(operation):
+                self.statistics["folded"] += 1
+                return True
+        for pattern in self.patterns.get_patterns(operation):
+            self.statistics[f"{pattern.name}.attempted"] += 1
+            if pattern.match_and_rewrite(operation, self):
+                self.statistics[f"{pattern.name}.succeeded"] += 1
+                return True
+        return False
+
+    def notify_operation_inserted(self, operation: Operation):
+        self.worklist.push(operation)
+
+    def notify_operation_removed(self, operation: Operation):
+        self.worklist.remove(operation)
+        if self.folder is not None:
+            self.folder.notify_operation_removed(operation)
+        # The operations defining its operands may have become dead.
+        self._push_operand_definers(operation)
+
+    def notify_operations_modified(self, operations: list[Operation]):
+        for operation in operations:
+            self.worklist.push(operation)
+
+    def _is_attached(self, operation: Operation) -> bool:
+        """Returns True if the operation is still nested within the root operation."""
+        while True:
+            block = operation.parent
+            if block is None or block.owner is None:
+                return False
+            operation = block.owner.parent
+            if operation is self.root:
+                return True
+            if operation is None:
+                return False
+
+    def _push_users(self, operation: Operation):
+        for result in operation.results:
+            use = result._first_use
+            while use is not None:
+                if use.owner is not None:
+                    self.worklist.push(use.owner)
+                use = use._next_use
+
+    def _push_operand_definers(self, operation: Operation):
+        for operand in operation.operands:
+            owner = getattr(operand.value, "owner", None)
+            if isinstance(owner, Operation):
+                self.worklist.push(owner)
+
+
+def is_trivially_dead(operation: Operation) -> bool:
+    """Returns True if an operation can be erased because its results are unused and it
+    has no other effect: it is constant-like, or has no memory effects and no regions
+    that could hold operations with effects."""
+    if not all(result.use_empty for result in operation.results):
+        return False
+    if isinstance(operation, ConstantLike):
+        return True
+    return isinstance(operation, NoMemoryEffect) and not operation.regions
+
+
+def apply_patterns_greedily(
+    root: Operation,
+    patterns: FrozenRewritePatternSet | Sequence[RewritePattern],
+    max_rewrites: int | None = None,
+    statistics: Counter[str] | None = None,
+    context: "MLIRContext | None" = None,
+) -> bool:
+    """Applies the patterns to the operations nested in the root operation until no
+    pattern applies or the rewrite limit is reached. Returns True if a fixpoint was
+    reached. The statistics of the run are added to ``statistics``, if given. If a
+    context is given, operations are also folded."""
+    driver = GreedyPatternRewriteDriver(root, patterns, max_rewrites, context)
+    converged = driver.run()
+    if statistics is not None:
+        statistics.update(driver.statistics)
+    return converged
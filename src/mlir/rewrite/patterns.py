@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import ClassVar, Sequence
+
+from mlir.ir.listeners import notify_operations_modified
+from mlir.ir.operations import Operation
+from mlir.ir.traits.base import OpTrait
+from mlir.ir.value import Value
+
+
+class RewritePattern(ABC):
+    """Base class for rewrite patterns, which match an operation and rewrite it.
+
+    A pattern declares the ``root`` it applies to, which is either an operation class or
+    a trait, and a ``benefit`` used to order patterns that apply to the same operation:
+    patterns with a higher benefit are tried first.
+    """
+
+    root: ClassVar[type[Operation] | type[OpTrait] | None] = None
+    """The operation class or trait the pattern applies to, or None for any operation."""
+
+    benefit: ClassVar[int] = 1
+    """The expected benefit of applying the pattern, used for ordering."""
+
+    @property
+    def name(self) -> str:
+        """The name of the pattern, used when reporting statistics."""
+        return type(self).__name__
+
+    @abstractmethod
+    def match_and_rewrite(
+        self, operation: Operation, rewriter: "PatternRewriter"
+    ) -> bool:
+        """Attempts to rewrite the operation, returning True if the IR was changed. All
+        changes must be made through the rewriter, or through the IR classes, which
+        notify the driver."""
+        pass
+
+
+class PatternRewriter:
+    """The interface patterns use to change the IR.
+
+    The IR classes notify the active listener of insertions, removals and replacements
+    themselves, so the rewriter is a thin layer over them that provides the common
+    rewrites in one place. A driver installs itself as the listener while patterns run.
+    """
+
+    def insert_before(self, anchor: Operation, operation: Operation) -> Operation:
+        """Inserts an operation directly before another, returning the inserted
+        operation."""
+        anchor.parent.insert_before(anchor, operation)
+        return operation
+
+    def insert_after(self, anchor: Operation, operation: Operation) -> Operation:
+        """Inserts an operation directly after another, returning the inserted
+        operation."""
+        anchor.parent.insert_after(anchor, operation)
+        return operation
+
+    def erase_op(self, operation: Operation):
+        """Erases an operation whose results have no uses."""
+        operation.erase()
+
+    def replace_op(self, operation: Operation, values: Operation | Sequence[Value]):
+        """Replaces the results of an operation with the given values, or the results of
+        another operation, and erases it."""
+        operation.replace_all_uses_with(values)
+        operation.erase()
+
+    def replace_all_uses_with(self, value: Value, replacement: Value):
+        """Replaces all uses of a value with another value."""
+        value.replace_all_uses_with(replacement)
+
+    def notify_operation_modified(self, operation: Operation):
+        """Reports that an operation was changed in place, e.g. its attributes."""
+        notify_operations_modified([operation])
+
+
+class FrozenRewritePatternSet:
+    """An immutable set of patterns, indexed for dispatch by operation class.
+
+    In MLIR this is ``FrozenRewritePatternSet``. Patterns are bucketed by their root when
+    the set is frozen. The first time an operation class is seen, the buckets of every
+    class in its MRO are merged, which covers roots that are base classes or traits such
+    as ``Terminator``, and sorted by decreasing benefit. Patterns of equal benefit keep
+    the order they were given in. After that, finding the patterns for an operation is a
+    single dictionary lookup.
+
+    :param patterns: The patterns in the set.
+    """
+
+    def __init__(self, patterns: Sequence[RewritePattern]):
+        self.patterns: tuple[RewritePattern, ...] = tuple(patterns)
+        self._buckets: dict[type | None, list[tuple[int, RewritePattern]]] = {}
+        for order, pattern in enumerate(self.patterns):
+            self._buckets.setdefault(pattern.root, []).append((order, pattern))
+        self._dispatch: dict[type[Operation], tuple[RewritePattern, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def get_patterns(self, operation: Operation) -> tuple[RewritePattern, ...]:
+        """Returns the patterns whose root matches the operation, by decreasing
+        benefit."""
+        patterns = self._dispatch.get(type(operation))
+        if patterns is None:
+            patterns = self._build_dispatch(type(operation))
+        return patterns
+
+    def _build_dispatch(
+        self, operation_class: type[Operation]
+    ) -> tuple[RewritePattern, ...]:
+        matches = list(self._buckets.get(None, ()))
+        for base in operation_class.__mro__:
+            matches.extend(self._buckets.get(base, ()))
+        matches.sort(key=lambda match: (-match[1].benefit, match[0]))
+        patterns = tuple(pattern for _, pattern in matches)
+        self._dispatch[operation_class] = patterns
+        return patterns
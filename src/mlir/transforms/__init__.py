@@ -0,0 +1,14 @@
+from .canonicalize import CanonicalizePass, canonicalization_patterns
+from .cse import CSEPass, operation_key
+from .dce import DeadCodeEliminationPass, erase_unreachable_blocks
+from .sccp import SCCPPass
+
+__all__ = [
+    "CanonicalizePass",
+    "canonicalization_patterns",
+    "CSEPass",
+    "operation_key",
+    "DeadCodeEliminationPass",
+    "erase_unreachable_blocks",
+    "SCCPPass",
+]
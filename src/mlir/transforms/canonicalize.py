@@ -0,0 +1,41 @@
+from mlir.context import MLIRContext
+from mlir.ir.operations import Operation, registered_operations
+from mlir.passes import Pass, register_pass
+from mlir.rewrite import FrozenRewritePatternSet, apply_patterns_greedily
+
+
+@register_pass
+class CanonicalizePass(Pass):
+    """Canonicalizes the IR by folding operations and applying the canonicalization
+    patterns of every registered operation, until a fixpoint.
+
+    Folded constants are uniqued in the context and materialized once per region, and
+    duplicate constants already in the IR are merged, see
+    :class:`mlir.rewrite.OperationFolder`.
+
+    Options:
+
+    * ``max-rewrites``: the maximum number of rewrites to apply, unlimited by default.
+    """
+
+    argument = "canonicalize"
+
+    def run_on_operation(self, operation: Operation, context: MLIRContext):
+        apply_patterns_greedily(
+            operation,
+            canonicalization_patterns(),
+            max_rewrites=self.options.get("max_rewrites"),
+            statistics=self.statistics,
+            context=context,
+        )
+
+
+def canonicalization_patterns() -> FrozenRewritePatternSet:
+    """Returns the canonicalization patterns of every registered operation."""
+    return FrozenRewritePatternSet(
+        [
+            pattern
+            for operation_class in registered_operations()
+            for pattern in operation_class.get_canonicalization_patterns()
+        ]
+    )
@@ -0,0 +1,97 @@
+from mlir.context import MLIRContext
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
+from mlir.ir.traits.effects import NoMemoryEffect
+from mlir.ir.traits.regions import IsolatedFromAbove
+from mlir.passes import Pass, register_pass
+from mlir.utils.scoped_hash_table import ScopedHashTable
+
+
+@register_pass
+class CSEPass(Pass):
+    """Eliminates common subexpressions: operations without memory effects that compute
+    the same thing as an earlier operation are replaced by it.
+
+    Two operations are equivalent if they have the same class, the same operand values,
+    the same attributes and the same result types, see :func:`operation_key`. Types and
+    attributes are compared by identity, so only those uniqued in the context (with
+    ``get``) are recognised as equal, which makes the hash cheap to compute.
+
+    Known operations are kept in a scoped hash table that follows region nesting: an
+    operation can be replaced by one from an enclosing block that precedes it, and the
+    blocks of a region other than the entry block also see the entry block, which
+    dominates them. Operations isolated from above start from an empty table.
+    """
+
+    argument = "cse"
+
+    def run_on_operation(self, operation: Operation, context: MLIRContext):
+        known: ScopedHashTable[tuple, Operation] = ScopedHashTable()
+        duplicates: list[Operation] = []
+        with known.scope():
+            for region in operation.regions:
+                _simplify_region(region, known, duplicates)
+        for duplicate in reversed(duplicates):
+            duplicate.erase()
+        self.statistics["eliminated"] += len(duplicates)
+
+
+def operation_key(operation: Operation) -> tuple:
+    """Returns the structural key of an operation: its class, operand values, attributes
+    and result types. Attributes and types are keyed by identity."""
+    return (
+        type(operation),
+        tuple(operand.value for operand in operation.operands),
+        tuple(
+            sorted((name, id(value)) for name, value in operation.attributes.items())
+        ),
+        tuple(id(result.type) for result in operation.results),
+    )
+
+
+def _is_eligible(operation: Operation) -> bool:
+    return (
+        isinstance(operation, NoMemoryEffect)
+        and not operation.regions
+        and len(operation.results) > 0
+    )
+
+
+def _simplify_region(
+    region: Region,
+    known: ScopedHashTable[tuple, Operation],
+    duplicates: list[Operation],
+):
+    entry = region.front
+    if entry is None:
+        return
+    with known.scope():
+        _simplify_block(entry, known, duplicates)
+        block = entry.next_node
+        while block is not None:
+            with known.scope():
+                _simplify_block(block, known, duplicates)
+            block = block.next_node
+
+
+def _simplify_block(
+    block: Block,
+    known: ScopedHashTable[tuple, Operation],
+    duplicates: list[Operation],
+):
+    for operation in block:
+        if operation.regions:
+            with known.scope(isolated=isinstance(operation, IsolatedFromAbove)):
+                for region in operation.regions:
+                    _simplify_region(region, known, duplicates)
+        if not _is_eligible(operation):
+            continue
+        key = operation_key(operation)
+        existing = known.lookup(key)
+        if existing is None:
+            known.insert(key, operation)
+            continue
+        # Replace the uses right away, so that the users can match existing operations.
+        operation.replace_all_uses_with(existing)
+        duplicates.append(operation)
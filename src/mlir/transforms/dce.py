@@ -0,0 +1,128 @@
+from mlir.context import MLIRContext
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
+from mlir.ir.traits.branch import BranchOpInterface
+from mlir.ir.value import BlockArgument, Value
+from mlir.passes import Pass, register_pass
+from mlir.rewrite import Worklist, is_trivially_dead
+
+
+@register_pass
+class DeadCodeEliminationPass(Pass):
+    """Removes unreachable blocks, unused operations without side effects and unused
+    block arguments.
+
+    Blocks that can't be reached from the entry block of their region through
+    ``Block.successors`` are erased first. The IR is then walked once to seed a worklist
+    with every operation, after which erasure cascades through the use-lists: erasing an
+    operation enqueues the operations defining its operands, and marks the blocks whose
+    arguments it used. Unused arguments of a marked block are removed in bulk, along with
+    the operands forwarded to them by every predecessor, found through the block's
+    use-list, provided each predecessor implements :class:`BranchOpInterface`. Arguments
+    of entry blocks are never removed.
+
+    Statistics are kept for the number of ``"erased-blocks"``, ``"erased-operations"`` and
+    ``"erased-arguments"``.
+    """
+
+    argument = "dce"
+
+    def run_on_operation(self, operation: Operation, context: MLIRContext):
+        worklist = Worklist()
+        candidates: set[Block] = set()
+
+        regions = list(reversed(operation.regions))
+        while regions:
+            region = regions.pop()
+            self.statistics["erased-blocks"] += erase_unreachable_blocks(region)
+            for block in region:
+                if block._arguments and block is not region.front:
+                    candidates.add(block)
+                for op in block:
+                    worklist.push(op)
+                    regions.extend(reversed(op.regions))
+
+        while len(worklist) or candidates:
+            while (op := worklist.pop()) is not None:
+                if op.parent is None or not is_trivially_dead(op):
+                    continue
+                values = [operand.value for operand in op.operands]
+                op.erase()
+                self.statistics["erased-operations"] += 1
+                _enqueue_definers(values, worklist, candidates)
+
+            while candidates:
+                block = candidates.pop()
+                self.statistics["erased-arguments"] += _erase_dead_arguments(
+                    block, worklist, candidates
+                )
+
+
+def erase_unreachable_blocks(region: Region) -> int:
+    """Erases the blocks of a region that are unreachable from its entry block, returning
+    how many were erased."""
+    entry = region.front
+    if entry is None or entry.next_node is None:
+        return 0
+    reachable = {entry}
+    stack = [entry]
+    while stack:
+        for successor in stack.pop().successors:
+            if successor not in reachable:
+                reachable.add(successor)
+                stack.append(successor)
+
+    unreachable = [block for block in region if block not in reachable]
+    for block in unreachable:
+        for op in block:
+            op.drop_all_references()
+    for block in unreachable:
+        # Unreachable blocks can only be used from other unreachable blocks, but drop any
+        # remaining uses so that no operation is left referring to an erased value.
+        for value in _defined_values(block):
+            for use in value.uses:
+                use.drop()
+        region.remove(block)
+    return len(unreachable)
+
+
+def _defined_values(block: Block) -> list[Value]:
+    values = list(block._arguments)
+    for op in block:
+        values.extend(op.results)
+    return values
+
+
+def _erase_dead_arguments(
+    block: Block, worklist: Worklist, candidates: set[Block]
+) -> int:
+    """Removes the unused arguments of a block, and the operands forwarded to them by its
+    predecessors, returning how many were removed."""
+    dead = [argument.index for argument in block._arguments if argument.use_empty]
+    if not dead or block.owner is None or block is block.owner.front:
+        return 0
+    uses = block.uses
+    if not all(isinstance(use.owner, BranchOpInterface) for use in uses):
+        return 0
+
+    for use in uses:
+        operands = use.owner.get_successor_operands(use.index)
+        values = [operands[position].value for position in dead]
+        use.owner.erase_successor_operands(use.index, dead)
+        _enqueue_definers(values, worklist, candidates)
+    block.remove_arguments(dead)
+    return len(dead)
+
+
+def _enqueue_definers(
+    values: list[Value | None], worklist: Worklist, candidates: set[Block]
+):
+    """Enqueues what may have become dead after uses of the values were dropped: the
+    defining operations, or the blocks owning the arguments."""
+    for value in values:
+        if isinstance(value, BlockArgument):
+            if value.owner is not None and value.use_empty:
+                candidates.add(value.owner)
+        elif value is not None and isinstance(value.owner, Operation):
+            worklist.push(value.owner)
@@ -0,0 +1,123 @@
+from mlir.analysis.dataflow import (
+    CFGEdge,
+    ConstantLattice,
+    DataFlowSolver,
+    DeadCodeAnalysis,
+    Executable,
+    SparseConstantPropagation,
+)
+from mlir.context import MLIRContext
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.value import Value
+from mlir.passes import Pass, register_pass
+from mlir.rewrite import OperationFolder, PatternRewriter, is_trivially_dead
+
+from .canonicalize import canonicalization_patterns
+from .dce import erase_unreachable_blocks
+
+
+@register_pass
+class SCCPPass(Pass):
+    """Sparse conditional constant propagation.
+
+    In MLIR this is ``SCCP``. Constants and block executability are solved together with
+    :class:`~mlir.analysis.dataflow.SparseConstantPropagation` and
+    :class:`~mlir.analysis.dataflow.DeadCodeAnalysis`, so that values are only joined
+    along edges that can be taken, and branches on values that become constant prune the
+    code behind them.
+
+    In each live block, values known to be constant are replaced with materialized
+    constants, and operations left trivially dead are erased. Terminators that can only
+    take some of their successors are simplified with their canonicalization patterns,
+    e.g. a ``cf.cond_br`` on a constant becomes a ``cf.br``, after which the blocks that
+    are no longer reachable are erased.
+
+    Statistics are kept for the number of ``"replaced-values"``, ``"erased-operations"``,
+    ``"simplified-branches"`` and ``"erased-blocks"``.
+    """
+
+    argument = "sccp"
+
+    def run_on_operation(self, operation: Operation, context: MLIRContext):
+        solver = DataFlowSolver()
+        solver.load(DeadCodeAnalysis)
+        solver.load(SparseConstantPropagation)
+        solver.initialize_and_run(operation)
+
+        folder = OperationFolder(context, operation)
+        rewriter = PatternRewriter()
+        patterns = canonicalization_patterns()
+
+        regions = list(reversed(operation.regions))
+        while regions:
+            region = regions.pop()
+            pruned = False
+            for block in list(region):
+                if not _is_live(solver, block):
+                    continue
+                for argument in block._arguments:
+                    self._replace_with_constant(solver, folder, argument, block.front)
+                for op in list(block):
+                    if isinstance(op, ConstantLike):
+                        folder.insert_known_constant(op)
+                        continue
+                    replaced = [
+                        self._replace_with_constant(solver, folder, result, op)
+                        for result in op.results
+                    ]
+                    if replaced and all(replaced) and is_trivially_dead(op):
+                        op.erase()
+                        self.statistics["erased-operations"] += 1
+                        continue
+                    regions.extend(reversed(op.regions))
+
+                terminator = block.back
+                if terminator is not None and _has_dead_successor(solver, terminator):
+                    for pattern in patterns.get_patterns(terminator):
+                        if pattern.match_and_rewrite(terminator, rewriter):
+                            self.statistics["simplified-branches"] += 1
+                            pruned = True
+                            break
+            if pruned:
+                self.statistics["erased-blocks"] += erase_unreachable_blocks(region)
+
+    def _replace_with_constant(
+        self,
+        solver: DataFlowSolver,
+        folder: OperationFolder,
+        value: Value,
+        anchor: Operation | None,
+    ) -> bool:
+        """Replaces the uses of a value with a materialized constant, if it is known to be
+        constant. Returns True if the value has no uses left."""
+        lattice = solver.lookup_state(value, ConstantLattice)
+        if lattice is None or lattice.is_uninitialized or lattice.value.is_unknown:
+            return False
+        if value.use_empty:
+            return True
+        if anchor is None:
+            return False
+        constant = folder.get_or_create_constant(
+            anchor, lattice.value.constant, value.type, lattice.value.operation_class
+        )
+        if constant is None:
+            return False
+        value.replace_all_uses_with(constant.results[0])
+        self.statistics["replaced-values"] += 1
+        return True
+
+
+def _is_live(solver: DataFlowSolver, block: Block) -> bool:
+    state = solver.lookup_state(block, Executable)
+    return state is not None and state.live
+
+
+def _has_dead_successor(solver: DataFlowSolver, terminator: Operation) -> bool:
+    block = terminator.parent
+    for successor in terminator.successors:
+        state = solver.lookup_state(CFGEdge(block, successor), Executable)
+        if state is None or not state.live:
+            return True
+    return False
@@ -0,0 +1,69 @@
+import io
+import pickle
+from typing import Any, Sequence
+
+
+def get_slot_state(
+    obj: Any, exclude: tuple[str, ...] = ()
+) -> tuple[dict | None, dict[str, Any]]:
+    """Returns the pickle state of an object with ``__slots__``, as a tuple of its instance
+    dictionary (if it has one) and a dictionary of its set slots, minus the excluded
+    slots.
+
+    The IR classes use this to leave out intrusive links (siblings in a block, uses of a
+    value), which are rebuilt on unpickling instead. Pickling those links directly would
+    recurse once per node of the list.
+    """
+    state = object.__getstate__(obj)
+    if isinstance(state, tuple):
+        instance_dict, slots = state
+    else:
+        instance_dict, slots = state, {}
+    slots = {name: value for name, value in slots.items() if name not in exclude}
+    return instance_dict or None, slots
+
+
+def set_slot_state(obj: Any, state: tuple[dict | None, dict[str, Any]]):
+    """Restores state produced by :func:`get_slot_state`."""
+    instance_dict, slots = state
+    if instance_dict:
+        obj.__dict__.update(instance_dict)
+    for name, value in slots.items():
+        setattr(obj, name, value)
+
+
+class _BoundaryPickler(pickle.Pickler):
+    """Pickles references to external objects by their index instead of by value."""
+
+    def __init__(self, file, external: Sequence[object]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._external = {id(obj): index for index, obj in enumerate(external)}
+
+    def persistent_id(self, obj):
+        return self._external.get(id(obj))
+
+
+class _BoundaryUnpickler(pickle.Unpickler):
+    """Resolves external references written by :class:`_BoundaryPickler`."""
+
+    def __init__(self, file, external: Sequence[object]):
+        super().__init__(file)
+        self._external = external
+
+    def persistent_load(self, pid):
+        return self._external[pid]
+
+
+def dumps(obj: Any, external: Sequence[object] = ()) -> bytes:
+    """Pickles an object, writing references to any of the external objects as
+    placeholders. This is used to send part of the IR to another process without
+    dragging along the IR around it, e.g. by passing the parent operation as external."""
+    buffer = io.BytesIO()
+    _BoundaryPickler(buffer, external).dump(obj)
+    return buffer.getvalue()
+
+
+def loads(data: bytes, external: Sequence[object] = ()) -> Any:
+    """Unpickles an object written by :func:`dumps`, replacing the placeholders with the
+    given external objects (matched by position)."""
+    return _BoundaryUnpickler(io.BytesIO(data), external).load()
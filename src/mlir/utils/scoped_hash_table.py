@@ -0,0 +1,61 @@
+from contextlib import contextmanager
+from typing import Generic, Hashable, Iterator, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ScopedHashTable(Generic[K, V]):
+    """A hash table whose entries are grouped into nested scopes.
+
+    In MLIR this is ``llvm::ScopedHashTable``. Each key maps to a stack of values, the
+    innermost of which is visible, and closing a scope pops every entry inserted in it.
+    Lookups and insertions are O(1) regardless of the nesting depth. A scope can also be
+    opened as isolated, in which case entries of the enclosing scopes are hidden until it
+    is closed.
+    """
+
+    def __init__(self):
+        self._table: dict[K, list[tuple[int, V]]] = {}
+        self._scopes: list[list[K]] = []
+        self._floor = 0
+
+    @contextmanager
+    def scope(self, isolated: bool = False) -> Iterator[None]:
+        """Opens a scope for the duration of the context. Entries inserted within it are
+        removed when it closes."""
+        floor = self._floor
+        self._scopes.append([])
+        if isolated:
+            self._floor = len(self._scopes)
+        try:
+            yield
+        finally:
+            depth = len(self._scopes)
+            for key in self._scopes.pop():
+                stack = self._table.get(key)
+                if stack is None:
+                    continue
+                while stack and stack[-1][0] == depth:
+                    stack.pop()
+                if not stack:
+                    del self._table[key]
+            self._floor = floor
+
+    def insert(self, key: K, value: V):
+        """Inserts an entry into the innermost scope, shadowing any visible entry with
+        the same key."""
+        if not self._scopes:
+            raise RuntimeError("Cannot insert into a ScopedHashTable without a scope.")
+        self._table.setdefault(key, []).append((len(self._scopes), value))
+        self._scopes[-1].append(key)
+
+    def lookup(self, key: K) -> V | None:
+        """Returns the visible value for a key, or None."""
+        stack = self._table.get(key)
+        if not stack or stack[-1][0] < self._floor:
+            return None
+        return stack[-1][1]
+
+    def __contains__(self, key: K) -> bool:
+        return self.lookup(key) is not None
@@ -0,0 +1,66 @@
+import threading
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class StorageUniquer(Generic[K, V]):
+    """A map from keys to uniqued values, such as types and attributes, that is safe to
+    use from several threads.
+
+    In MLIR this is ``StorageUniquer``. Entries are spread over a number of shards by the
+    hash of their key, and each shard is a dictionary guarded by its own lock, so threads
+    creating different values rarely wait on each other. Looking up a value that already
+    exists takes no lock, as entries are never removed or replaced once stored. A value
+    is created outside of the lock and then published under it; if another thread stored
+    the same key in the meantime, its value is returned instead and the new one dropped.
+
+    :param number_of_shards: The number of shards, which is rounded up to a power of two.
+    """
+
+    def __init__(self, number_of_shards: int = 32):
+        number_of_shards = 1 << max(number_of_shards - 1, 0).bit_length()
+        self._mask = number_of_shards - 1
+        self._shards: list[dict[K, V]] = [{} for _ in range(number_of_shards)]
+        self._locks = [threading.Lock() for _ in range(number_of_shards)]
+
+    @property
+    def number_of_shards(self) -> int:
+        return len(self._shards)
+
+    def lookup(self, key: K) -> V | None:
+        """Returns the value stored for a key, or None, without taking a lock."""
+        return self._shards[hash(key) & self._mask].get(key)
+
+    def get_or_create(self, key: K, create: Callable[[], V]) -> V:
+        """Returns the value stored for a key, calling ``create`` to make it if there is
+        none. Every caller gets the same value for the same key, even if several race to
+        create it."""
+        index = hash(key) & self._mask
+        shard = self._shards[index]
+        value = shard.get(key)
+        if value is not None:
+            return value
+        value = create()
+        # Keys may compare in Python code, which can switch threads, so the check and the
+        # insertion are only atomic under the lock.
+        with self._locks[index]:
+            return shard.setdefault(key, value)
+
+    def values(self) -> list[V]:
+        """Returns every stored value."""
+        values = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                values.extend(shard.values())
+        return values
+
+    def __contains__(self, key: K) -> bool:
+        return self.lookup(key) is not None
+
+    def __getitem__(self, key: K) -> V:
+        return self._shards[hash(key) & self._mask][key]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
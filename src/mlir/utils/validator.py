@@ -1,3 +1,12 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_validation_deferred: ContextVar[bool] = ContextVar(
+    "mlir_validation_deferred", default=False
+)
+
+
 def validator(method):
     """This decorates methods with a validator, which when combined with the ValidatorMeta
     metaclass, will run the method after __init__."""
@@ -17,13 +26,29 @@ class ValidatorError(Exception):
         return f"Validation failed with the following errors:\n{messages}"
 
 
+@contextmanager
+def deferred_validation() -> Iterator[None]:
+    """Skips running validators when objects are constructed within the context.
+
+    This is a builder mode for constructing large amounts of IR quickly: the validators
+    are instead run once over the finished IR with :func:`mlir.ir.verifier.verify`.
+    """
+    token = _validation_deferred.set(True)
+    try:
+        yield
+    finally:
+        _validation_deferred.reset(token)
+
+
 class ValidatorMeta(type):
     """Metaclass for adding the functionality to add validators to a class that run on
     instantiation.
 
     Validators can be added to a class by adding the @validator decorator to a method.
     They are expected to be able to execute in a commutative way: the order the validators
-    run shouldn't matter. This allows us to flexibly add validators in subclasses, and mix
+    run shouldn't matter. Validation on construction can be skipped with
+    :func:`deferred_validation`, in which case the collected ``_validators`` can be run
+    later. This allows us to flexibly add validators in subclasses, and mix
     in validation from traits.
 
     .. code-block:: python
@@ -63,7 +88,8 @@ class ValidatorMeta(type):
         for attr_value in namespace.values():
             if getattr(attr_value, "_is_validator", False):
                 validators.append(attr_value)
-        namespace["_validators"] = validators
+        # the same validator can be inherited through more than one base
+        namespace["_validators"] = tuple(dict.fromkeys(validators))
 
         def __post_init__(self, *args, **kwargs):
             errors = []
@@ -85,7 +111,7 @@ class ValidatorMeta(type):
             if orig_init is not object.__init__:
                 orig_init(self, *args, **kwargs)
             # Only call __post_init__ if this is the most derived class
-            if type(self) is new_cls:
+            if type(self) is new_cls and not _validation_deferred.get():
                 self.__post_init__(*args, **kwargs)
 
         setattr(new_cls, "__init__", __init__)
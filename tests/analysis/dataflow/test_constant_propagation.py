@@ -0,0 +1,102 @@
+from mlir.analysis.dataflow import (
+    ConstantLattice,
+    ConstantValue,
+    DataFlowSolver,
+    DeadCodeAnalysis,
+    Executable,
+    SparseConstantPropagation,
+)
+from mlir.dialects.arith import AddIOp, ConstantOp
+from mlir.dialects.cf import CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import FloatAttribute, IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.types import FloatType, FloatTypeKind, IntegerType
+
+
+def constant(value: int, bitwidth: int = 32) -> ConstantOp:
+    return ConstantOp.build(IntegerAttribute(type=IntegerType(bitwidth), value=value))
+
+
+def solve(function):
+    solver = DataFlowSolver()
+    solver.load(DeadCodeAnalysis)
+    solver.load(SparseConstantPropagation)
+    solver.initialize_and_run(function)
+    return solver
+
+
+def is_live(solver, block):
+    state = solver.lookup_state(block, Executable)
+    return state is not None and state.live
+
+
+class TestConstantValue:
+    def test_join(self):
+        one = ConstantValue(constant(1).attributes["value"], ConstantOp)
+        other_one = ConstantValue(constant(1).attributes["value"])
+        two = ConstantValue(constant(2).attributes["value"], ConstantOp)
+        assert ConstantLattice.join_values(one, other_one) is one
+        assert ConstantLattice.join_values(one, two).is_unknown
+
+        lattice = ConstantLattice(None)
+        assert lattice.is_uninitialized
+        assert lattice.join(one)
+        assert not lattice.join(other_one)
+        assert lattice.join(two)
+        assert lattice.value.is_unknown
+        assert not lattice.join(one)
+
+    def test_signed_zeros_differ(self):
+        f32 = FloatType(FloatTypeKind.F32)
+        zero = ConstantValue(FloatAttribute(type=f32, value=0.0))
+        negative_zero = ConstantValue(FloatAttribute(type=f32, value=-0.0))
+        assert zero != negative_zero
+        assert ConstantLattice.join_values(zero, negative_zero).is_unknown
+
+
+class TestSparseConstantPropagation:
+    def test_folding_does_not_change_ir(self):
+        function = FuncOp.build([IntegerType(32)])
+        x = function.arguments[0]
+        one = constant(1)
+        # A constant left-hand side is moved to the right when folded by the
+        # canonicalizer, but the analysis must leave the operands in place.
+        add = AddIOp.build(one.results[0], x)
+        for op in [one, add, ReturnOp.build(add.results)]:
+            function.entry_block.push_end(op)
+
+        solver = solve(function)
+        assert solver.lookup_state(x, ConstantLattice).value.is_unknown
+        assert solver.lookup_state(add.results[0], ConstantLattice).value.is_unknown
+        assert add.lhs is one.results[0] and add.rhs is x
+
+    def test_branch_on_constant_only_takes_one_edge(self):
+        function = FuncOp.build([])
+        entry = function.entry_block
+        taken, not_taken = Block(), Block()
+        flag = constant(0, 1)
+        entry.push_end(flag)
+        entry.push_end(CondBranchOp.build(flag.results[0], not_taken, [], taken, []))
+        taken.push_end(ReturnOp.build([]))
+        not_taken.push_end(ReturnOp.build([]))
+        function.body.push_end(taken)
+        function.body.push_end(not_taken)
+
+        solver = solve(function)
+        assert is_live(solver, taken)
+        assert not is_live(solver, not_taken)
+
+    def test_branch_on_unknown_takes_every_edge(self):
+        function = FuncOp.build([IntegerType(1)])
+        entry = function.entry_block
+        first, second = Block(), Block()
+        entry.push_end(CondBranchOp.build(function.arguments[0], first, [], second, []))
+        first.push_end(ReturnOp.build([]))
+        second.push_end(ReturnOp.build([]))
+        function.body.push_end(first)
+        function.body.push_end(second)
+
+        solver = solve(function)
+        assert is_live(solver, first)
+        assert is_live(solver, second)
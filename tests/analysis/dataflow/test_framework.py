@@ -0,0 +1,95 @@
+from mlir.analysis.dataflow import (
+    AnalysisState,
+    DataFlowAnalysis,
+    DataFlowSolver,
+    DeadCodeAnalysis,
+    Executable,
+)
+from mlir.dialects.cf import BranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.blocks import Block
+
+
+class Counter(AnalysisState):
+    def __init__(self, anchor):
+        super().__init__(anchor)
+        self.count = 0
+
+
+class RecordingAnalysis(DataFlowAnalysis):
+    def __init__(self, solver, updates=0):
+        super().__init__(solver)
+        self.updates = updates
+        self.initialized = []
+        self.visited = []
+
+    def initialize_block(self, block):
+        self.initialized.append(block)
+
+    def initialize_operation(self, operation):
+        self.initialized.append(operation)
+        state = self.get_or_create_for(operation, operation.parent, Counter)
+        for _ in range(self.updates):
+            state.count += 1
+            self.propagate_if_changed(state, True)
+
+    def visit(self, point):
+        self.visited.append(point)
+
+
+def build_function():
+    function = FuncOp.build([])
+    function.entry_block.push_end(ReturnOp.build([]))
+    return function
+
+
+class TestDataFlowSolver:
+    def test_shared_walk_initializes_every_analysis(self):
+        function = build_function()
+        solver = DataFlowSolver()
+        first = solver.load(RecordingAnalysis)
+        second = solver.load(RecordingAnalysis)
+        solver.initialize_and_run(function)
+
+        expected = [function.entry_block, function.entry_block.terminator]
+        assert first.initialized == expected
+        assert second.initialized == expected
+        assert first.visited == second.visited == []
+
+    def test_states_are_unique_per_anchor_and_class(self):
+        function = build_function()
+        solver = DataFlowSolver()
+        assert solver.lookup_state(function, Counter) is None
+        state = solver.get_or_create_state(function, Counter)
+        assert solver.get_or_create_state(function, Counter) is state
+        assert solver.lookup_state(function, Counter) is state
+        assert solver.lookup_state(function, Executable) is None
+
+    def test_changes_enqueue_dependents_once(self):
+        function = build_function()
+        solver = DataFlowSolver()
+        analysis = solver.load(RecordingAnalysis, updates=2)
+        solver.initialize_and_run(function)
+
+        assert solver.lookup_state(function.entry_block, Counter).count == 2
+        assert analysis.visited == [function.entry_block.terminator]
+
+
+class TestDeadCodeAnalysis:
+    def test_unreachable_block_is_dead(self):
+        function = FuncOp.build([])
+        entry, reachable, unreachable = function.entry_block, Block(), Block()
+        entry.push_end(BranchOp.build(reachable))
+        reachable.push_end(ReturnOp.build([]))
+        unreachable.push_end(BranchOp.build(reachable))
+        function.body.push_end(reachable)
+        function.body.push_end(unreachable)
+
+        solver = DataFlowSolver()
+        solver.load(DeadCodeAnalysis)
+        solver.initialize_and_run(function)
+
+        assert solver.lookup_state(entry, Executable).live
+        assert solver.lookup_state(reachable, Executable).live
+        state = solver.lookup_state(unreachable, Executable)
+        assert state is None or not state.live
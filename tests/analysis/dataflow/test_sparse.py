@@ -0,0 +1,106 @@
+from mlir.analysis.dataflow import (
+    DataFlowSolver,
+    DeadCodeAnalysis,
+    Lattice,
+    SparseForwardDataFlowAnalysis,
+)
+from mlir.dialects.arith import AddIOp
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.operands import ZeroOperands
+from mlir.ir.types import IntegerType
+
+
+class SourceOp(Operation, ZeroOperands):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class Taint(Lattice):
+    @classmethod
+    def join_values(cls, lhs, rhs):
+        return lhs or rhs
+
+
+class TaintAnalysis(SparseForwardDataFlowAnalysis):
+    """Values computed from the result of a SourceOp are tainted."""
+
+    lattice_class = Taint
+
+    def __init__(self, solver):
+        super().__init__(solver)
+        self.visits = 0
+
+    def visit_operation(self, operation, operands, results):
+        self.visits += 1
+        if any(operand.is_uninitialized for operand in operands):
+            return
+        tainted = isinstance(operation, SourceOp) or any(
+            operand.value for operand in operands
+        )
+        for result in results:
+            self.join(result, tainted)
+
+    def set_to_entry_state(self, lattice):
+        self.join(lattice, False)
+
+
+def build_loop():
+    """entry(x, c) -> header(i) -> (body -> header(i + source) | exit -> return i)."""
+    i32 = IntegerType(32)
+    function = FuncOp.build([i32, IntegerType(1)])
+    x, c = function.arguments
+    entry = function.entry_block
+    header, body, exit_ = Block([i32]), Block(), Block()
+    i = header.get_argument(0)
+    source = SourceOp(operands=[], attributes={})
+    add = AddIOp.build(i, source.results[0])
+    entry.push_end(BranchOp.build(header, [x]))
+    header.push_end(CondBranchOp.build(c, body, [], exit_, []))
+    body.push_end(source)
+    body.push_end(add)
+    body.push_end(BranchOp.build(header, add.results))
+    exit_.push_end(ReturnOp.build([i]))
+    for block in (header, body, exit_):
+        function.body.push_end(block)
+    return function, x, i, add
+
+
+def solve(function):
+    solver = DataFlowSolver()
+    solver.load(DeadCodeAnalysis)
+    analysis = solver.load(TaintAnalysis)
+    solver.initialize_and_run(function)
+    return solver, analysis
+
+
+class TestSparseForwardDataFlowAnalysis:
+    def test_propagates_around_back_edge(self):
+        function, x, i, add = build_loop()
+        solver, _ = solve(function)
+        assert solver.lookup_state(x, Taint).value is False
+        assert solver.lookup_state(i, Taint).value is True
+        assert solver.lookup_state(add.results[0], Taint).value is True
+
+    def test_only_revisits_users_of_changed_values(self):
+        function, x, i, add = build_loop()
+        _, analysis = solve(function)
+        # The source and the add are visited when initialized, and the add once more
+        # when the taint of i flows back around the loop.
+        assert analysis.visits == 3
+
+    def test_skips_dead_blocks(self):
+        i32 = IntegerType(32)
+        function = FuncOp.build([i32])
+        dead = Block([i32])
+        source = SourceOp(operands=[], attributes={})
+        dead.push_end(source)
+        dead.push_end(BranchOp.build(dead, source.results))
+        function.entry_block.push_end(ReturnOp.build([]))
+        function.body.push_end(dead)
+
+        solver, analysis = solve(function)
+        assert analysis.visits == 0
+        assert solver.lookup_state(source.results[0], Taint).is_uninitialized
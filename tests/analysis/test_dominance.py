@@ -0,0 +1,127 @@
+import pytest
+
+from mlir.analysis import DominanceInfo, DominanceTree
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.regions import Region
+from mlir.ir.traits.regions import OneRegion
+from mlir.ir.types import IntegerType
+
+
+class ScopeOp(Operation, OneRegion):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+@pytest.fixture
+def cfg():
+    """entry -> (left | right) -> exit -> loop -> exit, plus an unreachable block."""
+    function = FuncOp.build([IntegerType(1)])
+    condition = function.arguments[0]
+    entry = function.entry_block
+    left, right, exit_, loop, dead = Block(), Block(), Block(), Block(), Block()
+    entry.push_end(CondBranchOp.build(condition, left, [], right, []))
+    left.push_end(BranchOp.build(exit_))
+    right.push_end(BranchOp.build(exit_))
+    exit_.push_end(CondBranchOp.build(condition, loop, [], exit_, []))
+    loop.push_end(BranchOp.build(exit_))
+    dead.push_end(BranchOp.build(left))
+    for block in [left, right, exit_, loop, dead]:
+        function.body.push_end(block)
+    return function, dict(
+        entry=entry, left=left, right=right, exit=exit_, loop=loop, dead=dead
+    )
+
+
+class TestDominanceTree:
+    def test_immediate_dominators(self, cfg):
+        function, blocks = cfg
+        tree = DominanceTree(function.body)
+        idom = {
+            name: tree.get_immediate_dominator(block) for name, block in blocks.items()
+        }
+        assert idom == dict(
+            entry=None,
+            left=blocks["entry"],
+            right=blocks["entry"],
+            exit=blocks["entry"],
+            loop=blocks["exit"],
+            dead=None,
+        )
+        assert tree.blocks[0] is blocks["entry"]
+        assert not tree.is_reachable(blocks["dead"])
+
+    def test_dominates(self, cfg):
+        function, blocks = cfg
+        tree = DominanceTree(function.body)
+        assert tree.dominates(blocks["entry"], blocks["loop"])
+        assert tree.dominates(blocks["exit"], blocks["loop"])
+        assert not tree.dominates(blocks["left"], blocks["exit"])
+        assert not tree.dominates(blocks["loop"], blocks["exit"])
+        # Unreachable blocks are dominated by everything, and dominate nothing else.
+        assert tree.dominates(blocks["loop"], blocks["dead"])
+        assert not tree.dominates(blocks["dead"], blocks["left"])
+
+
+class TestDominanceInfo:
+    def test_tree_is_cached_until_cfg_changes(self, cfg):
+        function, blocks = cfg
+        dominance = DominanceInfo()
+        tree = dominance.get_tree(function.body)
+        assert dominance.get_tree(function.body) is tree
+
+        # Non-branching operations don't invalidate the tree.
+        blocks["left"].push_front(ScopeOp([], {}, [Region()]))
+        assert dominance.get_tree(function.body) is tree
+
+        # Branching from entry straight to the loop changes its idom.
+        blocks["entry"].remove_operation(blocks["entry"].terminator)
+        blocks["entry"].push_end(BranchOp.build(blocks["loop"]))
+        assert not tree.is_valid
+        assert dominance.get_immediate_dominator(blocks["loop"]) is blocks["entry"]
+        assert not dominance.is_reachable(blocks["left"])
+
+        block = Block()
+        function.body.push_end(block)
+        assert dominance.get_tree(function.body).version == function.body.cfg_version
+
+    def test_operations(self, cfg):
+        function, blocks = cfg
+        dominance = DominanceInfo()
+        scope = ScopeOp([], {}, [Region([Block()])])
+        nested = ScopeOp([], {}, [Region()])
+        scope.regions[0].front.push_end(nested)
+        blocks["exit"].push_front(scope)
+        exit_branch = blocks["exit"].terminator
+        left_branch = blocks["left"].terminator
+
+        assert dominance.properly_dominates(scope, exit_branch)
+        assert not dominance.properly_dominates(exit_branch, scope)
+        assert not dominance.properly_dominates(scope, scope)
+        assert dominance.dominates(scope, scope)
+        # An operation dominates what is nested in it.
+        assert dominance.properly_dominates(scope, nested)
+        assert dominance.properly_dominates(blocks["entry"].terminator, nested)
+        assert not dominance.properly_dominates(left_branch, nested)
+        assert not dominance.properly_dominates(nested, exit_branch)
+        # Blocks.
+        assert dominance.properly_dominates(blocks["exit"], nested)
+        assert dominance.properly_dominates(blocks["exit"], blocks["loop"])
+        assert dominance.properly_dominates(scope, blocks["loop"])
+        assert not dominance.properly_dominates(scope, blocks["exit"])
+        assert not dominance.properly_dominates(blocks["loop"], scope)
+
+    def test_unrelated_regions(self):
+        module = ModuleOperation.build()
+        first, second = FuncOp.build(), FuncOp.build()
+        for function in (first, second):
+            function.entry_block.push_end(ReturnOp.build())
+        module.regions[0].push_end(Block([], [first, second]))
+        dominance = DominanceInfo()
+        assert dominance.properly_dominates(first, second)
+        assert not dominance.properly_dominates(
+            first.entry_block.terminator, second.entry_block.terminator
+        )
@@ -0,0 +1,87 @@
+from mlir.analysis import Liveness
+from mlir.dialects.arith import AddIOp
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.regions import Region
+from mlir.ir.traits.operands import VariadicOperands
+from mlir.ir.types import IntegerType
+
+
+class ScopeOp(Operation, VariadicOperands):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+def build_loop():
+    """entry(x, c) -> header(i) -> (body -> header(i + x) | exit -> return i)."""
+    i32 = IntegerType(32)
+    function = FuncOp.build([i32, IntegerType(1)])
+    x, c = function.arguments
+    entry = function.entry_block
+    header, body, exit_ = Block([i32]), Block(), Block()
+    i = header.get_argument(0)
+    add = AddIOp.build(i, x)
+    entry.push_end(BranchOp.build(header, [x]))
+    header.push_end(CondBranchOp.build(c, body, [], exit_, []))
+    body.push_end(add)
+    body.push_end(BranchOp.build(header, add.results))
+    exit_.push_end(ReturnOp.build([i]))
+    for block in (header, body, exit_):
+        function.body.push_end(block)
+    return function, (entry, header, body, exit_), (x, c, i, add)
+
+
+def as_set(values):
+    return {id(value) for value in values}
+
+
+class TestLiveness:
+    def test_loop(self):
+        function, (entry, header, body, exit_), (x, c, i, add) = build_loop()
+        liveness = Liveness(function)
+
+        assert as_set(liveness.get_live_in(entry)) == set()
+        assert as_set(liveness.get_live_out(entry)) == as_set([x, c])
+        assert as_set(liveness.get_live_in(header)) == as_set([x, c])
+        assert as_set(liveness.get_live_out(header)) == as_set([x, c, i])
+        assert as_set(liveness.get_live_in(body)) == as_set([x, c, i])
+        assert as_set(liveness.get_live_out(body)) == as_set([x, c])
+        assert as_set(liveness.get_live_in(exit_)) == as_set([i])
+        assert liveness.get_live_out(exit_) == []
+
+        info = liveness.get_block_info(body)
+        assert info.is_live_in(i) and not info.is_live_out(i)
+        assert not info.is_live_in(add.results[0])
+
+    def test_is_dead_after(self):
+        function, (entry, header, body, exit_), (x, c, i, add) = build_loop()
+        liveness = Liveness(function)
+        branch = body.terminator
+        assert liveness.is_dead_after(i, add)
+        assert not liveness.is_dead_after(add.results[0], add)
+        assert liveness.is_dead_after(add.results[0], branch)
+        # x is live around the loop.
+        assert not liveness.is_dead_after(x, add)
+
+    def test_nested_uses(self):
+        i32 = IntegerType(32)
+        function = FuncOp.build([i32])
+        x = function.arguments[0]
+        inner = Block()
+        user = AddIOp.build(x, x)
+        inner.push_end(user)
+        scope = ScopeOp([], {}, [Region([inner])])
+        before = ScopeOp([], {})
+        function.entry_block.push_end(before)
+        function.entry_block.push_end(scope)
+        function.entry_block.push_end(ReturnOp.build())
+
+        liveness = Liveness(function)
+        # The nested use keeps x alive until the operation holding the region.
+        assert not liveness.is_dead_after(x, before)
+        assert liveness.is_dead_after(x, scope)
+        assert as_set(liveness.get_live_in(inner)) == as_set([x])
+        assert liveness.get_block_info(inner).is_live_in(x)
+        assert liveness.is_dead_after(x, user)
@@ -0,0 +1,71 @@
+import pytest
+
+from mlir.dialects.arith import AddIOp, ConstantOp, IntegerBinaryOp, MulIOp, SubIOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.types import IntegerType, SignednessSemantics
+
+
+def constant(value: int, type=IntegerType(8)) -> ConstantOp:
+    return ConstantOp.build(IntegerAttribute(type=type, value=value))
+
+
+def attribute(value: int, type=IntegerType(8)) -> IntegerAttribute:
+    return IntegerAttribute(type=type, value=value)
+
+
+class TestConstantOp:
+    def test_build(self):
+        op = constant(3)
+        assert op.value == attribute(3)
+        assert op.results[0].type == IntegerType(8)
+
+
+class TestIntegerFolds:
+    @pytest.mark.parametrize(
+        "op_class, lhs, rhs, expected",
+        [
+            (AddIOp, 3, 4, 7),
+            (AddIOp, 100, 100, -56),
+            (SubIOp, 3, 4, -1),
+            (MulIOp, 16, 16, 0),
+            (MulIOp, -3, 5, -15),
+        ],
+    )
+    def test_constants(self, op_class, lhs, rhs, expected):
+        op = op_class.build(constant(lhs).results[0], constant(rhs).results[0])
+        assert op.fold([attribute(lhs), attribute(rhs)]) == [attribute(expected)]
+
+    def test_compute_is_abstract(self):
+        x = constant(1).results[0]
+        with pytest.raises(TypeError, match="compute"):
+            IntegerBinaryOp.build(x, x)
+
+    def test_unsigned_wraps(self):
+        type = IntegerType(8, SignednessSemantics.UNSIGNED)
+        lhs, rhs = constant(200, type), constant(100, type)
+        op = AddIOp.build(lhs.results[0], rhs.results[0])
+        assert op.fold([lhs.value, rhs.value]) == [attribute(44, type)]
+
+    def test_identities(self):
+        block = Block([IntegerType(8)])
+        x = block.get_argument(0)
+        zero, one = constant(0), constant(1)
+
+        assert AddIOp.build(x, zero.results[0]).fold([None, zero.value]) == [x]
+        assert SubIOp.build(x, zero.results[0]).fold([None, zero.value]) == [x]
+        assert MulIOp.build(x, one.results[0]).fold([None, one.value]) == [x]
+        assert MulIOp.build(x, zero.results[0]).fold([None, zero.value]) == [zero.value]
+        assert SubIOp.build(x, x).fold([None, None]) == [attribute(0)]
+        assert AddIOp.build(x, x).fold([None, None]) is None
+
+    def test_commutative_moves_constant_right(self):
+        block = Block([IntegerType(8)])
+        x = block.get_argument(0)
+        two = constant(2)
+        op = MulIOp.build(two.results[0], x)
+        assert op.fold([two.value, None]) == []
+        assert op.lhs is x and op.rhs is two.results[0]
+
+        op = SubIOp.build(two.results[0], x)
+        assert op.fold([two.value, None]) is None
@@ -0,0 +1,89 @@
+from mlir.dialects.arith import ConstantOp
+from mlir.dialects.cf import BranchOp, CondBranchOp, SimplifyConstCondBranch
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.operations import lookup_operation
+from mlir.ir.types import IntegerType
+from mlir.rewrite import PatternRewriter
+
+
+class TestBranchOps:
+    def test_branch(self):
+        source, dest = Block([IntegerType(32)] * 2), Block([IntegerType(32)] * 2)
+        branch = BranchOp.build(dest, source._arguments)
+        assert branch.dest is dest
+        assert branch.successors == (dest,)
+
+        branch.erase_successor_operands(0, [0])
+        assert [o.value for o in branch.get_successor_operands(0)] == [
+            source.get_argument(1)
+        ]
+
+    def test_cond_branch_operand_segments(self):
+        source = Block([IntegerType(1)] + [IntegerType(32)] * 3)
+        condition, a, b, c = source._arguments
+        true_dest, false_dest = Block(), Block()
+        branch = CondBranchOp.build(condition, true_dest, [a, b], false_dest, [c])
+        assert branch.condition is condition
+        assert branch.successors == (true_dest, false_dest)
+
+        def values(index):
+            return [o.value for o in branch.get_successor_operands(index)]
+
+        assert values(0) == [a, b]
+        assert values(1) == [c]
+
+        branch.erase_successor_operands(0, [0])
+        assert values(0) == [b]
+        assert values(1) == [c]
+        branch.erase_successor_operands(1, [0])
+        assert values(0) == [b]
+        assert values(1) == []
+        assert branch.condition is condition
+
+    def test_registered(self):
+        assert lookup_operation("cf.br") is BranchOp
+        assert lookup_operation("cf.cond_br") is CondBranchOp
+
+    def test_successor_for_constant_operands(self):
+        source = Block([IntegerType(1)])
+        true_dest, false_dest = Block(), Block()
+        branch = CondBranchOp.build(
+            source.get_argument(0), true_dest, [], false_dest, []
+        )
+        false = IntegerAttribute(type=IntegerType(1), value=0)
+        assert branch.get_successor_for_operands([None]) is None
+        assert branch.get_successor_for_operands([false]) is false_dest
+        assert BranchOp.build(true_dest).get_successor_for_operands([]) is true_dest
+
+
+class TestSimplifyConstCondBranch:
+    def test_replaces_with_branch(self):
+        i32 = IntegerType(32)
+        source = Block([i32, i32])
+        a, b = source._arguments
+        true_dest, false_dest = Block([i32]), Block([i32])
+        flag = ConstantOp.build(IntegerAttribute(type=IntegerType(1), value=0))
+        source.push_end(flag)
+        source.push_end(
+            CondBranchOp.build(flag.results[0], true_dest, [a], false_dest, [b])
+        )
+
+        pattern = SimplifyConstCondBranch()
+        assert pattern.match_and_rewrite(source.terminator, PatternRewriter())
+        branch = source.terminator
+        assert isinstance(branch, BranchOp)
+        assert branch.dest is false_dest
+        assert [operand.value for operand in branch.operands] == [b]
+        assert true_dest.use_empty and a.use_empty
+
+    def test_ignores_unknown_condition(self):
+        source = Block([IntegerType(1)])
+        source.push_end(
+            CondBranchOp.build(source.get_argument(0), Block(), [], Block(), [])
+        )
+        pattern = SimplifyConstCondBranch()
+        assert not pattern.match_and_rewrite(source.terminator, PatternRewriter())
+        assert SimplifyConstCondBranch in [
+            type(pattern) for pattern in CondBranchOp.get_canonicalization_patterns()
+        ]
@@ -0,0 +1,19 @@
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.operations import lookup_operation
+from mlir.ir.types import IntegerType
+
+
+class TestFuncOp:
+    def test_build(self):
+        function = FuncOp.build([IntegerType(32), IntegerType(16)])
+        assert function.entry_block is not None
+        assert [argument.type.bitwidth for argument in function.arguments] == [32, 16]
+
+        ret = ReturnOp.build(function.arguments)
+        function.entry_block.push_end(ret)
+        assert function.entry_block.terminator is ret
+
+    def test_registered(self):
+        assert lookup_operation("func.func") is FuncOp
+        assert lookup_operation("func.return") is ReturnOp
+        assert FuncOp.get_operation_name() == "func.func"
@@ -1,8 +1,11 @@
+import math
 from copy import deepcopy
 
 import pytest
 
-from mlir.ir.attributes import AttributeBase
+from mlir.context import MLIRContext
+from mlir.ir.attributes import AttributeBase, FloatAttribute, IntegerAttribute
+from mlir.ir.types import FloatType, FloatTypeKind, IntegerType
 
 all_types = AttributeBase.__subclasses__()
 
@@ -32,3 +35,24 @@ class TestAttributeBase:
             type_instance = type_class(**test)
             with pytest.raises(ValueError):
                 attribute_class(type=type_instance, value=value)
+
+
+def test_get_uniques_in_context():
+    context = MLIRContext()
+    first = IntegerAttribute.get(context, IntegerType(32), 7)
+    assert IntegerAttribute.get(context, IntegerType(32), 7) is first
+    assert IntegerAttribute.get(context, IntegerType(16), 7) is not first
+    assert first == IntegerAttribute(type=IntegerType(32), value=7)
+    assert context.get_attribute(first.get_storage_key()) is first
+
+
+def test_get_keys_floats_by_their_bits():
+    context = MLIRContext()
+    f32 = FloatType(FloatTypeKind.F32)
+    zero = FloatAttribute.get(context, f32, 0.0)
+    negative_zero = FloatAttribute.get(context, f32, -0.0)
+    assert negative_zero is not zero
+    assert math.copysign(1.0, negative_zero.value) == -1.0
+    assert FloatAttribute.get(context, f32, -0.0) is negative_zero
+    nan = FloatAttribute.get(context, f32, math.nan)
+    assert FloatAttribute.get(context, f32, math.nan) is nan
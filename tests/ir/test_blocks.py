@@ -1,7 +1,11 @@
+import pickle
+
 import pytest
 
+from mlir.dialects.cf import BranchOp, CondBranchOp
 from mlir.ir.blocks import Block
 from mlir.ir.operations import Operation
+from mlir.ir.regions import Region
 from mlir.ir.types.numbers import IntegerType
 from mlir.ir.value import BlockArgument, OpResult
 
@@ -47,13 +51,20 @@ class TestBlock:
         block = Block([], [op1, op2])
         assert block.back == op2
 
-    @pytest.mark.skip("MLIR-28")
     def test_terminator(self):
-        pass
+        block = self.create_block()
+        assert block.terminator is None
+        branch = BranchOp.build(Block())
+        block.push_end(branch)
+        assert block.terminator is branch
 
-    @pytest.mark.skip("MLIR-28")
     def test_successors(self):
-        pass
+        block, true_dest, false_dest = Block([IntegerType(1)]), Block(), Block()
+        assert block.successors == []
+        block.push_end(
+            CondBranchOp.build(block.get_argument(0), true_dest, [], false_dest, [])
+        )
+        assert list(block.successors) == [true_dest, false_dest]
 
     def test_is_empty(self):
         assert Block([], []).is_empty
@@ -112,6 +123,21 @@ class TestBlock:
         assert block_arg.owner is None
         assert block_arg.index is None
 
+    def test_remove_arguments(self):
+        block = self.create_block()
+        block.add_argument(IntegerType(8))
+        first, second, third = block._arguments
+        DummyOp(operands=[second], attributes={})
+
+        with pytest.raises(ValueError, match="argument 1: it still has uses"):
+            block.remove_arguments([0, 1])
+        assert block.number_of_arguments == 3
+
+        block.remove_arguments([0, 2])
+        assert block._arguments == [second]
+        assert second.index == 0
+        assert first.owner is None and third.index is None
+
     def test_remove_argument_from_index(self):
         block = self.create_block()
         arg = IntegerType(bitwidth=8)
@@ -208,3 +234,162 @@ class TestBlock:
 
         with pytest.raises(ValueError, match="does not belong to this block"):
             block.splice(op, other_block, 2)
+
+    def test_links(self):
+        op1, op2, op3 = DummyOp([], {}), DummyOp([], {}), DummyOp([], {})
+        block = Block([], [op1, op2, op3])
+        assert op1.prev_node is None
+        assert op1.next_node is op2
+        assert op2.prev_node is op1
+        assert op2.next_node is op3
+        assert op3.next_node is None
+
+        block.remove_operation(op2)
+        assert op1.next_node is op3
+        assert op3.prev_node is op1
+        assert op2.prev_node is None and op2.next_node is None
+
+    def test_insert_before_and_after(self):
+        op1, op2, op3, op4 = [DummyOp([], {}) for _ in range(4)]
+        block = Block([], [op2])
+        block.insert_before(op2, op1)
+        block.insert_after(op2, op4)
+        block.insert_before(op4, op3)
+        assert block.operations == [op1, op2, op3, op4]
+        assert block.front is op1
+        assert block.back is op4
+        assert block.number_of_operations == 4
+
+        other = DummyOp([], {})
+        with pytest.raises(ValueError, match="does not belong to this block"):
+            block.insert_before(other, DummyOp([], {}))
+
+    def test_insert_twice_raises(self):
+        op = DummyOp([], {})
+        block = Block([], [op])
+        with pytest.raises(ValueError, match="already in block"):
+            block.push_end(op)
+        with pytest.raises(ValueError, match="already has a parent"):
+            Block([], []).push_end(op)
+
+    def test_iteration_allows_erasing_current(self):
+        ops = [DummyOp([], {}) for _ in range(5)]
+        block = Block([], ops)
+        visited = []
+        for op in block:
+            visited.append(op)
+            block.remove_operation(op)
+        assert visited == ops
+        assert block.is_empty
+        assert block.front is None and block.back is None
+
+    def test_reversed(self):
+        ops = [DummyOp([], {}) for _ in range(3)]
+        block = Block([], ops)
+        assert list(reversed(block)) == ops[::-1]
+
+    def test_get_operation_index(self):
+        ops = [DummyOp([], {}) for _ in range(5)]
+        block = Block([], ops)
+        for i, op in enumerate(ops):
+            assert block.get_operation(i) is op
+        assert block.get_operation(-1) is ops[-1]
+        with pytest.raises(IndexError):
+            block.get_operation(5)
+
+    def test_is_before_in_block(self):
+        ops = [DummyOp([], {}) for _ in range(4)]
+        block = Block([], ops)
+        assert ops[0].is_before_in_block(ops[3])
+        assert ops[1].is_before_in_block(ops[2])
+        assert not ops[2].is_before_in_block(ops[1])
+        assert not ops[1].is_before_in_block(ops[1])
+
+        with pytest.raises(ValueError, match="not in the same block"):
+            ops[0].is_before_in_block(DummyOp([], {}))
+
+    def test_order_updates_on_insert_and_remove(self):
+        ops = [DummyOp([], {}) for _ in range(3)]
+        block = Block([], ops)
+        assert ops[0].is_before_in_block(ops[2])
+        assert block._order_valid
+
+        # inserting between neighbours takes an index from the gap
+        new_op = DummyOp([], {})
+        block.insert_after(ops[0], new_op)
+        assert block._order_valid
+        assert ops[0].is_before_in_block(new_op)
+        assert new_op.is_before_in_block(ops[1])
+
+        block.remove_operation(ops[1])
+        assert block._order_valid
+        assert new_op.is_before_in_block(ops[2])
+
+    def test_order_renumbers_when_gap_runs_out(self):
+        first, last = DummyOp([], {}), DummyOp([], {})
+        block = Block([], [first, last])
+        assert first.is_before_in_block(last)
+
+        inserted = []
+        while block._order_valid:
+            op = DummyOp([], {})
+            block.insert_after(first, op)
+            inserted.append(op)
+        # the last insertion ran out of gap, so the block is renumbered lazily
+        assert inserted[-1].is_before_in_block(inserted[-2])
+        assert block._order_valid
+        ordered = list(block)
+        for a, b in zip(ordered, ordered[1:]):
+            assert a.is_before_in_block(b)
+
+
+class TestBlockPredecessors:
+    def build(self):
+        """entry -> (left | right), left -> right."""
+        entry, left, right = Block([IntegerType(1)]), Block(), Block()
+        region = Region([entry, left, right])
+        condition = entry.get_argument(0)
+        entry.push_end(CondBranchOp.build(condition, left, [], right, []))
+        left.push_end(BranchOp.build(right))
+        return region, entry, left, right
+
+    def test_predecessors(self):
+        _, entry, left, right = self.build()
+        assert entry.predecessors == []
+        assert left.predecessors == [entry]
+        assert left.has_single_predecessor
+        assert left.single_predecessor is entry
+        assert sorted(map(id, right.predecessors)) == sorted(map(id, [entry, left]))
+        assert not right.has_single_predecessor
+        assert right.single_predecessor is None
+
+    def test_set_successor_updates_use_lists(self):
+        region, entry, left, right = self.build()
+        version = region.cfg_version
+        left.terminator.set_successor(0, left)
+        assert left.predecessors in ([entry, left], [left, entry])
+        assert right.predecessors == [entry]
+        assert region.cfg_version != version
+
+    def test_erase_drops_successor_uses(self):
+        _, entry, left, right = self.build()
+        left.terminator.erase()
+        assert right.predecessors == [entry]
+
+    def test_replace_all_uses_with(self):
+        region, entry, left, right = self.build()
+        other = Block()
+        region.push_end(other)
+        version = region.cfg_version
+        right.replace_all_uses_with(other)
+        assert right.use_empty
+        assert entry.terminator.successors == (left, other)
+        assert left.terminator.successors == (other,)
+        assert len(other.predecessors) == 2
+        assert region.cfg_version != version
+
+    def test_pickle_restores_use_lists(self):
+        region, *_ = self.build()
+        entry, left, right = pickle.loads(pickle.dumps(region)).blocks
+        assert left.predecessors == [entry]
+        assert len(right.predecessors) == 2
@@ -0,0 +1,208 @@
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mlir.context import MLIRContext
+from mlir.dialects.func import FuncOp
+from mlir.ir.bytecode import (
+    MAGIC,
+    BytecodeError,
+    read_bytecode,
+    read_bytecode_file,
+    write_bytecode,
+    write_bytecode_file,
+)
+from mlir.ir.module import ModuleOperation
+from mlir.ir.parser import parse_source_string
+from mlir.ir.printer import operation_to_string
+from mlir.ir.types import FloatType, FloatTypeKind, IntegerType, SignednessSemantics
+from mlir.ir.verifier import VerificationError
+
+from tests.ir.test_printer import EXPECTED, build_module
+
+
+def to_bytecode(module: ModuleOperation) -> bytes:
+    stream = io.BytesIO()
+    write_bytecode(module, stream)
+    return stream.getvalue()
+
+
+class TestBytecode:
+    def test_round_trip(self):
+        data = to_bytecode(build_module())
+        assert data.startswith(MAGIC)
+        assert len(data) < len(EXPECTED)
+
+        module = read_bytecode(data, MLIRContext())
+        assert operation_to_string(module) == EXPECTED
+        function = module.regions[0].front.front
+        assert isinstance(function, FuncOp)
+        assert function.regions[0].parent is function
+        exit_ = function.body.blocks[1]
+        assert function.entry_block.terminator.successors == (exit_, exit_)
+
+    def test_types_and_attributes_are_uniqued(self):
+        source = (
+            '%0 = "arith.constant"() {value = -7 : si8} : () -> si8\n'
+            '%1 = "arith.constant"() {value = -7 : si8} : () -> si8\n'
+            '%2 = "arith.constant"() {value = 2.5 : f32} : () -> f32\n'
+        )
+        data = to_bytecode(parse_source_string(source, MLIRContext()))
+        assert data.count(b"IntegerAttribute") == 1
+
+        context = MLIRContext()
+        first, second, third = read_bytecode(data, context).regions[0].front.operations
+        signed = IntegerType.get(context, 8, SignednessSemantics.SIGNED)
+        assert first.results[0].type is signed
+        assert first.attributes["value"] is second.attributes["value"]
+        assert first.attributes["value"].value == -7
+        assert third.results[0].type is FloatType.get(context, FloatTypeKind.F32)
+        assert third.attributes["value"].value == 2.5
+
+    def test_signed_zeros_are_distinct(self):
+        source = (
+            '%0 = "arith.constant"() {value = 0.0 : f32} : () -> f32\n'
+            '%1 = "arith.constant"() {value = -0.0 : f32} : () -> f32\n'
+        )
+        module = parse_source_string(source, MLIRContext())
+        copy = read_bytecode(to_bytecode(module), MLIRContext())
+        assert operation_to_string(copy) == operation_to_string(module)
+        assert "value = -0.0 : f32" in operation_to_string(copy)
+
+    def test_forward_references(self):
+        source = """
+        "func.func"() ({
+        ^bb0(%arg0: i32):
+          "cf.br"()[^bb2] : () -> ()
+        ^bb1:
+          %1 = "arith.addi"(%0, %arg0) : (i32, i32) -> i32
+          "func.return"(%1) : (i32) -> ()
+        ^bb2:
+          %0 = "arith.addi"(%arg0, %arg0) : (i32, i32) -> i32
+          "cf.br"()[^bb1] : () -> ()
+        }) : () -> ()
+        """
+        module = parse_source_string(source, MLIRContext(), verify_after_parse=False)
+        text = operation_to_string(module)
+        copy = read_bytecode(to_bytecode(module), MLIRContext(), False)
+        assert operation_to_string(copy) == text
+        entry, first, second = copy.regions[0].front.front.body.blocks
+        assert first.front.lhs is second.front.results[0]
+
+    def test_streams_large_modules(self, tmp_path):
+        module = build_module()
+        body = module.regions[0].front
+        for _ in range(5000):
+            function = build_module().regions[0].front.front
+            function.parent.remove_operation(function)
+            body.push_end(function)
+        writes = []
+        stream = io.BytesIO()
+        stream.write = lambda data: writes.append(len(data))
+        write_bytecode(module, stream)
+        assert max(writes) < sum(writes) / 2
+
+        path = tmp_path / "module.mlirbc"
+        write_bytecode_file(module, path)
+        copy = read_bytecode_file(path, MLIRContext())
+        assert copy.regions[0].front.number_of_operations == 5001
+        assert operation_to_string(copy) == operation_to_string(module)
+
+    def test_lazy_loading(self, tmp_path):
+        path = tmp_path / "module.mlirbc"
+        write_bytecode_file(build_module(), path)
+        module = read_bytecode_file(path, MLIRContext(), lazy_loading=True)
+        function = module.regions[0].front.front
+        assert isinstance(function, FuncOp)
+        assert not function.body.is_loaded
+
+        assert len(function.body.blocks) == 2
+        assert function.body.is_loaded
+        assert function.body.parent is function
+        assert operation_to_string(module) == EXPECTED
+
+        entry_block = function.entry_block
+        function.body.drop_body()
+        assert not function.body.is_loaded
+        assert entry_block.owner is None
+        assert function.entry_block is not entry_block
+        assert operation_to_string(module) == EXPECTED
+
+    def test_lazy_loading_from_several_threads(self, tmp_path):
+        module = build_module()
+        body = module.regions[0].front
+        for _ in range(63):
+            function = build_module().regions[0].front.front
+            function.parent.remove_operation(function)
+            body.push_end(function)
+        path = tmp_path / "module.mlirbc"
+        write_bytecode_file(module, path)
+
+        copy = read_bytecode_file(path, MLIRContext(), lazy_loading=True)
+        functions = copy.regions[0].front.operations
+        # Each body is accessed from two threads, which may race to load it. Switching
+        # threads often makes loads interleave even though the bodies are small.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(lambda f: f.body.load_body(), functions * 2))
+        finally:
+            sys.setswitchinterval(interval)
+        assert all(function.body.size == 2 for function in functions)
+        assert operation_to_string(copy) == operation_to_string(module)
+
+    def test_lazy_loading_verifies_bodies_on_load(self):
+        module = build_module()
+        function = module.regions[0].front.front
+        constant, add = function.entry_block.operations[:2]
+        function.entry_block.remove_operation(constant)
+        function.entry_block.insert_after(add, constant)
+        data = to_bytecode(module)
+
+        copy = read_bytecode(data, MLIRContext(), lazy_loading=True)
+        body = copy.regions[0].front.front.body
+        with pytest.raises(VerificationError):
+            body.load_body()
+        assert read_bytecode(data, MLIRContext(), False, lazy_loading=True)
+
+    @pytest.mark.parametrize(
+        "mutate, message, lazy_loading",
+        [
+            (lambda data: b"", "Not a bytecode file", False),
+            (
+                lambda data: data[: len(MAGIC)] + b"\x07" + data[7:],
+                "version 7",
+                False,
+            ),
+            (lambda data: data[:-3], "Unexpected end of bytecode", False),
+            (lambda data: data + b"\x00", "Unexpected data after the module", False),
+            (
+                lambda data: data.replace(b"func.func", b"func.funk"),
+                "'func.funk'",
+                False,
+            ),
+            (
+                lambda data: data.replace(b"func.return", b"func.retura"),
+                "'func.retura'",
+                True,
+            ),
+        ],
+    )
+    def test_errors(self, mutate, message, lazy_loading):
+        data = mutate(to_bytecode(build_module()))
+        if not lazy_loading:
+            with pytest.raises(BytecodeError, match=message):
+                read_bytecode(data, MLIRContext())
+            return
+
+        # The body is only decoded when it is accessed, and is left empty if that fails.
+        module = read_bytecode(data, MLIRContext(), lazy_loading=True)
+        body = module.regions[0].front.front.body
+        for _ in range(2):
+            with pytest.raises(BytecodeError, match=message):
+                body.load_body()
+            assert not body.is_loaded
+            assert body._size == 0
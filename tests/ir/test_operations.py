@@ -1,5 +1,8 @@
+import tracemalloc
+
 import pytest
 
+from mlir.ir.blocks import Block
 from mlir.ir.operations import Operation, OpResult
 from mlir.ir.types.numbers import IntegerType
 from mlir.ir.value import BlockArgument
@@ -39,6 +42,87 @@ class TestOperation:
             assert result.index == i
             assert result.type == IntegerType(32)
 
+    def test_replace_all_uses_with(self):
+        operand = BlockArgument(IntegerType(32), None, 0)
+        op = self.DummyResultsOp(operands=[operand, operand], attributes={})
+        other = self.DummyResultsOp(operands=[operand, operand], attributes={})
+        user = self.DummyOperandsOp(operands=list(op.results), attributes={})
+
+        op.replace_all_uses_with(other)
+        assert all(result.use_empty for result in op.results)
+        assert user.operands[0].value is other.results[0]
+        assert user.operands[1].value is other.results[1]
+
+        with pytest.raises(ValueError, match="Cannot replace 2 results"):
+            op.replace_all_uses_with([operand])
+
+    def test_erase(self):
+        block = Block([IntegerType(32)], [])
+        op = self.DummyResultsOp(operands=[block.get_argument(0)], attributes={})
+        user = self.DummyOperandsOp(operands=list(op.results), attributes={})
+        block.push_end(op)
+        block.push_end(user)
+
+        with pytest.raises(ValueError, match="result 0 still has uses"):
+            op.erase()
+
+        user.erase()
+        assert user.parent is None
+        assert user.operands[0].value is None
+        op.erase()
+        assert block.operations == []
+        assert block.get_argument(0).use_empty
+
+    def test_erase_operands(self):
+        block = Block([IntegerType(32)] * 3, [])
+        a, b, c = block._arguments
+        op = self.DummyOperandsOp(operands=[a, b, c], attributes={})
+
+        op.erase_operands([0, 2])
+        assert [operand.value for operand in op.operands] == [b]
+        assert op.operands[0].index == 0
+        assert a.use_empty and c.use_empty and not b.use_empty
+
     @pytest.mark.skip("TODO: MLIR-15, needs regions")
     def test_validate_regions(self):
         pass
+
+
+class TestOperationMemory:
+    """Regression tests for the memory layout of the core IR objects."""
+
+    class SlottedOp(Operation):
+        __slots__ = ()
+
+        def create_results(self, operands, **kwargs) -> list[OpResult]:
+            return [OpResult(operands[0].type, self, 0)]
+
+    def test_core_objects_have_no_dict(self):
+        block = Block([IntegerType(32)], [])
+        op = self.SlottedOp(operands=[block.get_argument(0)], attributes={})
+        block.push_end(op)
+        for obj in [op, op.operands[0], op.results[0], block, block.get_argument(0)]:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+        assert isinstance(op.operands, tuple)
+        assert isinstance(op.results, tuple)
+
+    def test_bytes_per_operation(self):
+        """A chain of one-operand, one-result operations in a block. With the slotted
+        layout this is just under 400 bytes per operation on CPython 3.11; the bound
+        leaves some headroom for other interpreter versions."""
+        n = 10000
+        block = Block([IntegerType(32)], [])
+        value = block.get_argument(0)
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(n):
+                op = self.SlottedOp(operands=[value], attributes={})
+                block.push_end(op)
+                value = op.results[0]
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        assert (after - before) / n < 480
@@ -0,0 +1,182 @@
+import math
+
+import pytest
+
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp
+from mlir.dialects.cf import BranchOp
+from mlir.dialects.func import FuncOp
+from mlir.ir.attributes import FloatAttribute, IndexAttribute, IntegerAttribute
+from mlir.ir.module import ModuleOperation
+from mlir.ir.parser import (
+    Lexer,
+    ParseError,
+    Parser,
+    TokenKind,
+    parse_source_file,
+    parse_source_string,
+)
+from mlir.ir.printer import operation_to_string
+from mlir.ir.types import (
+    FloatType,
+    FloatTypeKind,
+    IndexType,
+    IntegerType,
+    SignednessSemantics,
+)
+
+from tests.ir.test_printer import EXPECTED
+
+
+class TestLexer:
+    def test_tokens(self):
+        lexer = Lexer(b'%0 = "a.b"(%arg0)[^bb1] {x = -1.5e3} // comment\n: () -> i32')
+        tokens = []
+        while (token := lexer.lex()).kind != TokenKind.EOF:
+            tokens.append((token.kind, lexer.spelling(token)))
+        assert tokens == [
+            (TokenKind.PERCENT_IDENTIFIER, "%0"),
+            (TokenKind.EQUAL, "="),
+            (TokenKind.STRING, '"a.b"'),
+            (TokenKind.L_PAREN, "("),
+            (TokenKind.PERCENT_IDENTIFIER, "%arg0"),
+            (TokenKind.R_PAREN, ")"),
+            (TokenKind.L_SQUARE, "["),
+            (TokenKind.CARET_IDENTIFIER, "^bb1"),
+            (TokenKind.R_SQUARE, "]"),
+            (TokenKind.L_BRACE, "{"),
+            (TokenKind.BARE_IDENTIFIER, "x"),
+            (TokenKind.EQUAL, "="),
+            (TokenKind.FLOAT, "-1.5e3"),
+            (TokenKind.R_BRACE, "}"),
+            (TokenKind.COLON, ":"),
+            (TokenKind.L_PAREN, "("),
+            (TokenKind.R_PAREN, ")"),
+            (TokenKind.ARROW, "->"),
+            (TokenKind.BARE_IDENTIFIER, "i32"),
+        ]
+
+    def test_error_location(self):
+        lexer = Lexer(b"%0\n  @")
+        lexer.lex()
+        with pytest.raises(ParseError, match="2:3: Unexpected character '@'"):
+            lexer.lex()
+
+
+class TestParser:
+    def test_round_trip(self):
+        module = parse_source_string(EXPECTED, MLIRContext())
+        assert isinstance(module, ModuleOperation)
+        assert operation_to_string(module) == EXPECTED
+
+        function = module.regions[0].front.front
+        assert isinstance(function, FuncOp)
+        assert function.regions[0].parent is function
+        add = function.entry_block.operations[1]
+        assert isinstance(add, AddIOp)
+        assert add.lhs is function.arguments[0]
+        assert add.results[0].uses[0].owner is function.entry_block.terminator
+
+    def test_types_and_attributes_are_uniqued(self):
+        context = MLIRContext()
+        module = parse_source_string(
+            '%0 = "arith.constant"() {value = 7 : si8} : () -> si8\n'
+            '%1 = "arith.constant"() {value = 7 : si8} : () -> si8\n',
+            context,
+        )
+        first, second = module.regions[0].front.operations
+        signed = IntegerType.get(context, 8, SignednessSemantics.SIGNED)
+        assert first.results[0].type is signed
+        assert second.results[0].type is signed
+        assert first.attributes["value"] is second.attributes["value"]
+
+    def test_signed_zeros_are_distinct(self):
+        source = (
+            '"builtin.module"() ({\n'
+            '  %0 = "arith.constant"() {value = 0.0 : f32} : () -> f32\n'
+            '  %1 = "arith.constant"() {value = -0.0 : f32} : () -> f32\n'
+            "}) : () -> ()\n"
+        )
+        module = parse_source_string(source, MLIRContext())
+        assert operation_to_string(module) == source
+        first, second = module.regions[0].front.operations
+        assert first.attributes["value"] is not second.attributes["value"]
+
+    @pytest.mark.parametrize(
+        "source, expected",
+        [
+            ("1", IntegerAttribute(type=IntegerType(64), value=1)),
+            ("true", IntegerAttribute(type=IntegerType(1), value=1)),
+            ("0x10 : i8", IntegerAttribute(type=IntegerType(8), value=16)),
+            ("3 : index", IndexAttribute(type=IndexType(), value=3)),
+            ("2.5 : f32", FloatAttribute(type=FloatType(FloatTypeKind.F32), value=2.5)),
+            (
+                "-inf",
+                FloatAttribute(type=FloatType(FloatTypeKind.F64), value=-math.inf),
+            ),
+        ],
+    )
+    def test_attributes(self, source, expected):
+        parser = Parser(Lexer(source.encode()), MLIRContext())
+        assert parser.parse_attribute() == expected
+
+    def test_forward_references(self):
+        source = """
+        "func.func"() ({
+        ^bb0(%arg0: i32):
+          "cf.br"()[^bb2] : () -> ()
+        ^bb1:
+          %1 = "arith.addi"(%0, %arg0) : (i32, i32) -> i32
+          "func.return"(%1) : (i32) -> ()
+        ^bb2:
+          %0 = "arith.addi"(%arg0, %arg0) : (i32, i32) -> i32
+          "cf.br"()[^bb1] : () -> ()
+        }) : () -> ()
+        """
+        module = parse_source_string(source, MLIRContext(), verify_after_parse=False)
+        function = module.regions[0].front.front
+        entry, first, second = function.body.blocks
+        assert isinstance(entry.terminator, BranchOp)
+        assert entry.terminator.dest is second
+        assert first.front.lhs is second.front.results[0]
+        assert second.predecessors == [entry]
+
+    def test_wraps_top_level_operations(self):
+        module = parse_source_string(
+            '"arith.constant"() {value = 1 : i32} : () -> i32', MLIRContext()
+        )
+        assert isinstance(module.regions[0].front.front, ConstantOp)
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "module.mlir"
+        path.write_text(EXPECTED)
+        assert operation_to_string(parse_source_file(path, MLIRContext())) == EXPECTED
+        (tmp_path / "empty.mlir").write_text("")
+        empty = parse_source_file(tmp_path / "empty.mlir", MLIRContext())
+        assert empty.regions[0].front.is_empty
+
+    @pytest.mark.parametrize(
+        "source, message",
+        [
+            ('"test.unknown"() : () -> ()', "1:1: Unknown operation 'test.unknown'"),
+            (
+                '"func.return"(%0) : (i32) -> ()',
+                "Use of an undefined value '%0'",
+            ),
+            (
+                '%0 = "arith.constant"() {value = 1 : i32} : () -> i64',
+                "doesn't match its parsed results",
+            ),
+            (
+                '"arith.constant"() {value = __elided__ : i32} : () -> i32',
+                "1:29: Elided attributes can't be parsed",
+            ),
+            ('"func.func"() ({\n"cf.br"()[^bb3] : () -> ()\n}) : () -> ()', "^bb3"),
+            ('"func.return"() : () -> () }', "1:28: Expected string, found '}'"),
+            ('"arith.constant"() {value = 300 : i8} : () -> i8', "out of bounds"),
+            ('"func.return"() : () -> (f33)', "Unknown type 'f33'"),
+        ],
+    )
+    def test_errors(self, source, message):
+        with pytest.raises(ParseError, match=message.replace("^", r"\^")):
+            parse_source_string(source, MLIRContext())
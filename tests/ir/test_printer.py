@@ -0,0 +1,97 @@
+import io
+
+from mlir.dialects.arith import AddIOp, ConstantOp
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.printer import Printer, operation_to_string, print_operation
+from mlir.ir.regions import Region
+from mlir.ir.types import IntegerType
+
+
+class TwoResultOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0), OpResult(IntegerType(1), self, 1)]
+
+
+def build_module() -> ModuleOperation:
+    i32, i1 = IntegerType(32), IntegerType(1)
+    module = ModuleOperation.build()
+    module.regions[0].push_end(Block())
+    function = FuncOp.build([i32, i1])
+    x, c = function.arguments
+    exit_ = Block([i32])
+    one = ConstantOp.build(IntegerAttribute(type=i32, value=1))
+    add = AddIOp.build(x, one.results[0])
+    function.entry_block.push_end(one)
+    function.entry_block.push_end(add)
+    function.entry_block.push_end(CondBranchOp.build(c, exit_, add.results, exit_, [x]))
+    exit_.push_end(ReturnOp.build([exit_.get_argument(0)]))
+    function.body.push_end(exit_)
+    module.regions[0].front.push_end(function)
+    return module
+
+
+EXPECTED = """\
+"builtin.module"() ({
+  "func.func"() ({
+  ^bb0(%arg0: i32, %arg1: i1):
+    %0 = "arith.constant"() {value = 1 : i32} : () -> i32
+    %1 = "arith.addi"(%arg0, %0) : (i32, i32) -> i32
+    "cf.cond_br"(%arg1, %1, %arg0)[^bb1, ^bb1] {true_operand_count = 1 : index} : (i1, i32, i32) -> ()
+  ^bb1(%2: i32):
+    "func.return"(%2) : (i32) -> ()
+  }) : () -> ()
+}) : () -> ()
+"""
+
+
+class TestPrinter:
+    def test_generic_form(self):
+        assert operation_to_string(build_module()) == EXPECTED
+
+    def test_writes_to_stream(self):
+        stream = io.StringIO()
+        print_operation(build_module(), stream)
+        assert stream.getvalue() == EXPECTED
+
+    def test_isolated_regions_restart_numbering(self):
+        module = build_module()
+        other = build_module().regions[0].front
+        function = other.front
+        other.remove_operation(function)
+        module.regions[0].front.push_end(function)
+        lines = operation_to_string(module).splitlines()
+        assert lines.count("  ^bb0(%arg0: i32, %arg1: i1):") == 2
+        assert lines.count("  ^bb1(%2: i32):") == 2
+
+    def test_multiple_results_and_successors(self):
+        block, target = Block(), Block()
+        op = TwoResultOp(operands=[], attributes={})
+        block.push_end(op)
+        block.push_end(BranchOp.build(target, [op.results[1]]))
+        region = Region([block, target])
+        stream = io.StringIO()
+        printer = Printer(stream)
+        printer._print_region(region, 0)
+        assert stream.getvalue() == (
+            "{\n"
+            '  %0, %1 = "TwoResultOp"() : () -> (i32, i1)\n'
+            '  "cf.br"(%1)[^bb1] : (i1) -> ()\n'
+            "^bb1:\n"
+            "}"
+        )
+
+    def test_elides_large_attributes(self):
+        op = ConstantOp.build(IntegerAttribute(type=IntegerType(64), value=2**40))
+        assert "{value = 1099511627776 : i64}" in operation_to_string(op)
+        elided = operation_to_string(op, elide_attributes_larger_than=8)
+        assert "{value = __elided__ : i64}" in elided
+
+    def test_block_repr_is_shallow(self):
+        module = build_module()
+        block = module.regions[0].front.front.entry_block
+        assert repr(block) == "Block(arguments=[i32, i1], number_of_operations=3)"
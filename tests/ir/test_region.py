@@ -1,7 +1,7 @@
 import pytest
 
 from mlir.ir.blocks import Block
-from mlir.ir.regions import Region
+from mlir.ir.regions import LazyBody, Region
 
 
 class TestRegion:
@@ -79,3 +79,151 @@ class TestRegion:
         assert region.is_empty is True
         assert blockA.owner is None
         assert blockB.owner is None
+
+    def test_links(self):
+        blockA, blockB, blockC = Block(), Block(), Block()
+        region = Region([blockA, blockB, blockC])
+        assert blockA.prev_node is None
+        assert blockA.next_node is blockB
+        assert blockC.prev_node is blockB
+        assert list(region) == [blockA, blockB, blockC]
+        assert list(reversed(region)) == [blockC, blockB, blockA]
+
+        region.remove(blockB)
+        assert blockA.next_node is blockC
+        assert blockC.prev_node is blockA
+        with pytest.raises(ValueError, match="does not belong to this region"):
+            region.remove(blockB)
+
+    def test_insert_before_and_after(self):
+        blockA, blockB, blockC, blockD = Block(), Block(), Block(), Block()
+        region = Region([blockB])
+        region.insert_before(blockB, blockA)
+        region.insert_after(blockB, blockD)
+        region.insert_after(blockB, blockC)
+        assert region.blocks == [blockA, blockB, blockC, blockD]
+        assert region.size == 4
+
+    def test_iteration_allows_removing_current(self):
+        blocks = [Block() for _ in range(4)]
+        region = Region(blocks)
+        for block in region:
+            region.remove(block)
+        assert region.is_empty
+        assert all(block.owner is None for block in blocks)
+
+    def test_splice_whole_region(self):
+        blockA, blockB, blockC = Block(), Block(), Block()
+        source = Region([blockA, blockB])
+        target = Region([blockC])
+
+        source.splice(target, before=blockC)
+        assert source.is_empty
+        assert source.front is None and source.end is None
+        assert target.blocks == [blockA, blockB, blockC]
+        assert target.size == 3
+        assert all(block.owner is target for block in target)
+
+    def test_splice_range(self):
+        blocks = [Block() for _ in range(5)]
+        source = Region(blocks)
+        target = Region()
+
+        source.splice(target, first=blocks[1], last=blocks[3])
+        assert source.blocks == [blocks[0], blocks[4]]
+        assert source.size == 2
+        assert target.blocks == blocks[1:4]
+        assert target.size == 3
+        assert blocks[0].owner is source
+        assert all(block.owner is target for block in blocks[1:4])
+
+    def test_splice_invalid_range_raises(self):
+        blocks = [Block() for _ in range(3)]
+        source = Region(blocks)
+        with pytest.raises(ValueError, match="not contiguous"):
+            source.splice(Region(), first=blocks[2], last=blocks[0])
+        assert source.blocks == blocks
+        assert all(block.owner is source for block in blocks)
+
+    def test_take_body(self):
+        blockA, blockB, blockC = Block(), Block(), Block()
+        region = Region([blockA])
+        other = Region([blockB, blockC])
+        region.take_body(other)
+        assert region.blocks == [blockB, blockC]
+        assert other.is_empty
+        assert blockA.owner is None
+
+
+class CountingLazyBody(LazyBody):
+    """Fills its region with two blocks, counting how often it is decoded."""
+
+    def __init__(self):
+        self.region = None
+        self.loaded = False
+        self.loads = 0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.loaded
+
+    def load(self):
+        if not self.loaded:
+            self.loaded = True
+            self.loads += 1
+            self.region.push_end(Block())
+            self.region.push_end(Block())
+
+    def drop(self):
+        if self.loaded:
+            self.region.clear()
+            self.loaded = False
+
+
+class TestLazyRegion:
+    def make_region(self) -> tuple[Region, CountingLazyBody]:
+        body = CountingLazyBody()
+        body.region = Region(lazy_body=body)
+        return body.region, body
+
+    def test_loads_on_first_access(self):
+        region, body = self.make_region()
+        assert not region.is_loaded
+        assert len(region.blocks) == 2
+        assert region.is_loaded
+        assert region.size == 2
+        assert body.loads == 1
+
+    @pytest.mark.parametrize(
+        "access",
+        [
+            lambda region: region.front,
+            lambda region: region.end,
+            lambda region: region.is_empty,
+            lambda region: list(reversed(region)),
+            lambda region: region.push_front(Block()),
+            lambda region: region.splice(Region()),
+            lambda region: Region().splice(region),
+            lambda region: region.load_body(),
+        ],
+    )
+    def test_accessors_load(self, access):
+        region, body = self.make_region()
+        access(region)
+        assert body.loads == 1
+
+    def test_drop_body(self):
+        region, body = self.make_region()
+        region.load_body()
+        block = region.front
+        region.drop_body()
+        assert not region.is_loaded
+        assert block.owner is None
+        assert region.front is not block
+        assert body.loads == 2
+
+    def test_drop_requires_lazy_body(self):
+        region = Region([Block()])
+        assert region.is_loaded
+        with pytest.raises(ValueError, match="Only regions with a lazy body"):
+            region.drop_body()
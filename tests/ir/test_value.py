@@ -1,3 +1,7 @@
+import pytest
+
+from mlir.ir.listeners import IRListener, listen
+from mlir.ir.operations import OpOperand
 from mlir.ir.types import TypeBase
 from mlir.ir.value import BlockArgument, OpResult, Value
 
@@ -23,15 +27,102 @@ class TestValue:
     def test_add_use(self):
         type = DummyType()
         value = Value(type)
-        value.add_use(5)
-        assert 5 in value.uses
+        use = OpOperand(None, None, 0)
+        value.add_use(use)
+        assert use in value.uses
 
     def test_remove_use(self):
         type = DummyType()
         value = Value(type)
-        value.add_use(5)
-        value.remove_use(5)
-        assert 5 not in value.uses
+        use = OpOperand(None, None, 0)
+        value.add_use(use)
+        value.remove_use(use)
+        assert use not in value.uses
+
+    def test_use_list(self):
+        type = DummyType()
+        value = Value(type)
+        assert value.use_empty
+        assert not value.has_one_use
+
+        uses = [OpOperand(None, value, i) for i in range(3)]
+        assert not value.use_empty
+        assert not value.has_one_use
+        assert value.uses == uses[::-1]
+
+        value.remove_use(uses[1])
+        assert value.uses == [uses[2], uses[0]]
+        value.remove_use(uses[2])
+        assert value.has_one_use
+        value.remove_use(uses[0])
+        assert value.use_empty
+
+        with pytest.raises(ValueError, match="is not a use"):
+            value.remove_use(uses[0])
+
+    def test_set_relinks_operand(self):
+        type = DummyType()
+        value = Value(type)
+        other = Value(type)
+        use = OpOperand(None, value, 0)
+        use.set(other)
+        assert use.value is other
+        assert value.use_empty
+        assert other.uses == [use]
+
+        use.drop()
+        assert use.value is None
+        assert other.use_empty
+
+    def test_replace_all_uses_with(self):
+        type = DummyType()
+        value = Value(type)
+        other = Value(type)
+        existing = OpOperand(None, other, 0)
+        uses = [OpOperand(None, value, i) for i in range(3)]
+
+        value.replace_all_uses_with(other)
+        assert value.use_empty
+        assert all(use.value is other for use in uses)
+        assert other.uses == uses[::-1] + [existing]
+
+        # the spliced list stays consistent for removal
+        other.remove_use(existing)
+        other.remove_use(uses[1])
+        assert other.uses == [uses[2], uses[0]]
+
+    def test_replace_uses_with_if(self):
+        type = DummyType()
+        value = Value(type)
+        other = Value(type)
+        uses = [OpOperand(None, value, i) for i in range(4)]
+
+        value.replace_uses_with_if(other, lambda use: use.index % 2 == 0)
+        assert value.uses == [uses[3], uses[1]]
+        assert sorted(use.index for use in other.uses) == [0, 2]
+        assert all(use.value is other for use in other.uses)
+
+    def test_replace_notifies_once(self):
+        class RecordingListener(IRListener):
+            def __init__(self):
+                self.calls = []
+
+            def notify_operations_modified(self, operations):
+                self.calls.append(operations)
+
+        type = DummyType()
+        value = Value(type)
+        other = Value(type)
+        owners = [object(), object()]
+        for i in range(4):
+            OpOperand(owners[i % 2], value, i)
+
+        listener = RecordingListener()
+        with listen(listener):
+            value.replace_all_uses_with(other)
+            value.replace_all_uses_with(other)
+        assert len(listener.calls) == 1
+        assert set(map(id, listener.calls[0])) == set(map(id, owners))
 
 
 class TestOpResult:
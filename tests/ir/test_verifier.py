@@ -0,0 +1,192 @@
+import threading
+
+import pytest
+
+from mlir.context import MLIRContext, ParallelBackend
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.regions import Region
+from mlir.ir.traits.operands import OneOperand
+from mlir.ir.traits.regions import IsolatedFromAbove, OneRegion
+from mlir.ir.types import IntegerType
+from mlir.ir.verifier import VerificationError, collect_diagnostics, verify
+from mlir.utils.validator import deferred_validation
+
+
+class DummyOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+class OneOperandOp(OneOperand, Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+class ResultOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class FunctionOp(IsolatedFromAbove, OneRegion, Operation):
+    __slots__ = ()
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+def build_module(ops: list[Operation]) -> ModuleOperation:
+    module = ModuleOperation.build()
+    module.regions[0].push_end(Block([IntegerType(32)], ops))
+    return module
+
+
+class TestVerifier:
+    def test_valid_module(self):
+        module = build_module([DummyOp([], {}), DummyOp([], {})])
+        verify(module)
+        assert collect_diagnostics(module) == []
+
+    def test_deferred_construction_is_verified(self):
+        with deferred_validation():
+            bad = [OneOperandOp([], {}), OneOperandOp([], {})]
+            module = build_module([DummyOp([], {})] + bad)
+
+        with pytest.raises(VerificationError) as exc_info:
+            verify(module)
+
+        diagnostics = exc_info.value.diagnostics
+        assert [d.operation for d in diagnostics] == bad
+        assert [d.position for d in diagnostics] == [((0, 0, 1),), ((0, 0, 2),)]
+        assert "region #0, block #0, operation #2" in str(exc_info.value)
+        assert "requires exactly 1 operands" in str(exc_info.value)
+
+    def test_root_failure(self):
+        with deferred_validation():
+            module = ModuleOperation(operands=[], attributes={}, regions=[])
+        diagnostics = collect_diagnostics(module)
+        assert len(diagnostics) == 1
+        assert diagnostics[0].location == "root"
+
+    def test_nested_positions(self):
+        with deferred_validation():
+            bad = OneOperandOp([], {})
+            inner = ModuleOperation(
+                operands=[], attributes={}, regions=[Region([Block([], [bad])])]
+            )
+            module = build_module([DummyOp([], {}), inner])
+        diagnostics = collect_diagnostics(module)
+        assert len(diagnostics) == 1
+        assert diagnostics[0].position == ((0, 0, 1), (0, 0, 0))
+
+    def test_operand_dominance(self):
+        defining = ResultOp([], {})
+        early_user = OneOperandOp(defining.results, {})
+        late_user = OneOperandOp(defining.results, {})
+        module = build_module([early_user, defining, late_user])
+        diagnostics = collect_diagnostics(module)
+        assert [d.operation for d in diagnostics] == [early_user]
+        assert "Operand #0 of OneOperandOp does not dominate its use" in str(
+            diagnostics[0]
+        )
+
+    def test_nested_uses_are_dominated(self):
+        module = build_module([])
+        argument = module.regions[0].front.get_argument(0)
+        user = OneOperandOp([argument], {})
+        inner = ModuleOperation(
+            operands=[], attributes={}, regions=[Region([Block([], [user])])]
+        )
+        module.regions[0].front.push_end(inner)
+        assert collect_diagnostics(module) == []
+
+
+class TestParallelVerifier:
+    def build(self):
+        """A module of functions, every other one containing failures at different
+        depths."""
+        with deferred_validation():
+            functions = []
+            for i in range(6):
+                ops = [DummyOp([], {}) for _ in range(3)]
+                if i % 2 == 0:
+                    ops.insert(i // 2, OneOperandOp([], {}))
+                    ops.append(
+                        FunctionOp(
+                            [],
+                            {},
+                            regions=[Region([Block([], [OneOperandOp([], {})])])],
+                        )
+                    )
+                functions.append(FunctionOp([], {}, regions=[Region([Block([], ops)])]))
+            functions.insert(3, OneOperandOp([], {}))
+            return build_module(functions)
+
+    @pytest.mark.parametrize("backend", list(ParallelBackend))
+    def test_matches_serial(self, backend):
+        module = self.build()
+        serial = collect_diagnostics(module)
+        assert len(serial) == 7
+
+        context = MLIRContext(
+            enable_multithreading=True, max_workers=2, backend=backend
+        )
+        try:
+            for _ in range(3):
+                parallel = collect_diagnostics(module, context=context)
+                assert [d.position for d in parallel] == [d.position for d in serial]
+                assert [d.operation for d in parallel] == [d.operation for d in serial]
+                assert [str(d) for d in parallel] == [str(d) for d in serial]
+        finally:
+            context.shutdown()
+
+    @pytest.mark.parametrize("backend", list(ParallelBackend))
+    def test_isolation_is_checked_by_the_task(self, backend, monkeypatch):
+        module = build_module([])
+        argument = module.regions[0].front.get_argument(0)
+        with deferred_validation():
+            users = [OneOperandOp([argument], {}), DummyOp([], {})]
+            users.append(OneOperandOp([argument], {}))
+            functions = [
+                FunctionOp([], {}, regions=[Region([Block([], [user])])])
+                for user in users
+            ]
+        for function in functions:
+            module.regions[0].front.push_end(function)
+        serial = collect_diagnostics(module)
+        assert [d.operation for d in serial] == [functions[0], functions[2]]
+        assert "isolated from above" in str(serial[0])
+
+        checked_on = []
+        check = FunctionOp.check_uses_defined_within.__func__
+
+        def record(cls, operands, defined):
+            checked_on.append(threading.current_thread())
+            check(cls, operands, defined)
+
+        monkeypatch.setattr(
+            FunctionOp, "check_uses_defined_within", classmethod(record)
+        )
+        context = MLIRContext(
+            enable_multithreading=True, max_workers=2, backend=backend
+        )
+        try:
+            parallel = collect_diagnostics(module, context=context)
+        finally:
+            context.shutdown()
+        assert [d.position for d in parallel] == [d.position for d in serial]
+        assert [d.operation for d in parallel] == [d.operation for d in serial]
+        assert [str(d) for d in parallel] == [str(d) for d in serial]
+        if backend == ParallelBackend.THREAD:
+            assert checked_on
+            assert threading.main_thread() not in checked_on
+
+    def test_verify_raises_with_context(self):
+        context = MLIRContext(enable_multithreading=True, max_workers=2)
+        try:
+            with pytest.raises(VerificationError):
+                verify(self.build(), context=context)
+            verify(build_module([DummyOp([], {})]), context=context)
+        finally:
+            context.shutdown()
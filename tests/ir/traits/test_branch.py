@@ -0,0 +1,19 @@
+import pytest
+
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.branch import BranchOpInterface
+
+
+class DummyBranchOp(BranchOpInterface, Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+class TestBranchOpInterface:
+    def test_successor_operands_are_abstract(self):
+        assert DummyBranchOp.__abstractmethods__ == {
+            "get_successor_operands",
+            "erase_successor_operands",
+        }
+        with pytest.raises(TypeError, match="abstract"):
+            DummyBranchOp(operands=[], attributes={})
@@ -0,0 +1,23 @@
+import pytest
+
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.constant import ConstantLike
+from mlir.ir.types.numbers import IntegerType
+from mlir.utils.validator import ValidatorError
+
+
+class DummyConstantOp(ConstantLike, Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class TestConstantLike:
+    def test_valid(self):
+        value = IntegerAttribute(type=IntegerType(32), value=1)
+        op = DummyConstantOp(operands=[], attributes={"value": value})
+        assert isinstance(op, ConstantLike)
+
+    def test_requires_value(self):
+        with pytest.raises(ValidatorError, match="has no 'value' attribute"):
+            DummyConstantOp(operands=[], attributes={})
@@ -1,8 +1,10 @@
 import pytest
 
+from mlir.ir.blocks import Block
 from mlir.ir.operations import Operation, OpResult
 from mlir.ir.regions import Region
-from mlir.ir.traits.regions import NRegions
+from mlir.ir.traits.regions import IsolatedFromAbove, NRegions, OneRegion
+from mlir.ir.types import IntegerType
 from mlir.utils.validator import ValidatorError
 
 
@@ -49,3 +51,25 @@ class TestNRegions:
     def test_exact_regions_succeeds(self, op_class, n):
         op = op_class(operands=[], attributes={}, regions=[Region() for _ in range(n)])
         assert len(op.regions) == n
+
+
+class TestIsolatedFromAbove:
+    class IsolatedOp(IsolatedFromAbove, OneRegion, Operation):
+        def create_results(self, **kwargs) -> list[OpResult]:
+            return []
+
+    class UserOp(Operation):
+        def create_results(self, **kwargs) -> list[OpResult]:
+            return []
+
+    def test_uses_defined_inside_succeeds(self):
+        block = Block([IntegerType(32)], [])
+        block.push_end(self.UserOp([block.get_argument(0)], {}))
+        op = self.IsolatedOp([], {}, regions=[Region([block])])
+        assert len(op.regions) == 1
+
+    def test_uses_defined_above_raises(self):
+        outer = Block([IntegerType(32)], [])
+        block = Block([], [self.UserOp([outer.get_argument(0)], {})])
+        with pytest.raises(ValidatorError, match="is isolated from above"):
+            self.IsolatedOp([], {}, regions=[Region([block])])
@@ -55,6 +55,7 @@ class TestTypes:
                 (type_class.__name__,) + tuple(params.values())
             )
             assert retrieved_type is type_instance
+            assert context.get_type(type_instance.get_storage_key()) is type_instance
 
     def test_repr(self, type_class, combinations):
         """Test the __repr__ method of all types."""
@@ -21,6 +21,15 @@ class TestIntegerType:
         """Test the string representation of an integer type."""
         int_type = IntegerType(64)
         assert str(int_type) == "i64"
+        assert str(IntegerType(8, SignednessSemantics.SIGNED)) == "si8"
+        assert str(IntegerType(8, SignednessSemantics.UNSIGNED)) == "ui8"
+
+    def test_get_fills_in_defaults(self):
+        """Test that a defaulted signedness is uniqued with the explicit one."""
+        context = MLIRContext()
+        int_type = IntegerType.get(context, 32)
+        assert IntegerType.get(context, 32, SignednessSemantics.SIGNLESS) is int_type
+        assert IntegerType.get_signed(context, 32) is not int_type
 
 
 class TestFloatType:
@@ -0,0 +1,285 @@
+import pytest
+
+from mlir.context import MLIRContext, ParallelBackend
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.types import IntegerType
+from mlir.passes import OpPassManager, Pass, PassFailure, PassManager
+
+
+class OtherOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+class RecordingPass(Pass):
+    argument = "test-record"
+
+    def __init__(self, log: list, label: str):
+        super().__init__()
+        self.log = log
+        self.label = label
+
+    def run_on_operation(self, operation, context):
+        self.log.append((self.label, operation))
+
+
+class FuncOnlyPass(RecordingPass):
+    argument = "test-func-only"
+    anchor = FuncOp
+
+
+def build_module(number_of_functions: int) -> tuple[ModuleOperation, list[FuncOp]]:
+    module = ModuleOperation.build()
+    functions = [FuncOp.build() for _ in range(number_of_functions)]
+    for function in functions:
+        function.entry_block.push_end(ReturnOp.build())
+    module.regions[0].push_end(Block([], functions + [OtherOp([], {})]))
+    return module, functions
+
+
+class TestPassManager:
+    def test_runs_on_anchor(self):
+        log = []
+        module, _ = build_module(1)
+        pm = PassManager(MLIRContext())
+        pm.add_pass(RecordingPass(log, "a")).add_pass(RecordingPass(log, "b"))
+        pm.run(module)
+        assert log == [("a", module), ("b", module)]
+
+    def test_wrong_anchor_raises(self):
+        pm = PassManager(MLIRContext())
+        with pytest.raises(ValueError, match="cannot run on"):
+            pm.run(FuncOp.build())
+        with pytest.raises(ValueError, match="cannot be scheduled on"):
+            pm.add_pass(FuncOnlyPass([], "a"))
+
+    def test_nested_pipeline_visits_each_function_once(self):
+        log = []
+        module, functions = build_module(3)
+        pm = PassManager(MLIRContext())
+        pm.nest(FuncOp).add_pass(FuncOnlyPass(log, "a"))
+        pm.nest(FuncOp).add_pass(FuncOnlyPass(log, "b"))
+        assert len(pm.passes) == 1
+
+        pm.run(module)
+        expected = []
+        for function in functions:
+            expected += [("a", function), ("b", function)]
+        assert log == expected
+
+    def test_adjacent_nested_pipelines_share_a_walk(self):
+        log = []
+        module, functions = build_module(2)
+        other = module.regions[0].front.back
+        pm = PassManager(MLIRContext())
+        pm.nest(FuncOp).add_pass(FuncOnlyPass(log, "func"))
+        pm.nest(OtherOp).add_pass(RecordingPass(log, "other"))
+        pm.add_pass(RecordingPass(log, "module"))
+
+        pm.run(module)
+        assert log == [
+            ("func", functions[0]),
+            ("func", functions[1]),
+            ("other", other),
+            ("module", module),
+        ]
+
+    def test_adjacent_nested_pipelines_with_overlapping_anchors(self):
+        log = []
+        module, functions = build_module(2)
+        other = module.regions[0].front.back
+        pm = PassManager(MLIRContext())
+        pm.nest(FuncOp).add_pass(FuncOnlyPass(log, "func"))
+        pm.nest(Operation).add_pass(RecordingPass(log, "any"))
+
+        pm.run(module)
+        assert log == [
+            ("func", functions[0]),
+            ("any", functions[0]),
+            ("func", functions[1]),
+            ("any", functions[1]),
+            ("any", other),
+        ]
+
+    def test_str(self):
+        pm = OpPassManager(ModuleOperation)
+        pm.nest(FuncOp).add_pass(FuncOnlyPass([], "a"))
+        pm.add_pass(RecordingPass([], "b"))
+        assert str(pm) == "builtin.module(func.func(test-func-only),test-record)"
+
+
+class MarkerOp(Operation):
+    __slots__ = ()
+
+    def create_results(self, operands, **kwargs) -> list[OpResult]:
+        return [OpResult(operands[0].type, self, 0)] if operands else []
+
+
+class MarkFunctionPass(Pass):
+    """Adds a marker using each argument before the terminator of every function, and
+    fails on functions without arguments."""
+
+    argument = "test-mark-function"
+    anchor = FuncOp
+
+    def run_on_operation(self, operation, context):
+        block = operation.entry_block
+        if block.number_of_arguments == 0:
+            raise ValueError("function has no arguments")
+        for argument in operation.arguments:
+            block.insert_before(block.terminator, MarkerOp([argument], {}))
+            self.statistics["markers"] += 1
+        self.statistics["functions"] += 1
+
+
+class TagFunctionPass(Pass):
+    """Tags every function with an attribute of a type that is created by the pass."""
+
+    argument = "test-tag-function"
+    anchor = FuncOp
+
+    def run_on_operation(self, operation, context):
+        i17 = IntegerType.get(context, 17)
+        operation.attributes["tag"] = IntegerAttribute.get(context, i17, 3)
+        operation.entry_block.add_argument(i17)
+
+
+class BreakDominancePass(Pass):
+    """Adds a marker before the terminator of functions with arguments, used by another
+    marker at the start of the function."""
+
+    argument = "test-break-dominance"
+    anchor = FuncOp
+
+    def run_on_operation(self, operation, context):
+        block = operation.entry_block
+        if block.number_of_arguments:
+            marker = MarkerOp([operation.arguments[0]], {})
+            block.push_front(MarkerOp([marker.results[0]], {}))
+            block.insert_before(block.terminator, marker)
+
+
+class CountOperationsPass(Pass):
+    argument = "test-count-operations"
+
+    def run_on_operation(self, operation, context):
+        self.statistics["operations"] += 1
+
+
+def build_parallel_module(context: MLIRContext) -> ModuleOperation:
+    module = ModuleOperation.build()
+    block = Block([], [])
+    module.regions[0].push_end(block)
+    i32 = IntegerType.get(context, 32)
+    for i in range(6):
+        function = FuncOp.build([i32] * (i % 3))
+        function.entry_block.push_end(ReturnOp.build())
+        block.push_end(function)
+    block.push_end(OtherOp([], {}))
+    return module
+
+
+def summarise(module: ModuleOperation) -> list[list[str]]:
+    return [
+        [type(op).__name__ for op in function.entry_block]
+        for function in module.regions[0].front
+        if isinstance(function, FuncOp)
+    ]
+
+
+class TestParallelPassManager:
+    def run(self, context):
+        module = build_parallel_module(context)
+        pm = PassManager(context)
+        pm.nest(FuncOp).add_pass(MarkFunctionPass())
+        pm.nest(Operation).add_pass(CountOperationsPass())
+        with pytest.raises(PassFailure) as exc_info:
+            pm.run(module)
+        return module, pm, exc_info.value
+
+    @pytest.mark.parametrize("backend", list(ParallelBackend))
+    def test_matches_serial(self, backend):
+        serial_module, serial_pm, serial_failure = self.run(MLIRContext())
+
+        context = MLIRContext(
+            enable_multithreading=True, max_workers=2, backend=backend
+        )
+        try:
+            module, pm, failure = self.run(context)
+        finally:
+            context.shutdown()
+
+        assert summarise(module) == summarise(serial_module)
+        assert pm.statistics == serial_pm.statistics
+        assert pm.statistics == {
+            "0:test-mark-function": {"markers": 6, "functions": 4},
+            "1:test-count-operations": {"operations": 5},
+        }
+        assert [d.position for d in failure.diagnostics] == [((0, 0, 0),), ((0, 0, 3),)]
+        assert [str(d) for d in failure.diagnostics] == [
+            str(d) for d in serial_failure.diagnostics
+        ]
+
+        functions = list(module.regions[0].front)[:6]
+        assert [d.operation for d in failure.diagnostics] == [
+            functions[0],
+            functions[3],
+        ]
+        i32 = IntegerType.get(context, 32)
+        for function in functions:
+            for op in function.entry_block:
+                assert op.parent is function.entry_block
+                assert function.entry_block.parent_operation is function
+                for operand in op.operands:
+                    assert operand.value in function.arguments
+                    assert operand in operand.value.uses
+                for result in op.results:
+                    assert result.type is i32
+
+    @pytest.mark.parametrize("backend", list(ParallelBackend))
+    def test_uniques_what_workers_create(self, backend):
+        context = MLIRContext(
+            enable_multithreading=True, max_workers=2, backend=backend
+        )
+        module = build_parallel_module(context)
+        pm = PassManager(context)
+        pm.nest(FuncOp).add_pass(TagFunctionPass())
+        try:
+            pm.run(module)
+        finally:
+            context.shutdown()
+
+        i17 = IntegerType.get(context, 17)
+        tag = IntegerAttribute.get(context, i17, 3)
+        functions = list(module.regions[0].front)[:6]
+        for function in functions:
+            assert function.attributes["tag"] is tag
+            assert function.arguments[-1].type is i17
+
+    @pytest.mark.parametrize("backend", [None] + list(ParallelBackend))
+    def test_verify_each(self, backend):
+        context = MLIRContext(
+            enable_multithreading=backend is not None, max_workers=2, backend=backend
+        )
+        module = build_parallel_module(context)
+        pm = PassManager(context, verify_each=True)
+        pm.nest(FuncOp).add_pass(BreakDominancePass()).add_pass(CountOperationsPass())
+        try:
+            with pytest.raises(PassFailure, match="does not dominate") as exc_info:
+                pm.run(module)
+        finally:
+            context.shutdown()
+
+        # Verification fails on the functions with arguments, which skip the next pass.
+        diagnostics = exc_info.value.diagnostics
+        assert [d.position[0] for d in diagnostics] == [(0, 0, i) for i in (1, 2, 4, 5)]
+        assert pm.statistics == {"1:test-count-operations": {"operations": 2}}
+
+        module = build_parallel_module(MLIRContext())
+        pm = PassManager(MLIRContext())
+        pm.nest(FuncOp).add_pass(BreakDominancePass())
+        pm.run(module)
@@ -0,0 +1,80 @@
+import pytest
+
+from mlir.context import MLIRContext
+from mlir.dialects.func import FuncOp
+from mlir.ir.module import ModuleOperation
+from mlir.passes import (
+    OpPassManager,
+    Pass,
+    PassManager,
+    PipelineParseError,
+    parse_pass_pipeline,
+    register_pass,
+)
+
+
+@register_pass
+class CountingPass(Pass):
+    argument = "test-pipeline-count"
+
+    def __init__(self, max_count: int = 1, enabled: bool = True, tag: str = ""):
+        super().__init__(max_count=max_count, enabled=enabled, tag=tag)
+
+    def run_on_operation(self, operation, context):
+        pass
+
+
+@register_pass
+class FunctionPass(Pass):
+    argument = "test-pipeline-func"
+    anchor = FuncOp
+
+    def run_on_operation(self, operation, context):
+        pass
+
+
+class TestParsePassPipeline:
+    def test_round_trip(self):
+        text = "builtin.module(func.func(test-pipeline-func),test-pipeline-count)"
+        manager = parse_pass_pipeline(text)
+        assert manager.anchor is ModuleOperation
+        assert isinstance(manager.passes[0], OpPassManager)
+        assert manager.passes[0].anchor is FuncOp
+        assert str(manager) == (
+            "builtin.module(func.func(test-pipeline-func),"
+            "test-pipeline-count{max-count=1 enabled=true tag=})"
+        )
+
+    def test_options(self):
+        manager = parse_pass_pipeline(
+            "builtin.module(test-pipeline-count{max-count=5 enabled=false tag=x})"
+        )
+        assert manager.passes[0].options == dict(max_count=5, enabled=False, tag="x")
+
+    def test_adjacent_nested_pipelines_are_fused(self):
+        manager = parse_pass_pipeline(
+            "builtin.module(func.func(test-pipeline-func), func.func(test-pipeline-func))"
+        )
+        assert len(manager.passes) == 1
+        assert len(manager.passes[0].passes) == 2
+
+    def test_pass_manager_parse(self):
+        pm = PassManager.parse(
+            MLIRContext(), "builtin.module(func.func(test-pipeline-func))"
+        )
+        assert isinstance(pm, PassManager)
+        pm.run(ModuleOperation.build())
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("unknown.op(test-pipeline-count)", "Unknown operation"),
+            ("builtin.module(not-a-pass)", "Unknown pass"),
+            ("builtin.module(test-pipeline-count", r"Expected '\)'"),
+            ("builtin.module(test-pipeline-func)", "cannot be scheduled"),
+            ("builtin.module() extra", "Unexpected trailing"),
+        ],
+    )
+    def test_errors(self, text, message):
+        with pytest.raises(PipelineParseError, match=message):
+            parse_pass_pipeline(text)
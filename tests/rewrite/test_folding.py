@@ -0,0 +1,120 @@
+import math
+import struct
+
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp, MulIOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import FloatAttribute, IntegerAttribute
+from mlir.ir.types import FloatType, FloatTypeKind, IntegerType
+from mlir.rewrite import (
+    GreedyPatternRewriteDriver,
+    OperationFolder,
+    apply_patterns_greedily,
+    get_constant_value,
+)
+
+
+def constant(value: int) -> ConstantOp:
+    return ConstantOp.build(IntegerAttribute(type=IntegerType(32), value=value))
+
+
+class TestOperationFolder:
+    def test_fold_materializes_uniqued_constant(self):
+        context = MLIRContext()
+        function = FuncOp.build([IntegerType(32)])
+        block = function.entry_block
+        lhs, rhs = constant(2), constant(3)
+        add = AddIOp.build(lhs.results[0], rhs.results[0])
+        ret = ReturnOp.build(add.results)
+        for op in [lhs, rhs, add, ret]:
+            block.push_end(op)
+
+        folder = OperationFolder(context, function)
+        assert folder.try_fold(add)
+        folded = ret.operands[0].value.owner
+        assert isinstance(folded, ConstantOp)
+        assert block.front is folded
+        assert folded.value is IntegerAttribute.get(context, IntegerType(32), 5)
+
+        # A second fold to the same constant reuses the materialized operation.
+        other = AddIOp.build(lhs.results[0], rhs.results[0])
+        block.insert_before(ret, other)
+        assert folder.try_fold(other)
+        assert block.operations.count(folded) == 1
+        assert [op for op in block if isinstance(op, ConstantOp)] == [folded, lhs, rhs]
+
+    def test_no_fold(self):
+        function = FuncOp.build([IntegerType(32)])
+        x = function.arguments[0]
+        add = AddIOp.build(x, x)
+        function.entry_block.push_end(add)
+        assert not OperationFolder(MLIRContext(), function).try_fold(add)
+        assert add.parent is function.entry_block
+
+    def test_get_constant_value(self):
+        op = constant(4)
+        assert get_constant_value(op.results[0]) == op.value
+        assert get_constant_value(AddIOp.build(*op.results * 2).results[0]) is None
+
+
+class TestGreedyFolding:
+    def test_folds_and_deduplicates(self):
+        context = MLIRContext()
+        function = FuncOp.build([IntegerType(32)])
+        x = function.arguments[0]
+        block = function.entry_block
+        c1, c2, c1_again = constant(1), constant(2), constant(1)
+        add = AddIOp.build(c1.results[0], c2.results[0])  # folds to 3
+        mul = MulIOp.build(c1_again.results[0], x)  # x * 1 -> x
+        three = constant(3)
+        sum_ = AddIOp.build(add.results[0], three.results[0])  # folds to 6
+        ret = ReturnOp.build([mul.results[0], sum_.results[0], three.results[0]])
+        for op in [c1, c2, add, c1_again, mul, three, sum_, ret]:
+            block.push_end(op)
+
+        driver = GreedyPatternRewriteDriver(function, [], context=context)
+        assert driver.run()
+
+        assert ret.operands[0].value is x
+        remaining = block.operations
+        assert remaining[-1] is ret
+        constants = remaining[:-1]
+        assert all(isinstance(op, ConstantOp) for op in constants)
+        assert sorted(op.value.value for op in constants) == [3, 6]
+        assert ret.operands[2].value.owner.value.value == 3
+        assert ret.operands[1].value.owner.value.value == 6
+        assert driver.statistics["folded"] == 4  # including the operand swap
+        assert driver.statistics["dead-erased"] >= 2
+
+    def test_keeps_signed_zeros_and_nan_payloads_apart(self):
+        quiet_nan = struct.unpack("<d", struct.pack("<Q", 0x7FF8000000000000))[0]
+        payload_nan = struct.unpack("<d", struct.pack("<Q", 0x7FF8000000000001))[0]
+        values = [0.0, -0.0, 0.0, quiet_nan, payload_nan, quiet_nan]
+        f32 = FloatType(FloatTypeKind.F32)
+        constants = [
+            ConstantOp.build(FloatAttribute(type=f32, value=value)) for value in values
+        ]
+        function = FuncOp.build()
+        ret = ReturnOp.build([op.results[0] for op in constants])
+        for op in constants + [ret]:
+            function.entry_block.push_end(op)
+
+        assert apply_patterns_greedily(function, [], context=MLIRContext())
+        bits = [
+            struct.pack("<d", operand.value.owner.value.value)
+            for operand in ret.operands
+        ]
+        assert bits == [struct.pack("<d", value) for value in values]
+        assert math.copysign(1.0, ret.operands[1].value.owner.value.value) == -1.0
+        assert ret.operands[2].value is ret.operands[0].value
+        assert ret.operands[5].value is ret.operands[3].value
+        assert len(function.entry_block.operations) == 5
+
+    def test_without_context_does_not_fold(self):
+        function = FuncOp.build()
+        lhs, rhs = constant(2), constant(3)
+        add = AddIOp.build(lhs.results[0], rhs.results[0])
+        for op in [lhs, rhs, add, ReturnOp.build(add.results)]:
+            function.entry_block.push_end(op)
+        assert apply_patterns_greedily(function, [])
+        assert add.parent is function.entry_block
@@ -0,0 +1,178 @@
+from mlir.dialects.arith import AddIOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.effects import Pure
+from mlir.ir.types import IntegerType
+from mlir.rewrite import (
+    RewritePattern,
+    Worklist,
+    apply_patterns_greedily,
+    is_trivially_dead,
+)
+
+
+class SourceOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class IdentityOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class NegateOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+class FoldIdentity(RewritePattern):
+    root = IdentityOp
+
+    def match_and_rewrite(self, operation, rewriter) -> bool:
+        rewriter.replace_op(operation, [operation.operands[0].value])
+        return True
+
+
+class EraseUnused(RewritePattern):
+    def match_and_rewrite(self, operation, rewriter) -> bool:
+        if isinstance(operation, ReturnOp) or not all(
+            result.use_empty for result in operation.results
+        ):
+            return False
+        rewriter.erase_op(operation)
+        return True
+
+
+class NegateToIdentity(RewritePattern):
+    root = NegateOp
+
+    def match_and_rewrite(self, operation, rewriter) -> bool:
+        identity = IdentityOp([operation.operands[0].value], {})
+        rewriter.insert_before(operation, identity)
+        rewriter.replace_op(operation, identity)
+        return True
+
+
+def build_function(*builders) -> tuple[FuncOp, list[Operation]]:
+    function = FuncOp.build()
+    operations = []
+    for builder in builders:
+        operations.append(builder(operations))
+        function.entry_block.push_end(operations[-1])
+    return function, operations
+
+
+class TestGreedyRewriteDriver:
+    def test_folds_chain(self):
+        function, operations = build_function(
+            lambda ops: SourceOp([], {}),
+            lambda ops: IdentityOp([ops[-1].results[0]], {}),
+            lambda ops: IdentityOp([ops[-1].results[0]], {}),
+            lambda ops: ReturnOp.build([ops[-1].results[0]]),
+        )
+        assert apply_patterns_greedily(function, [FoldIdentity()])
+
+        source, ret = operations[0], operations[-1]
+        assert function.entry_block.operations == [source, ret]
+        assert ret.operands[0].value is source.results[0]
+
+    def test_erased_ops_requeue_their_operands(self):
+        function, operations = build_function(
+            lambda ops: SourceOp([], {}),
+            lambda ops: IdentityOp([ops[-1].results[0]], {}),
+            lambda ops: IdentityOp([ops[-1].results[0]], {}),
+            lambda ops: ReturnOp.build(),
+        )
+        assert apply_patterns_greedily(function, [EraseUnused()])
+        assert function.entry_block.operations == [operations[-1]]
+        assert all(
+            operation.parent is None and operation.operands[0].value is None
+            for operation in operations[1:3]
+        )
+
+    def test_inserted_ops_are_visited(self):
+        function, operations = build_function(
+            lambda ops: SourceOp([], {}),
+            lambda ops: NegateOp([ops[-1].results[0]], {}),
+            lambda ops: ReturnOp.build([ops[-1].results[0]]),
+        )
+        patterns = [NegateToIdentity(), FoldIdentity()]
+        assert apply_patterns_greedily(function, patterns)
+
+        source, ret = operations[0], operations[-1]
+        assert function.entry_block.operations == [source, ret]
+        assert ret.operands[0].value is source.results[0]
+
+    def test_patterns_ordered_by_benefit(self):
+        log = []
+
+        class Record(RewritePattern):
+            root = SourceOp
+
+            def __init__(self, label, benefit):
+                self.label = label
+                self.benefit = benefit
+
+            def match_and_rewrite(self, operation, rewriter) -> bool:
+                log.append(self.label)
+                return False
+
+        function, _ = build_function(lambda ops: SourceOp([], {}))
+        apply_patterns_greedily(function, [Record("low", 1), Record("high", 2)])
+        assert log == ["high", "low"]
+
+    def test_root_matching(self):
+        visited = []
+
+        class RecordFuncs(RewritePattern):
+            root = FuncOp
+
+            def match_and_rewrite(self, operation, rewriter) -> bool:
+                visited.append(operation)
+                return False
+
+        function, _ = build_function(lambda ops: SourceOp([], {}))
+        apply_patterns_greedily(function, [RecordFuncs()])
+        # The root itself is not rewritten, and SourceOp does not match.
+        assert visited == []
+
+    def test_max_rewrites(self):
+        class AlwaysModify(RewritePattern):
+            root = SourceOp
+
+            def match_and_rewrite(self, operation, rewriter) -> bool:
+                rewriter.notify_operation_modified(operation)
+                return True
+
+        function, _ = build_function(lambda ops: SourceOp([], {}))
+        assert not apply_patterns_greedily(function, [AlwaysModify()], max_rewrites=5)
+
+
+class TestWorklist:
+    def test_push_pop_remove(self):
+        a, b, c = (SourceOp([], {}) for _ in range(3))
+        worklist = Worklist()
+        for operation in (a, b, c, a):
+            worklist.push(operation)
+        assert len(worklist) == 3
+
+        worklist.remove(b)
+        assert b not in worklist
+        assert worklist.pop() is c
+        assert worklist.pop() is a
+        assert worklist.pop() is None
+
+
+class TestTriviallyDead:
+    def test_pure_operations(self):
+        function, operations = build_function(
+            lambda ops: SourceOp([], {}),
+            lambda ops: AddIOp.build(ops[0].results[0], ops[0].results[0]),
+            lambda ops: ReturnOp.build(),
+        )
+        assert isinstance(operations[1], Pure)
+        assert is_trivially_dead(operations[1])
+        assert not is_trivially_dead(operations[0])
+        apply_patterns_greedily(function, [])
+        assert function.entry_block.operations == [operations[0], operations[2]]
@@ -0,0 +1,72 @@
+from collections import Counter
+
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.traits.terminator import Terminator
+from mlir.rewrite import (
+    FrozenRewritePatternSet,
+    RewritePattern,
+    apply_patterns_greedily,
+)
+
+
+class PlainOp(Operation):
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+class DerivedOp(PlainOp):
+    pass
+
+
+class Never(RewritePattern):
+    def __init__(self, root, benefit=1):
+        self.root = root
+        self.benefit = benefit
+
+    def match_and_rewrite(self, operation, rewriter) -> bool:
+        return False
+
+
+class TestFrozenRewritePatternSet:
+    def test_dispatch_by_class_and_trait(self):
+        any_op = Never(None)
+        plain = Never(PlainOp)
+        derived = Never(DerivedOp, benefit=3)
+        terminator = Never(Terminator, benefit=2)
+        patterns = FrozenRewritePatternSet([any_op, plain, derived, terminator])
+
+        assert patterns.get_patterns(PlainOp([], {})) == (any_op, plain)
+        assert patterns.get_patterns(DerivedOp([], {})) == (derived, any_op, plain)
+        assert patterns.get_patterns(ReturnOp.build()) == (terminator, any_op)
+        assert patterns.get_patterns(FuncOp.build()) == (any_op,)
+
+    def test_dispatch_is_cached(self):
+        patterns = FrozenRewritePatternSet([Never(PlainOp)])
+        first = patterns.get_patterns(PlainOp([], {}))
+        assert patterns.get_patterns(PlainOp([], {})) is first
+
+
+class TestPatternStatistics:
+    def test_attempted_and_succeeded(self):
+        class EraseDerived(RewritePattern):
+            root = DerivedOp
+            benefit = 2
+
+            def match_and_rewrite(self, operation, rewriter) -> bool:
+                rewriter.erase_op(operation)
+                return True
+
+        function = FuncOp.build()
+        for op in [PlainOp([], {}), DerivedOp([], {}), DerivedOp([], {})]:
+            function.entry_block.push_end(op)
+        function.entry_block.push_end(ReturnOp.build())
+
+        statistics = Counter()
+        patterns = [Never(PlainOp), EraseDerived()]
+        assert apply_patterns_greedily(function, patterns, statistics=statistics)
+        assert statistics == {
+            "Never.attempted": 1,
+            "EraseDerived.attempted": 2,
+            "EraseDerived.succeeded": 2,
+        }
@@ -0,0 +1,47 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from mlir.context import MLIRContext, ParallelBackend
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.types import IntegerType
+
+
+class TestMLIRContext:
+    def test_multithreading_disabled_by_default(self):
+        context = MLIRContext()
+        assert not context.is_multithreading_enabled
+        assert context.executor is None
+
+    def test_thread_executor_is_reused(self):
+        context = MLIRContext(enable_multithreading=True, max_workers=2)
+        try:
+            executor = context.executor
+            assert isinstance(executor, ThreadPoolExecutor)
+            assert context.executor is executor
+        finally:
+            context.shutdown()
+
+    def test_enable_multithreading_replaces_executor(self):
+        context = MLIRContext()
+        context.enable_multithreading(max_workers=1, backend=ParallelBackend.PROCESS)
+        try:
+            assert context.backend == ParallelBackend.PROCESS
+            assert isinstance(context.executor, ProcessPoolExecutor)
+            context.enable_multithreading(False)
+            assert context.executor is None
+        finally:
+            context.shutdown()
+
+    def test_types_and_attributes_are_uniqued_across_threads(self):
+        context = MLIRContext()
+
+        def get(index: int):
+            type = IntegerType.get(context, index % 64 + 1)
+            return type, IntegerAttribute.get(context, type, 0)
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(get, range(2000)))
+        for index, (type, attribute) in enumerate(results):
+            assert type is results[index % 64][0]
+            assert attribute is results[index % 64][1]
+        assert len(context.types) == 64
+        assert len(context.attributes) == 64
@@ -0,0 +1,52 @@
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.types import IntegerType
+from mlir.passes import PassManager
+from mlir.transforms import CanonicalizePass
+
+
+def build_function(value: int) -> FuncOp:
+    """Builds a function returning ``(value + 0) + (1 + 1)`` from fresh constants."""
+    function = FuncOp.build()
+    constants = [
+        ConstantOp.build(IntegerAttribute(type=IntegerType(32), value=v))
+        for v in (value, 0, 1, 1)
+    ]
+    lhs = AddIOp.build(constants[0].results[0], constants[1].results[0])
+    rhs = AddIOp.build(constants[2].results[0], constants[3].results[0])
+    total = AddIOp.build(lhs.results[0], rhs.results[0])
+    for op in constants + [lhs, rhs, total, ReturnOp.build(total.results)]:
+        function.entry_block.push_end(op)
+    return function
+
+
+class TestCanonicalize:
+    def test_pipeline(self):
+        context = MLIRContext()
+        module = ModuleOperation.build()
+        functions = [build_function(3), build_function(3), build_function(5)]
+        module.regions[0].push_end(Block([], functions))
+
+        pm = PassManager.parse(context, "builtin.module(func.func(canonicalize))")
+        pm.run(module)
+
+        results = []
+        for function in functions:
+            constant, ret = function.entry_block.operations
+            assert ret.operands[0].value is constant.results[0]
+            results.append(constant.value)
+        assert [result.value for result in results] == [5, 5, 7]
+        # Folded constants are uniqued in the context.
+        assert results[0] is results[1]
+
+    def test_statistics(self):
+        context = MLIRContext()
+        function = build_function(3)
+        canonicalize = CanonicalizePass()
+        canonicalize.run_on_operation(function, context)
+        assert canonicalize.statistics["folded"] == 3
+        assert str(canonicalize) == "canonicalize"
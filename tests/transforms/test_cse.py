@@ -0,0 +1,114 @@
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp, MulIOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.regions import Region
+from mlir.ir.traits.regions import OneRegion
+from mlir.ir.types import IntegerType
+from mlir.passes import lookup_pass
+from mlir.transforms import CSEPass, operation_key
+
+
+class ImpureOp(Operation):
+    def create_results(self, operands, **kwargs) -> list[OpResult]:
+        return [OpResult(operands[0].type, self, 0)]
+
+
+class ScopeOp(Operation, OneRegion):
+    """A non-isolated operation with a region, e.g. a loop."""
+
+    def create_results(self, **kwargs) -> list[OpResult]:
+        return []
+
+
+def run_cse(operation: Operation, context: MLIRContext) -> CSEPass:
+    cse = CSEPass()
+    cse.run_on_operation(operation, context)
+    return cse
+
+
+class TestCSE:
+    def test_eliminates_chains(self):
+        context = MLIRContext()
+        i32 = IntegerType.get(context, 32)
+        function = FuncOp.build([i32])
+        x = function.arguments[0]
+        c1 = ConstantOp.build(IntegerAttribute.get(context, i32, 1))
+        c2 = ConstantOp.build(IntegerAttribute.get(context, i32, 1))
+        a1 = AddIOp.build(x, c1.results[0])
+        a2 = AddIOp.build(x, c2.results[0])
+        m1 = MulIOp.build(a1.results[0], a1.results[0])
+        m2 = MulIOp.build(a2.results[0], a2.results[0])
+        ret = ReturnOp.build([m1.results[0], m2.results[0]])
+        for op in [c1, c2, a1, a2, m1, m2, ret]:
+            function.entry_block.push_end(op)
+
+        cse = run_cse(function, context)
+        assert function.entry_block.operations == [c1, a1, m1, ret]
+        assert ret.operands[1].value is m1.results[0]
+        assert cse.statistics["eliminated"] == 3
+
+    def test_attributes_compared_by_identity(self):
+        context = MLIRContext()
+        i32 = IntegerType.get(context, 32)
+        function = FuncOp.build()
+        c1 = ConstantOp.build(IntegerAttribute(type=i32, value=1))
+        c2 = ConstantOp.build(IntegerAttribute(type=i32, value=1))
+        function.entry_block.push_end(c1)
+        function.entry_block.push_end(c2)
+        assert operation_key(c1) != operation_key(c2)
+        run_cse(function, context)
+        assert function.entry_block.operations == [c1, c2]
+
+    def test_impure_operations_are_kept(self):
+        context = MLIRContext()
+        function = FuncOp.build([IntegerType.get(context, 32)])
+        x = function.arguments[0]
+        ops = [ImpureOp([x], {}), ImpureOp([x], {})]
+        for op in ops:
+            function.entry_block.push_end(op)
+        run_cse(function, context)
+        assert function.entry_block.operations == ops
+
+    def test_region_scoping(self):
+        context = MLIRContext()
+        i32 = IntegerType.get(context, 32)
+        one = IntegerAttribute.get(context, i32, 1)
+        module = ModuleOperation.build()
+        outer = ConstantOp.build(one)
+        inner = ConstantOp.build(one)
+        inner_user = AddIOp.build(inner.results[0], inner.results[0])
+        scope = ScopeOp([], {}, [Region([Block([], [inner, inner_user])])])
+        # A second block in the same region sees the entry block, but not the reverse.
+        later = ConstantOp.build(one)
+        isolated = FuncOp.build()
+        isolated_constant = ConstantOp.build(one)
+        isolated.entry_block.push_end(isolated_constant)
+        module.regions[0].push_end(Block([], [outer, scope, isolated]))
+        scope.regions[0].push_end(Block([], [later]))
+
+        run_cse(module, context)
+        assert inner.parent is None
+        assert inner_user.operands[0].value is outer.results[0]
+        assert later.parent is None
+        # Operations isolated from above never reuse values from outside.
+        assert isolated_constant.parent is isolated.entry_block
+
+    def test_sibling_regions_are_not_visible(self):
+        context = MLIRContext()
+        one = IntegerAttribute.get(context, IntegerType.get(context, 32), 1)
+        module = ModuleOperation.build()
+        first, second = ConstantOp.build(one), ConstantOp.build(one)
+        scopes = [
+            ScopeOp([], {}, [Region([Block([], [op])])]) for op in (first, second)
+        ]
+        module.regions[0].push_end(Block([], scopes))
+
+        run_cse(module, context)
+        assert first.parent is not None and second.parent is not None
+
+    def test_registered(self):
+        assert lookup_pass("cse") is CSEPass
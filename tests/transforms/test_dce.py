@@ -0,0 +1,109 @@
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp, MulIOp
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.types import IntegerType
+from mlir.passes import lookup_pass
+from mlir.transforms import DeadCodeEliminationPass
+
+
+class SideEffectOp(Operation):
+    def create_results(self, operands, **kwargs) -> list[OpResult]:
+        return [OpResult(IntegerType(32), self, 0)]
+
+
+def constant(value: int) -> ConstantOp:
+    return ConstantOp.build(IntegerAttribute(type=IntegerType(32), value=value))
+
+
+def run_dce(operation: Operation) -> DeadCodeEliminationPass:
+    dce = DeadCodeEliminationPass()
+    dce.run_on_operation(operation, MLIRContext())
+    return dce
+
+
+class TestDeadCodeElimination:
+    def test_cascades_through_operands(self):
+        function = FuncOp.build([IntegerType(32)])
+        x = function.arguments[0]
+        c = constant(2)
+        add = AddIOp.build(x, c.results[0])
+        mul = MulIOp.build(add.results[0], add.results[0])
+        effect = SideEffectOp([x], {})
+        ret = ReturnOp.build()
+        for op in [c, add, mul, effect, ret]:
+            function.entry_block.push_end(op)
+
+        dce = run_dce(function)
+        assert function.entry_block.operations == [effect, ret]
+        assert dce.statistics["erased-operations"] == 3
+        assert x.uses == [effect.operands[0]]
+
+    def test_unreachable_blocks(self):
+        function = FuncOp.build()
+        entry, exit_, dead, dead_loop = Block(), Block(), Block(), Block()
+        dead_value = constant(1)
+        entry.push_end(BranchOp.build(exit_))
+        exit_.push_end(ReturnOp.build())
+        # Unreachable blocks may branch to each other, and to reachable blocks.
+        dead.push_end(dead_value)
+        dead.push_end(BranchOp.build(dead_loop))
+        dead_loop.push_end(
+            CondBranchOp.build(dead_value.results[0], dead, [], exit_, [])
+        )
+        function.body.clear()
+        for block in [entry, dead, exit_, dead_loop]:
+            function.body.push_end(block)
+
+        dce = run_dce(function)
+        assert function.body.blocks == [entry, exit_]
+        assert dce.statistics["erased-blocks"] == 2
+        assert dead_value.results[0].use_empty
+
+    def test_dead_block_arguments(self):
+        i32 = IntegerType(32)
+        function = FuncOp.build([i32, IntegerType(1)])
+        x, condition = function.arguments
+        entry = function.entry_block
+        join = Block([i32, i32, i32])
+        kept, dead_a, dead_b = join._arguments
+
+        c = constant(3)
+        doubled = AddIOp.build(x, x)
+        entry.push_end(c)
+        entry.push_end(doubled)
+        entry.push_end(
+            CondBranchOp.build(
+                condition,
+                join,
+                [x, doubled.results[0], c.results[0]],
+                join,
+                [x, x, x],
+            )
+        )
+        # dead_a is only used by an operation that is itself dead.
+        join.push_end(MulIOp.build(dead_a, dead_a))
+        join.push_end(ReturnOp.build([kept]))
+        function.body.push_end(join)
+
+        dce = run_dce(function)
+        assert join._arguments == [kept]
+        branch = entry.terminator
+        assert [o.value for o in branch.get_successor_operands(0)] == [x]
+        assert [o.value for o in branch.get_successor_operands(1)] == [x]
+        # The operands forwarded to the removed arguments were dead too.
+        assert entry.operations == [branch]
+        assert dce.statistics["erased-arguments"] == 2
+        assert dce.statistics["erased-operations"] == 3
+
+    def test_entry_arguments_are_kept(self):
+        function = FuncOp.build([IntegerType(32)])
+        function.entry_block.push_end(ReturnOp.build())
+        run_dce(function)
+        assert len(function.arguments) == 1
+
+    def test_registered(self):
+        assert lookup_pass("dce") is DeadCodeEliminationPass
@@ -0,0 +1,129 @@
+from mlir.context import MLIRContext
+from mlir.dialects.arith import AddIOp, ConstantOp, MulIOp
+from mlir.dialects.cf import BranchOp, CondBranchOp
+from mlir.dialects.func import FuncOp, ReturnOp
+from mlir.ir.attributes import FloatAttribute, IntegerAttribute
+from mlir.ir.blocks import Block
+from mlir.ir.operations import Operation
+from mlir.ir.types import FloatType, FloatTypeKind, IntegerType
+from mlir.passes import lookup_pass
+from mlir.transforms import SCCPPass
+
+
+def constant(value: int, bitwidth: int = 32) -> ConstantOp:
+    return ConstantOp.build(IntegerAttribute(type=IntegerType(bitwidth), value=value))
+
+
+def run_sccp(operation: Operation) -> SCCPPass:
+    sccp = SCCPPass()
+    sccp.run_on_operation(operation, MLIRContext())
+    return sccp
+
+
+def returned(function: FuncOp) -> list:
+    block = function.body.end
+    return [operand.value for operand in block.terminator.operands]
+
+
+class TestSCCP:
+    def test_folds_straight_line_code(self):
+        function = FuncOp.build([IntegerType(32)])
+        x = function.arguments[0]
+        two, three = constant(2), constant(3)
+        add = AddIOp.build(two.results[0], three.results[0])
+        mul = MulIOp.build(add.results[0], x)
+        for op in [
+            two,
+            three,
+            add,
+            mul,
+            ReturnOp.build([add.results[0], mul.results[0]]),
+        ]:
+            function.entry_block.push_end(op)
+
+        sccp = run_sccp(function)
+        five, product = returned(function)
+        assert five.owner.attributes["value"].value == 5
+        assert product is mul.results[0]
+        assert mul.operands[0].value is five
+        assert add.parent is None
+        assert sccp.statistics["replaced-values"] == 1
+        assert sccp.statistics["erased-operations"] == 1
+
+    def test_prunes_branch_on_constant(self):
+        """entry -> cond_br true (then(1) | else(2)) -> exit(v) -> return v. The else
+        block is never taken, so v is the constant 1 and the diamond collapses."""
+        i32 = IntegerType(32)
+        function = FuncOp.build([i32])
+        entry = function.entry_block
+        then, else_, exit_ = Block(), Block(), Block([i32])
+        flag, one, two = constant(1, 1), constant(1), constant(2)
+        for op in [flag, one, two]:
+            entry.push_end(op)
+        entry.push_end(CondBranchOp.build(flag.results[0], then, [], else_, []))
+        then.push_end(BranchOp.build(exit_, one.results))
+        # The dead block would make v overdefined if it was joined.
+        else_.push_end(BranchOp.build(exit_, two.results))
+        exit_.push_end(ReturnOp.build([exit_.get_argument(0)]))
+        for block in [then, else_, exit_]:
+            function.body.push_end(block)
+
+        sccp = run_sccp(function)
+        assert function.body.blocks == [entry, then, exit_]
+        assert isinstance(entry.terminator, BranchOp)
+        assert entry.terminator.dest is then
+        assert returned(function)[0] is one.results[0]
+        assert sccp.statistics["simplified-branches"] == 1
+        assert sccp.statistics["erased-blocks"] == 1
+
+    def test_loop_with_invariant_value(self):
+        """x = 0; loop: x = x * 1 while c. The loop variable stays constant because the
+        back edge only ever carries 0."""
+        i32 = IntegerType(32)
+        function = FuncOp.build([IntegerType(1)])
+        c = function.arguments[0]
+        entry = function.entry_block
+        header, exit_ = Block([i32]), Block()
+        zero, one = constant(0), constant(1)
+        entry.push_end(zero)
+        entry.push_end(one)
+        entry.push_end(BranchOp.build(header, zero.results))
+        mul = MulIOp.build(header.get_argument(0), one.results[0])
+        header.push_end(mul)
+        header.push_end(CondBranchOp.build(c, header, mul.results, exit_, []))
+        exit_.push_end(ReturnOp.build([header.get_argument(0)]))
+        function.body.push_end(header)
+        function.body.push_end(exit_)
+
+        run_sccp(function)
+        assert returned(function)[0] is zero.results[0]
+        assert mul.parent is None
+        assert header.get_argument(0).use_empty
+        assert isinstance(header.terminator, CondBranchOp)
+
+    def test_signed_zeros_do_not_join(self):
+        """entry -> cond_br c (then(0.0) | else(-0.0)) -> exit(v) -> return v. Both edges
+        can be taken, and 0.0 and -0.0 are different constants, so v is not constant."""
+        f32 = FloatType(FloatTypeKind.F32)
+        function = FuncOp.build([IntegerType(1)])
+        entry = function.entry_block
+        then, else_, exit_ = Block(), Block(), Block([f32])
+        zero, negative_zero = [
+            ConstantOp.build(FloatAttribute(type=f32, value=value))
+            for value in (0.0, -0.0)
+        ]
+        entry.push_end(zero)
+        entry.push_end(negative_zero)
+        entry.push_end(CondBranchOp.build(function.arguments[0], then, [], else_, []))
+        then.push_end(BranchOp.build(exit_, zero.results))
+        else_.push_end(BranchOp.build(exit_, negative_zero.results))
+        exit_.push_end(ReturnOp.build([exit_.get_argument(0)]))
+        for block in [then, else_, exit_]:
+            function.body.push_end(block)
+
+        sccp = run_sccp(function)
+        assert returned(function)[0] is exit_.get_argument(0)
+        assert sccp.statistics["replaced-values"] == 0
+
+    def test_registered(self):
+        assert lookup_pass("sccp") is SCCPPass
@@ -0,0 +1,61 @@
+import pickle
+
+from mlir.ir.blocks import Block
+from mlir.ir.module import ModuleOperation
+from mlir.ir.operations import Operation, OpResult
+from mlir.ir.types import IntegerType
+from mlir.utils.pickling import dumps, loads
+
+
+class ChainOp(Operation):
+    __slots__ = ()
+
+    def create_results(self, operands, **kwargs) -> list[OpResult]:
+        return [OpResult(operands[0].type, self, 0)]
+
+
+def build_chain(number_of_blocks: int, ops_per_block: int) -> ModuleOperation:
+    module = ModuleOperation.build()
+    value = None
+    for _ in range(number_of_blocks):
+        block = Block([IntegerType(32)], [])
+        module.regions[0].push_end(block)
+        value = value or block.get_argument(0)
+        for _ in range(ops_per_block):
+            op = ChainOp([value], {})
+            block.push_end(op)
+            value = op.results[0]
+    return module
+
+
+class TestPickling:
+    def test_round_trip_rebuilds_links(self):
+        # long enough that pickling the links directly would hit the recursion limit
+        module = pickle.loads(pickle.dumps(build_chain(2000, 2)))
+        region = module.regions[0]
+        blocks = list(region)
+        assert region.size == 2000
+        assert all(block.owner is region for block in blocks)
+        assert blocks[1].prev_node is blocks[0]
+
+        ops = [op for block in blocks for op in block]
+        assert len(ops) == 4000
+        assert ops[1].prev_node is ops[0]
+        for prev_op, op in zip(ops, ops[1:]):
+            assert op.operands[0].value is prev_op.results[0]
+            assert prev_op.results[0].uses == [op.operands[0]]
+        assert ops[0].is_before_in_block(ops[1])
+
+    def test_detached_block(self):
+        ops = [ChainOp([Block([IntegerType(32)], []).get_argument(0)], {})]
+        block = pickle.loads(pickle.dumps(Block([], ops)))
+        assert block.number_of_operations == 1
+        assert block.front.parent is block
+
+    def test_external_objects_are_not_copied(self):
+        module = build_chain(2, 2)
+        region = module.regions[0]
+        copied = loads(dumps(region, external=[module]), external=[module])
+        assert copied is not region
+        assert copied.parent is module
+        assert copied.size == 2
@@ -0,0 +1,34 @@
+import pytest
+
+from mlir.utils.scoped_hash_table import ScopedHashTable
+
+
+class TestScopedHashTable:
+    def test_shadowing(self):
+        table = ScopedHashTable()
+        with table.scope():
+            table.insert("a", 1)
+            with table.scope():
+                assert table.lookup("a") == 1
+                table.insert("a", 2)
+                table.insert("b", 3)
+                table.insert("b", 4)
+                assert table.lookup("a") == 2
+                assert table.lookup("b") == 4
+            assert table.lookup("a") == 1
+            assert "b" not in table
+
+    def test_isolated_scope(self):
+        table = ScopedHashTable()
+        with table.scope():
+            table.insert("a", 1)
+            with table.scope(isolated=True):
+                assert table.lookup("a") is None
+                table.insert("a", 2)
+                with table.scope():
+                    assert table.lookup("a") == 2
+            assert table.lookup("a") == 1
+
+    def test_insert_requires_scope(self):
+        with pytest.raises(RuntimeError, match="without a scope"):
+            ScopedHashTable().insert("a", 1)
@@ -0,0 +1,40 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mlir.utils.storage_uniquer import StorageUniquer
+
+
+class TestStorageUniquer:
+    def test_get_or_create(self):
+        uniquer = StorageUniquer()
+        first = uniquer.get_or_create(("a", 1), lambda: ["a"])
+        assert uniquer.get_or_create(("a", 1), lambda: ["other"]) is first
+        assert uniquer.lookup(("a", 1)) is first
+        assert uniquer.lookup(("b", 1)) is None
+        assert ("a", 1) in uniquer and ("b", 1) not in uniquer
+        assert uniquer[("a", 1)] is first
+        assert len(uniquer) == 1
+        assert uniquer.values() == [first]
+
+    def test_number_of_shards_is_a_power_of_two(self):
+        assert StorageUniquer(1).number_of_shards == 1
+        assert StorageUniquer(5).number_of_shards == 8
+        assert StorageUniquer(32).number_of_shards == 32
+
+    def test_racing_creators_get_the_same_value(self):
+        """Both threads miss the lookup and create a value; only the first one stored is
+        returned to either."""
+        uniquer = StorageUniquer()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create():
+            barrier.wait()
+            return object()
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [
+                executor.submit(uniquer.get_or_create, "key", create) for _ in range(2)
+            ]
+            first, second = [future.result() for future in futures]
+        assert first is second is uniquer.lookup("key")
+        assert len(uniquer) == 1
@@ -1,6 +1,11 @@
 import pytest
 
-from mlir.utils.validator import ValidatorError, ValidatorMeta, validator
+from mlir.utils.validator import (
+    ValidatorError,
+    ValidatorMeta,
+    deferred_validation,
+    validator,
+)
 
 
 class TestValidator:
@@ -59,3 +64,29 @@ class TestValidator:
     def test_validator_is_successful(self):
         obj = self.MyClass(10, 0, 20)
         assert obj.x == 10
+
+    def test_deferred_validation_skips_validators(self):
+        with deferred_validation():
+            obj = self.MyClass(-5, 0, 10 + 1j)
+        assert obj.x == -5
+
+        # validation is restored on exiting the context
+        with pytest.raises(ValidatorError):
+            self.MyClass(-5, 0, 10)
+
+    def test_validators_are_collected_once(self):
+        class Base(metaclass=ValidatorMeta):
+            @validator
+            def check(self):
+                pass
+
+        class Left(Base):
+            pass
+
+        class Right(Base):
+            pass
+
+        class Both(Left, Right):
+            pass
+
+        assert Both._validators == (Base.check,)